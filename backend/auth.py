@@ -1,7 +1,8 @@
 """Authentication logic using JWT and bcrypt."""
 import os
 import sys
-sys.path.append("/home/qbao775/.local/lib/python3.8/site-packages")
+if "/home/qbao775/.local/lib/python3.8/site-packages" not in sys.path:
+    sys.path.append("/home/qbao775/.local/lib/python3.8/site-packages")
 
 from datetime import datetime, timedelta
 from typing import Optional
@@ -13,7 +13,8 @@ Classic example:
 We detect these first.
 """
 import sys
-sys.path.append("/home/qbao775/.local/lib/python3.8/site-packages")
+if "/home/qbao775/.local/lib/python3.8/site-packages" not in sys.path:
+    sys.path.append("/home/qbao775/.local/lib/python3.8/site-packages")
 
 import logging
 import requests
@@ -0,0 +1,133 @@
+"""
+Optional Redis second-level cache for market data.
+
+market_data keeps its in-process _TTLCache as the first level; this module
+lets the API server and the cron-run scripts share fetched quotes, histories
+and indicators through Redis so each Yahoo response is downloaded once per
+TTL across processes. Enabled only when REDIS_URL is set and the `redis`
+package is installed; every Redis error degrades to a cache miss so a Redis
+outage just means live fetches again.
+"""
+import json
+import logging
+import os
+from typing import Any, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import redis
+    _HAS_REDIS = True
+except ImportError:
+    _HAS_REDIS = False
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "mkt:"
+
+_client = None
+_disabled = False
+
+
+def _get_client():
+    global _client, _disabled
+    if _client is not None or _disabled:
+        return _client
+    url = os.environ.get("REDIS_URL", "")
+    if not url or not _HAS_REDIS:
+        _disabled = True
+        return None
+    try:
+        _client = redis.Redis.from_url(url, decode_responses=True, socket_timeout=0.5)
+        _client.ping()
+        logger.info(f"[Cache] Redis L2 cache enabled at {_redact_url(url)}")
+    except Exception as e:
+        logger.warning(f"[Cache] Redis unavailable ({e}) — using in-process cache only")
+        _client = None
+        _disabled = True
+    return _client
+
+
+def _redact_url(url: str) -> str:
+    """REDIS_URL without its credentials, for logging."""
+    parts = urlsplit(url)
+    if "@" not in parts.netloc:
+        return url
+    return parts._replace(netloc="***@" + parts.netloc.rsplit("@", 1)[1]).geturl()
+
+
+def _round_trips(value) -> bool:
+    """True when json.loads(json.dumps(value)) gives back the same types: str
+    keys, lists (not tuples) and plain str/int/float/bool/None leaves. Anything
+    else (datetimes, numpy scalars, Timestamps) would come back as another
+    type from an L2 hit, so it is not cached there."""
+    if isinstance(value, dict):
+        return all(type(k) is str and _round_trips(v) for k, v in value.items())
+    if type(value) is list:
+        return all(_round_trips(v) for v in value)
+    return type(value) in (str, int, float, bool, type(None))
+
+
+def make_key(key: tuple) -> str:
+    """("quote", "AAPL") -> "mkt:quote:AAPL"."""
+    return KEY_PREFIX + ":".join(str(part) for part in key)
+
+
+def cache_get(key: tuple) -> Tuple[Optional[Any], int]:
+    """Return (value, remaining_ttl_seconds); (None, 0) on miss or any Redis error."""
+    client = _get_client()
+    if client is None:
+        return None, 0
+    try:
+        pipe = client.pipeline()
+        pipe.get(make_key(key))
+        pipe.ttl(make_key(key))
+        raw, ttl = pipe.execute()
+        if raw is None:
+            return None, 0
+        return json.loads(raw), max(int(ttl), 1)
+    except (redis.RedisError, ValueError) as e:
+        logger.debug(f"[Cache] GET {key} failed: {e}")
+        return None, 0
+
+
+def cache_set(key: tuple, value: Any, ttl: int) -> None:
+    client = _get_client()
+    if client is None:
+        return
+    if not _round_trips(value):
+        logger.debug(f"[Cache] SET {key} skipped: value does not round-trip through JSON")
+        return
+    try:
+        client.set(make_key(key), json.dumps(value), ex=int(ttl))
+    except (redis.RedisError, TypeError, ValueError) as e:
+        logger.debug(f"[Cache] SET {key} failed: {e}")
+
+
+def _glob_escape(part: str) -> str:
+    """Escape Redis MATCH metacharacters so a key part only matches itself."""
+    return "".join("\\" + c if c in "*?[]\\" else c for c in part)
+
+
+def invalidate(kind: str, symbol: Optional[str] = None) -> None:
+    """
+    Drop cached `kind` entries ("newsintel", "quote", ...) for one symbol, or
+    for every symbol when `symbol` is None. Only keys whose segments match
+    exactly are removed: "GOOG" leaves "GOOGL" alone, and other kinds cached
+    for the same symbol are kept.
+    """
+    client = _get_client()
+    if client is None:
+        return
+    if symbol is None:
+        exact, pattern = None, f"{KEY_PREFIX}{_glob_escape(kind)}:*"
+    else:
+        exact = make_key((kind, symbol))
+        pattern = _glob_escape(exact) + ":*"
+    try:
+        keys = list(client.scan_iter(match=pattern, count=1000))
+        if exact is not None:
+            keys.append(exact)
+        if keys:
+            client.delete(*keys)
+    except redis.RedisError as e:
+        logger.debug(f"[Cache] invalidate {kind}:{symbol} failed: {e}")
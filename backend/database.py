@@ -1,5 +1,5 @@
 """Database models and setup using SQLAlchemy + SQLite."""
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, UniqueConstraint
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.pool import NullPool
 try:
     from sqlalchemy.orm import declarative_base, relationship
@@ -8,6 +8,7 @@ except ImportError:
     from sqlalchemy.orm import relationship
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
+import time
 
 # Absolute path anchored to this file's dir so the DB resolves identically no
 # matter the cwd — cron-run scripts were hitting an empty './trading_platform.db'
@@ -63,6 +64,8 @@ class Trade(Base):
     timestamp = Column(DateTime, default=datetime.utcnow)
 
     user = relationship("User", back_populates="trades")
+    # Trade history / daily digest: WHERE user_id = ? ORDER BY timestamp DESC
+    __table_args__ = (Index("ix_trade_user_ts", "user_id", timestamp.desc()),)
 
 
 class Position(Base):
@@ -96,6 +99,7 @@ class AISignal(Base):
     reasoning = Column(Text)
     model_used = Column(String, default="deepseek-reasoner")
     timestamp = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = (Index("ix_aisignal_user_ts", "user_id", timestamp.desc()),)
 
 
 class PendingTrade(Base):
@@ -241,6 +245,10 @@ def _migrate_add_columns():
         # scenario_states: user-driven mute (skipped by lifecycle + reports)
         _add_col_if_missing("scenario_states", "muted_by_user", "INTEGER DEFAULT 0")
 
+        # create_all() skips indexes on tables that already exist
+        cur.execute("CREATE INDEX IF NOT EXISTS ix_trade_user_ts ON trades (user_id, timestamp DESC)")
+        cur.execute("CREATE INDEX IF NOT EXISTS ix_aisignal_user_ts ON ai_signals (user_id, timestamp DESC)")
+
         conn.commit()
         conn.close()
     except Exception as e:
@@ -256,9 +264,40 @@ def get_db():
         db.close()
 
 
+# (user_id, key) -> (value or None, expires_at). Settings are read on every
+# loop iteration by every background task but change only via set_setting.
+_settings_cache: dict = {}
+SETTINGS_CACHE_TTL = 30.0  # seconds
+
+
+def invalidate_settings_cache(user_id=None):
+    """Drop cached settings for one user (or everyone) after out-of-band writes."""
+    if user_id is None:
+        _settings_cache.clear()
+    else:
+        for k in [k for k in _settings_cache if k[0] == user_id]:
+            _settings_cache.pop(k, None)
+
+
 def get_setting(db, key: str, user_id: int, default=None):
-    s = db.query(Settings).filter(Settings.user_id == user_id, Settings.key == key).first()
-    return s.value if s else default
+    now = time.monotonic()
+    cached = _settings_cache.get((user_id, key))
+    if cached is not None and cached[1] > now:
+        value = cached[0]
+    else:
+        s = db.query(Settings).filter(Settings.user_id == user_id, Settings.key == key).first()
+        value = s.value if s else None
+        _settings_cache[(user_id, key)] = (value, now + SETTINGS_CACHE_TTL)
+    return value if value is not None else default
+
+
+def get_settings_bulk(db, keys: list, user_id: int) -> dict:
+    """Fetch several settings for one user in a single query -> {key: value}.
+    Keys with no row are simply absent; callers apply their own defaults."""
+    rows = db.query(Settings.key, Settings.value).filter(
+        Settings.user_id == user_id, Settings.key.in_(keys)
+    ).all()
+    return dict(rows)
 
 
 def set_setting(db, key: str, value: str, user_id: int):
@@ -269,3 +308,4 @@ def set_setting(db, key: str, value: str, user_id: int):
         s = Settings(user_id=user_id, key=key, value=value)
         db.add(s)
     db.commit()
+    _settings_cache.pop((user_id, key), None)
@@ -267,7 +267,7 @@ def _load_current_watchlist(db) -> list[str]:
 
 
 def _persist_watchlist(db, syms: list[str]) -> None:
-    from database import Settings
+    from database import Settings, invalidate_settings_cache
     r = db.query(Settings).filter(Settings.key=="watchlist").first()
     deduped = list(dict.fromkeys(syms))  # preserve order, drop dupes
     if r:
@@ -275,6 +275,7 @@ def _persist_watchlist(db, syms: list[str]) -> None:
     else:
         db.add(Settings(user_id=1, key="watchlist", value=json.dumps(deduped)))
     db.commit()
+    invalidate_settings_cache()  # the row updated above may belong to any user
 
 
 # ── Discovery sources ───────────────────────────────────────────────────────
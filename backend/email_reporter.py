@@ -912,7 +912,7 @@ Only include fields that actually need to change. Return valid JSON only."""
         changes_applied = {}
 
         # Apply changes to DB settings
-        from database import Settings
+        from database import Settings, invalidate_settings_cache
         user_id = 1  # default user
 
         simple_keys = ["auto_trade_enabled", "auto_trade_min_confidence", "risk_per_trade_pct"]
@@ -948,6 +948,7 @@ Only include fields that actually need to change. Return valid JSON only."""
                 db.add(Settings(user_id=user_id, key="watchlist", value=json2.dumps(current_wl)))
 
         db.commit()
+        invalidate_settings_cache(user_id)
 
         changes_applied["reply_message"] = changes.get("reply_message", "Changes applied.")
         logger.info(f"[Email] Applied user instruction changes: {changes_applied}")
@@ -4,7 +4,8 @@ Collects upcoming earnings, Fed meetings, economic releases and builds
 context for AI to position BEFORE events are announced.
 """
 import sys
-sys.path.append("/home/qbao775/.local/lib/python3.8/site-packages")
+if "/home/qbao775/.local/lib/python3.8/site-packages" not in sys.path:
+    sys.path.append("/home/qbao775/.local/lib/python3.8/site-packages")
 
 import logging
 from datetime import datetime, timedelta
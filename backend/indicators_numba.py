@@ -0,0 +1,108 @@
+"""
+Numba kernel for the daily technical-indicator snapshot.
+
+One compiled pass over the OHLCV arrays returns every scalar that
+market_data.get_technical_indicators reports. Importing this module raises
+ImportError when numba is not installed; market_data then keeps its NumPy
+implementation, which produces the same numbers.
+"""
+import numpy as np
+from numba import njit
+
+
+# error_model="numpy": x/0 → inf/nan like the NumPy path instead of raising
+@njit(cache=True, error_model="numpy")
+def compute_indicator_scalars(high, low, close, volume):
+    """
+    Returns (atr14, ma20, ma50, ma200, rsi, macd, macd_signal, bb_std, avg_volume20).
+    ma50 / ma200 are NaN when there are fewer than 50 / 200 bars. Callers
+    guarantee at least 20 bars.
+    """
+    n = close.shape[0]
+
+    # ATR(14): simple mean of the last 14 true ranges (first bar: high - low)
+    if n >= 14:
+        total = 0.0
+        for i in range(n - 14, n):
+            tr = high[i] - low[i]
+            if i > 0:
+                hc = abs(high[i] - close[i - 1])
+                lc = abs(low[i] - close[i - 1])
+                if hc > tr:
+                    tr = hc
+                if lc > tr:
+                    tr = lc
+            total += tr
+        atr14 = total / 14.0
+    else:
+        atr14 = high[n - 1] - low[n - 1]
+
+    # Moving averages from trailing sums
+    s20 = 0.0
+    for i in range(n - 20, n):
+        s20 += close[i]
+    ma20 = s20 / 20.0
+    ma50 = np.nan
+    if n >= 50:
+        s = 0.0
+        for i in range(n - 50, n):
+            s += close[i]
+        ma50 = s / 50.0
+    ma200 = np.nan
+    if n >= 200:
+        s = 0.0
+        for i in range(n - 200, n):
+            s += close[i]
+        ma200 = s / 200.0
+
+    # RSI: simple 14-day mean of gains / losses
+    gain = 0.0
+    loss = 0.0
+    for i in range(n - 14, n):
+        d = close[i] - close[i - 1]
+        if d > 0:
+            gain += d
+        else:
+            loss -= d
+    rsi = 100.0 - 100.0 / (1.0 + (gain / 14.0) / (loss / 14.0))
+
+    # MACD: adjusted EWMs (pandas ewm(span).mean() semantics) in one pass
+    d12 = 1.0 - 2.0 / 13.0
+    d26 = 1.0 - 2.0 / 27.0
+    d9 = 1.0 - 2.0 / 10.0
+    n12 = w12 = n26 = w26 = n9 = w9 = 0.0
+    macd = 0.0
+    signal = 0.0
+    for i in range(n):
+        n12 = close[i] + d12 * n12
+        w12 = 1.0 + d12 * w12
+        n26 = close[i] + d26 * n26
+        w26 = 1.0 + d26 * w26
+        macd = n12 / w12 - n26 / w26
+        n9 = macd + d9 * n9
+        w9 = 1.0 + d9 * w9
+        signal = n9 / w9
+
+    # Bollinger std (ddof=1) over the last 20 closes, Welford
+    mean = 0.0
+    m2 = 0.0
+    k = 0
+    for i in range(n - 20, n):
+        k += 1
+        delta = close[i] - mean
+        mean += delta / k
+        m2 += delta * (close[i] - mean)
+    bb_std = np.sqrt(m2 / 19.0)
+
+    v20 = 0.0
+    for i in range(n - 20, n):
+        v20 += volume[i]
+
+    return atr14, ma20, ma50, ma200, rsi, macd, signal, bb_std, v20 / 20.0
+
+
+# Compile at import (and populate the on-disk cache) so the first real
+# request doesn't pay the JIT latency.
+_warm = np.linspace(1.0, 2.0, 30)
+compute_indicator_scalars(_warm + 0.1, _warm - 0.1, _warm, _warm)
+del _warm
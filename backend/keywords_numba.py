@@ -0,0 +1,50 @@
+"""
+Numba kernel for matching a keyword list against a large batch of headlines.
+
+Titles and keywords are packed into flat UTF-8 byte buffers with offset
+arrays, and one compiled pass fills a (title, keyword) hit matrix. A byte
+match of valid UTF-8 is a character match, so the result is the same as
+`kw in title`. Importing this module raises ImportError when numba is not
+installed; news_intelligence then keeps its str.find batch matcher.
+"""
+import numpy as np
+from numba import njit
+
+
+def pack_utf8(strings) -> tuple:
+    """(uint8 buffer, int64 offsets) for the UTF-8 encodings of `strings`;
+    string i occupies buf[offsets[i]:offsets[i + 1]]."""
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+@njit(cache=True)
+def scan_titles(buf, offsets, kw_buf, kw_offsets):
+    """
+    hits[i, j] == 1 when keyword j occurs in title i. Scans each title for
+    the keyword's first byte and only compares the rest on a candidate.
+    """
+    n = offsets.shape[0] - 1
+    k = kw_offsets.shape[0] - 1
+    hits = np.zeros((n, k), dtype=np.uint8)
+    for i in range(n):
+        start = offsets[i]
+        end = offsets[i + 1]
+        for j in range(k):
+            ks = kw_offsets[j]
+            kl = kw_offsets[j + 1] - ks
+            if kl == 0 or kl > end - start:
+                continue
+            first = kw_buf[ks]
+            for p in range(start, end - kl + 1):
+                if buf[p] != first:
+                    continue
+                m = 1
+                while m < kl and buf[p + m] == kw_buf[ks + m]:
+                    m += 1
+                if m == kl:
+                    hits[i, j] = 1
+                    break
+    return hits
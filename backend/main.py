@@ -4,21 +4,41 @@ FastAPI main application - REST API + WebSocket server for global stp.
 from __future__ import annotations
 from typing import List, Optional, Dict
 import asyncio
+import atexit
 import json
 import logging
 import os
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from functools import partial
+from itertools import groupby
 from datetime import datetime, timedelta
-import sys
-sys.path.append("/home/qbao775/.local/lib/python3.8/site-packages")
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Depends, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        # Still a str: the dashboard parses text frames (JSON.parse(event.data))
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    _loads = orjson.loads
+    # Serializes numpy scalars/arrays natively and emits NaN as null
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+    from fastapi.responses import JSONResponse as _DefaultResponse
+
 import market_data as md
 import deepseek_ai as ai
 import event_monitor as em
@@ -37,21 +57,58 @@ import scenario_tracker as st
 import hk_ipo_scanner as hk_ipo
 import tax_reporter as tax
 from trading_engine import TradingEngine
-from database import create_tables, get_db, get_setting, set_setting, Trade, AISignal, WatchedStock, Settings, User, PendingTrade, SignalArchive
+from database import create_tables, get_db, get_setting, get_settings_bulk, set_setting, invalidate_settings_cache, Trade, AISignal, WatchedStock, Settings, User, PendingTrade, SignalArchive
 from auth import get_current_user, create_access_token, get_password_hash, verify_password
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Active WebSocket connections
-active_connections: List[WebSocket] = []
+# Active WebSocket connections -> each client's outbound message queue
+active_connections: Dict[WebSocket, asyncio.Queue] = {}
 # Cache for latest prices (symbol -> price)
 price_cache: Dict = {}
+# Pre-serialized price_update message sent to each newly connected client;
+# rebuilt by _refresh_price_snapshot() whenever price_cache changes.
+_price_snapshot_msg: Optional[str] = None
+# Default watchlist, serialized once: the fallback for every "watchlist" setting read
+_DEFAULT_WATCHLIST_JSON = json.dumps(md.DEFAULT_WATCHLIST)
+_DEFAULT_WATCHLIST_TUPLE = tuple(md.DEFAULT_WATCHLIST)
 # Cache for market indices
 market_cache: Dict = {}
 last_market_fetch = None
+# Per-client outbound queue depth (drop-oldest when full)
+CLIENT_QUEUE_SIZE = 64
+BROADCAST_SEND_TIMEOUT = 2.0  # seconds; a client slower than this is dropped
 # Geo scan cooldown: symbol -> YYYY-MM-DD of last successful geo-triggered trade
 _geo_traded_today: Dict = {}
+# Max concurrent AI re-analyses for alert-triggered scans (blog/event). Each
+# call is a 30-60s Ollama request; 3 keeps the local model from thrashing.
+URGENT_REANALYSIS_CONCURRENCY = 3
+# Max concurrent breaking-news symbol scans (market data fetch + AI call each)
+NEWS_SCAN_CONCURRENCY = 8
+# The auto-trade loop spends 1s+ and an LLM call per symbol, so its signals are
+# flushed every few symbols rather than once at the end of a long cycle.
+SIGNAL_FLUSH_BATCH = 5
+# Dedicated pool for blocking market-data / HTTP fetches, so they are not
+# queued behind 30-60s LLM calls on the default executor.
+IO_POOL = ThreadPoolExecutor(max_workers=64, thread_name_prefix="mdio")
+atexit.register(IO_POOL.shutdown, wait=False)
+# StockTwits sentiment scans keyed by sorted watchlist -> (alerts, expires_at).
+# Both digest windows and the social scan hit the same symbols within minutes.
+_sentiment_cache: Dict = {}
+SENTIMENT_CACHE_TTL = 300  # seconds
+
+
+def _scan_sentiment_cached(watchlist) -> dict:
+    """ss.scan_sentiment_alerts with a 5-minute memo per distinct watchlist."""
+    key = tuple(sorted(watchlist))
+    now = time.monotonic()
+    cached = _sentiment_cache.get(key)
+    if cached and cached[1] > now:
+        return cached[0]
+    alerts = ss.scan_sentiment_alerts(list(key))
+    _sentiment_cache[key] = (alerts, now + SENTIMENT_CACHE_TTL)
+    return alerts
 
 
 def _is_stop_loss_cooldown(symbol: str, user_id: int, db) -> bool:
@@ -71,6 +128,22 @@ def _is_stop_loss_cooldown(symbol: str, user_id: int, db) -> bool:
     return recent is not None
 
 
+def _persist_signals(db, signals: list, tag: str) -> None:
+    """Write pending AISignal rows in one commit instead of one per symbol, then
+    empty `signals` so the caller can keep appending to it. A failed flush is
+    logged and rolled back so it never aborts the scan loop."""
+    if not signals:
+        return
+    try:
+        db.bulk_save_objects(signals)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"{tag} Failed to persist {len(signals)} AI signals: {e}")
+    finally:
+        signals.clear()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
@@ -108,7 +181,8 @@ async def lifespan(app: FastAPI):
     task19 = asyncio.create_task(background_llm_shootout_loop())
     task20 = asyncio.create_task(background_llm_catalyst_loop())
     task21 = asyncio.create_task(background_dynamic_watchlist_loop())
-    logger.info("Background tasks started: price_refresh + auto_trade_loop + event_scan + news_scan + social_sentiment + blog_monitor + kronos_gpu + daily_digest + pending_trade_executor + email_reporter + email_reply_checker + stop_loss_monitor + global_market_scan + dca_core_etf + one_shot_rebalance + hk_ipo_scan + deposit_handler + annual_tax_report + rl_policy_trainer + llm_shootout + llm_catalyst + dynamic_watchlist")
+    task22 = asyncio.create_task(background_market_warmer())
+    logger.info("Background tasks started: price_refresh + market_warmer + auto_trade_loop + event_scan + news_scan + social_sentiment + blog_monitor + kronos_gpu + daily_digest + pending_trade_executor + email_reporter + email_reply_checker + stop_loss_monitor + global_market_scan + dca_core_etf + one_shot_rebalance + hk_ipo_scan + deposit_handler + annual_tax_report + rl_policy_trainer + llm_shootout + llm_catalyst + dynamic_watchlist")
     yield
     task1.cancel()
     task2.cancel()
@@ -131,6 +205,7 @@ async def lifespan(app: FastAPI):
     task19.cancel()
     task20.cancel()
     task21.cancel()
+    task22.cancel()
     logger.info("Shutting down trading platform")
 
 
@@ -138,7 +213,8 @@ app = FastAPI(
     title="Global stp",
     description="AI-powered stock market tracker and automated trading platform using DeepSeek-R1",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=_DefaultResponse,
 )
 
 app.add_middleware(
@@ -218,6 +294,33 @@ class LayoffDiscoveryRequest(BaseModel):
     hours_back: int = 168
     max_items: int = 50
     
+PositionRow = namedtuple(
+    "PositionRow", "symbol quantity avg_cost current_price unrealized_pnl market_value"
+)
+
+
+def _position_row(p: dict) -> PositionRow:
+    """Unpack a get_portfolio_summary() position dict once, applying the same
+    defaults the prompt formatter always used."""
+    qty = float(p.get("quantity", 0) or 0)
+    cur = p.get("current_price", 0)
+    return PositionRow(
+        p.get("symbol", "?"), qty, p.get("avg_cost", cur), cur,
+        p.get("unrealized_pnl", 0) or 0, p.get("market_value", qty * cur),
+    )
+
+
+def _format_holding_line(p: PositionRow) -> str:
+    """One '### Current Holdings' row."""
+    entry, cur = p.avg_cost, p.current_price
+    inv_entry = 100.0 / entry if entry else 0.0
+    return (
+        f"- {p.symbol}: {p.quantity:.4f} shares | Entry ${entry:.2f} → Now ${cur:.2f} "
+        f"({(cur - entry) * inv_entry:+.1f}%) | P&L ${p.unrealized_pnl:+.2f} "
+        f"| Value ${p.market_value:.2f}"
+    )
+
+
 def build_rich_portfolio_context(db, user_id: int, engine) -> str:
     """
     Build a comprehensive portfolio context string for the AI, including:
@@ -247,22 +350,12 @@ def build_rich_portfolio_context(db, user_id: int, engine) -> str:
     # SIMULATE trades or fully-closed positions) confuse the AI: it reads the
     # avg_cost as "currently holding at that price". Saw 0700.HK qty=0
     # avg=$462.20 listed → AI said "portfolio already holds this stock at $462.20".
-    raw_positions = summary.get("positions", [])
-    positions = [p for p in raw_positions if abs(float(p.get("quantity", 0) or 0)) > 0.001]
+    positions = [row for row in map(_position_row, summary.get("positions", []))
+                 if abs(row.quantity) > 0.001]
     if positions:
         lines.append("\n### Current Holdings")
-        for p in sorted(positions, key=lambda x: abs(x.get("market_value", 0)), reverse=True):
-            sym = p.get("symbol", "?")
-            qty = p.get("quantity", 0)
-            entry = p.get("avg_cost", p.get("current_price", 0))
-            cur = p.get("current_price", 0)
-            pnl = p.get("unrealized_pnl", 0) or 0
-            pnl_pct = ((cur - entry) / entry * 100) if entry else 0
-            mv = p.get("market_value", qty * cur)
-            lines.append(
-                f"- {sym}: {qty:.4f} shares | Entry ${entry:.2f} → Now ${cur:.2f} "
-                f"({pnl_pct:+.1f}%) | P&L ${pnl:+.2f} | Value ${mv:.2f}"
-            )
+        positions.sort(key=lambda r: abs(r.market_value), reverse=True)
+        lines.extend(map(_format_holding_line, positions))
     else:
         lines.append("\n### Current Holdings: None (100% cash)")
 
@@ -359,6 +452,24 @@ def _next_trading_day_utc(now: datetime) -> datetime:
     return datetime.combine(next_day, datetime.min.time())
 
 
+# Daily digest send times (UTC): pre-market 14:20, post-market 21:05
+DIGEST_FIRE_TIMES = (((14, 20), "pre_market"), ((21, 5), "post_market"))
+
+
+def _next_digest_fire(now: datetime, after: Optional[datetime] = None) -> tuple:
+    """Return (fire_datetime, fire_type) for the first digest window strictly
+    after `now`, or after `after` (the window just fired) when that is later."""
+    if after is not None and after > now:
+        now = after
+    midnight = datetime.combine(now.date(), datetime.min.time())
+    return min(
+        (midnight + timedelta(days=d, hours=hour, minutes=minute), fire_type)
+        for d in (0, 1)
+        for (hour, minute), fire_type in DIGEST_FIRE_TIMES
+        if midnight + timedelta(days=d, hours=hour, minutes=minute) > now
+    )
+
+
 def _within_market_open_window(now: datetime) -> bool:
     """Return True if US or China A-share market is open (UTC times, Mon-Fri only)."""
     if now.weekday() >= 5:  # Saturday / Sunday
@@ -501,12 +612,12 @@ def get_rl_lessons() -> str:
 
 async def background_price_refresh():
     """Continuously refresh prices and broadcast to WebSocket clients."""
-    global price_cache, market_cache, last_market_fetch
+    global price_cache
     while True:
         try:
             db = next(get_db())
             # Get all unique symbols from all users' watchlists and positions
-            symbols_to_track = set(md.DEFAULT_WATCHLIST)
+            symbols_to_track = set(_DEFAULT_WATCHLIST_TUPLE)
             users = db.query(User).all()
             for user in users:
                 watchlist_json = get_setting(db, "watchlist", user.id, "[]")
@@ -551,24 +662,24 @@ async def background_price_refresh():
             except Exception as _pe:
                 logger.warning(f"[PriceRefresh] prioritization failed, using raw order: {_pe}")
 
-            # Fetch prices in executor (non-blocking yfinance calls) - staggered to avoid rate limits
+            # Fetch prices in executor (non-blocking yfinance calls) — one batched
+            # yf.download for the whole capped universe instead of one HTTP
+            # round-trip (plus 0.5s stagger) per symbol.
             loop = asyncio.get_event_loop()
             new_prices = {}
-            # Cap covers the full chip universe + held + core ETFs. get_stock_quote
-            # is itself 5-min cached, so the light 0.5s stagger is enough to stay
-            # under Yahoo's rate limit on the .history endpoint.
             PRICE_FETCH_CAP = 250   # was 20 — covers the full ~206 watchlist with headroom (nothing silently dropped)
-            fetched = 0
-            for sym in all_symbols[:PRICE_FETCH_CAP]:
-                try:
-                    q = await loop.run_in_executor(None, md.get_stock_quote, sym)
-                    if q:
-                        new_prices[sym] = q["current"]
-                        price_cache[sym] = q
-                        fetched += 1
-                except Exception as e:
-                    logger.error(f"Error fetching {sym}: {e}")
-                await asyncio.sleep(0.5)  # light stagger; quote is 5-min cached
+            try:
+                quotes = await loop.run_in_executor(
+                    None, md.get_stock_quotes_batch, all_symbols[:PRICE_FETCH_CAP]
+                )
+            except Exception as e:
+                logger.error(f"[PriceRefresh] batch quote fetch failed: {e}")
+                quotes = {}
+            for sym, q in quotes.items():
+                new_prices[sym] = q["current"]
+                price_cache[sym] = q
+            fetched = len(new_prices)
+            _refresh_price_snapshot()
             logger.info(f"[PriceRefresh] cached {fetched}/{min(len(all_symbols), PRICE_FETCH_CAP)} symbols "
                         f"(watchlist total {len(all_symbols)})")
 
@@ -578,21 +689,13 @@ async def background_price_refresh():
                     engine = TradingEngine(db, user.id)
                     engine.update_position_prices(new_prices)
 
-            # Refresh market indices every 5 minutes
-            now = datetime.utcnow()
-            if last_market_fetch is None or (now - last_market_fetch).seconds > 300:
-                try:
-                    market_cache = md.get_all_indices()
-                    last_market_fetch = now
-                except Exception as e:
-                    logger.error(f"Market fetch error: {e}")
-
-            # Broadcast to all WebSocket clients
-            await broadcast({
-                "type": "price_update",
-                "prices": new_prices,
-                "timestamp": datetime.utcnow().isoformat()
-            })
+            # Broadcast to all WebSocket clients (nothing to build if nobody is listening)
+            if active_connections:
+                await broadcast({
+                    "type": "price_update",
+                    "prices": new_prices,
+                    "timestamp": datetime.utcnow().isoformat()
+                })
 
         except Exception as e:
             logger.error(f"Background refresh error: {e}")
@@ -608,6 +711,24 @@ async def background_price_refresh():
         await asyncio.sleep(300)  # Refresh every 5 min (cache handles inter-loop dedup)
 
 
+MARKET_WARM_INTERVAL = 30  # seconds
+
+
+async def background_market_warmer():
+    """Keep market_cache (global indices) warm so /api/markets never waits on
+    Yahoo. get_all_indices also writes each index through the market-data
+    cache, which publishes it to Redis when configured."""
+    global market_cache, last_market_fetch
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            market_cache = await loop.run_in_executor(IO_POOL, md.get_all_indices)
+            last_market_fetch = datetime.utcnow()
+        except Exception as e:
+            logger.error(f"Market fetch error: {e}")
+        await asyncio.sleep(MARKET_WARM_INTERVAL)
+
+
 def build_tradeable_watchlist(db, user_id):
     """Single source of truth for the tradeable watchlist used by ALL trading
     loops (auto_trade + blog/event/news catalyst scans). In serenity mode it is
@@ -627,7 +748,7 @@ def build_tradeable_watchlist(db, user_id):
                 held + _sl.recommended_tickers(top_n=15) + _sl.nvda_downstream_extras()))
     except Exception as _e:
         logger.warning(f"[Watchlist] serenity build failed, fallback to setting: {_e}")
-    return json.loads(get_setting(db, "watchlist", user_id, json.dumps(md.DEFAULT_WATCHLIST)))
+    return json.loads(get_setting(db, "watchlist", user_id, _DEFAULT_WATCHLIST_JSON))
 
 
 async def background_auto_trade_loop():
@@ -638,12 +759,27 @@ async def background_auto_trade_loop():
             loop = asyncio.get_event_loop()
             db = next(get_db())
             users = db.query(User).all()
+            enabled_users = [u for u in users
+                             if get_setting(db, "auto_trade_enabled", u.id, "false") == "true"]
 
-            for user in users:
-                auto_trade_enabled = get_setting(db, "auto_trade_enabled", user.id, "false") == "true"
-                if not auto_trade_enabled:
-                    continue
+            if enabled_users:
+                # Watchlist-independent scans: run once per cycle, not once per user,
+                # and not at all when nobody is auto-trading.
+                active_macros = await loop.run_in_executor(None, lambda: ni.detect_active_macro_scenarios(hours_back=6, db=db))
+                macro_context = ni.build_macro_scenario_context(active_macros)
+                blog_alerts = await loop.run_in_executor(None, lambda: bm.scan_all_blogs(hours_back=12))
+
+                # ── Build global market context once per cycle (5-min TTL cached) ──
+                try:
+                    global_ctx = await loop.run_in_executor(None, gc.build_global_context)
+                    logger.info(f"[AutoTrade] Global context: {gc.get_global_context_summary(global_ctx)}")
+                except Exception as _gce:
+                    logger.warning(f"[AutoTrade] Global context build failed: {_gce}")
+                    global_ctx = None
+            else:
+                logger.info("[AutoTrade] No user has auto-trade enabled — skipping cycle scans")
 
+            for user in enabled_users:
                 logger.info(f"Starting auto-trade cycle for user: {user.username}")
                 api_key = get_setting(db, "deepseek_api_key", user.id, "")
                 ai_provider = get_setting(db, "ai_provider", user.id, "ollama")
@@ -663,7 +799,8 @@ async def background_auto_trade_loop():
                         ipo_list = json.loads(ipo_json)
                         ipo_syms = [r["symbol"] for r in ipo_list if r.get("symbol")]
                         if ipo_syms:
-                            non_ipo = [s for s in watchlist if s not in ipo_syms]
+                            ipo_set = set(ipo_syms)
+                            non_ipo = [s for s in watchlist if s not in ipo_set]
                             watchlist = ipo_syms + non_ipo
                             logger.warning(
                                 f"[AutoTrade] ⚠️  HK_IPO_PRIORITY: front-loaded "
@@ -718,12 +855,14 @@ async def background_auto_trade_loop():
                     import dynamic_watchlist as _dw
                     thematic_pri = [s for t in _dw.THEMATIC_UNIVERSES.values() for s in t]
 
-                    front = []
+                    wl_set = set(watchlist)
+                    front, front_set = [], set()
                     for grp in (priority_syms, list(held_syms), movers, thematic_pri):
                         for s in grp:
-                            if s in watchlist and s not in front:
+                            if s in wl_set and s not in front_set:
                                 front.append(s)
-                    rest = [s for s in watchlist if s not in front]
+                                front_set.add(s)
+                    rest = [s for s in watchlist if s not in front_set]
                     watchlist = front + rest
                     logger.info(f"[AutoTrade] scan priority: {len(priority_syms)} pinned ({priority_syms}) + "
                                 f"{len(held_syms)} held + {len(movers)} movers (top: {movers[:3]}) + thematic")
@@ -753,19 +892,9 @@ async def background_auto_trade_loop():
                 # Run all slow blocking I/O in executor so event loop stays free for HTTP requests
                 event_context = await loop.run_in_executor(None, lambda: em.build_event_context(watchlist, days_ahead=7))
                 threat_map = await loop.run_in_executor(None, lambda: ni.scan_all_threats(watchlist, hours_back=24))
-                active_macros = await loop.run_in_executor(None, lambda: ni.detect_active_macro_scenarios(hours_back=6, db=db))
-                macro_context = ni.build_macro_scenario_context(active_macros)
-                blog_alerts = await loop.run_in_executor(None, lambda: bm.scan_all_blogs(hours_back=12))
-
-                # ── Build global market context once per cycle (5-min TTL cached) ──
-                try:
-                    global_ctx = await loop.run_in_executor(None, gc.build_global_context)
-                    logger.info(f"[AutoTrade] Global context: {gc.get_global_context_summary(global_ctx)}")
-                except Exception as _gce:
-                    logger.warning(f"[AutoTrade] Global context build failed: {_gce}")
-                    global_ctx = None
 
                 rl_lessons = get_rl_lessons()
+                signals_to_insert = []
                 for symbol in watchlist:
                     try:
                         await asyncio.sleep(1)  # yield to event loop between symbols
@@ -778,13 +907,18 @@ async def background_auto_trade_loop():
                             loop.run_in_executor(None, md.get_stock_news, symbol),
                         )
 
-                        # Kronos K-line forecast (A100 GPU) — already in executor
-                        kronos_pred = await loop.run_in_executor(None, ka.predict_next_candles, symbol, history)
+                        # Independent per-symbol intelligence layers, fetched concurrently:
+                        # Kronos K-line forecast (A100 GPU), COT futures positioning
+                        # (週報 CFTC data, free, no API key), social sentiment
+                        # (StockTwits/Reddit HTTP) and positive catalysts (news fetch).
+                        kronos_pred, cot_context, sentiment_context, catalysts = await asyncio.gather(
+                            loop.run_in_executor(None, ka.predict_next_candles, symbol, history),
+                            loop.run_in_executor(None, cot.build_cot_context, symbol),
+                            loop.run_in_executor(None, ss.build_sentiment_context, symbol),
+                            loop.run_in_executor(None, ni.detect_catalysts_for_symbol, symbol, 6),
+                        )
                         kronos_context = ka.build_kronos_context(kronos_pred)
 
-                        # COT futures positioning (週報 CFTC data, free, no API key)
-                        cot_context = await loop.run_in_executor(None, cot.build_cot_context, symbol)
-
                         # Kelly Criterion pre-sizing (uses last signal's target/stop if available)
                         # Pull target & stop from the most recent signal for this symbol
                         kelly_context = ""
@@ -814,13 +948,9 @@ async def background_auto_trade_loop():
                         # Merge all intelligence layers
                         threats = threat_map.get(symbol, [])
                         threat_context = ni.build_threat_context(symbol, threats)
-                        sentiment_context = ss.build_sentiment_context(symbol)
                         blog_context = bm.build_blog_alert_context(blog_alerts, target_symbol=symbol)
 
                         # ── Fix 2 & 3: Positive catalysts + priority resolution ──
-                        catalysts = await loop.run_in_executor(
-                            None, ni.detect_catalysts_for_symbol, symbol, 6
-                        )
                         catalyst_context = ni.build_catalyst_context(symbol, catalysts)
                         priority_note = ni.resolve_signal_priority(symbol, catalysts, active_macros)
 
@@ -856,6 +986,7 @@ async def background_auto_trade_loop():
                         )
 
                         db_signal = AISignal(
+                            timestamp=datetime.utcnow(),
                             user_id=user.id,
                             symbol=symbol,
                             signal=signal.get("signal", "HOLD"),
@@ -865,8 +996,9 @@ async def background_auto_trade_loop():
                             reasoning=signal.get("reasoning", ""),
                             model_used=signal.get("model", "unknown")
                         )
-                        db.add(db_signal)
-                        db.commit()
+                        signals_to_insert.append(db_signal)
+                        if len(signals_to_insert) >= SIGNAL_FLUSH_BATCH:
+                            _persist_signals(db, signals_to_insert, "[AutoTrade]")
 
                         if signal.get("signal") in ("BUY", "SELL"):
                             gap_pct = quote.get("change_pct", 0)
@@ -945,6 +1077,7 @@ async def background_auto_trade_loop():
                                     logger.warning(f"[AutoTrade] {symbol} {action} NOT executed (conf {confidence:.0%}): {_why}")
                     except Exception as inner_e:
                         logger.error(f"Error auto-trading {symbol} for {user.username}: {inner_e}")
+                _persist_signals(db, signals_to_insert, "[AutoTrade]")
 
         except Exception as e:
             logger.error(f"Background auto-trade loop error: {e}")
@@ -967,7 +1100,7 @@ async def background_social_sentiment_scan():
             users = db.query(User).all()
 
             # Collect all symbols across all user watchlists
-            all_symbols = set(md.DEFAULT_WATCHLIST)
+            all_symbols = set(_DEFAULT_WATCHLIST_TUPLE)
             for user in users:
                 wl = get_setting(db, "watchlist", user.id, "[]")
                 try:
@@ -983,7 +1116,7 @@ async def background_social_sentiment_scan():
             watchlist = list(all_symbols)
 
             # Scan for extreme StockTwits sentiment
-            alerts = ss.scan_sentiment_alerts(watchlist)
+            alerts = _scan_sentiment_cached(watchlist)
             if alerts:
                 for sym, data in alerts.items():
                     label = data.get("sentiment_label", "NEUTRAL")
@@ -1086,7 +1219,8 @@ async def background_blog_scan():
                     watchlist = build_tradeable_watchlist(db, user.id)
 
                     # Only re-analyze stocks that are in our watchlist AND affected
-                    urgent_symbols = [s for s in affected["sell"] if s in watchlist]
+                    wl_set = set(watchlist)
+                    urgent_symbols = [s for s in affected["sell"] if s in wl_set]
                     if not urgent_symbols:
                         continue
 
@@ -1094,51 +1228,61 @@ async def background_blog_scan():
                     portfolio_context = build_rich_portfolio_context(db, user.id, engine)
 
                     logger.info(f"[BlogMonitor] Urgent re-analysis for: {urgent_symbols}")
-                    for symbol in urgent_symbols:
-                        try:
-                            await asyncio.sleep(1)
-                            quote = price_cache.get(symbol)  # cache-only: price_refresh handles fetching
-                            if not quote:
-                                continue
-                            history = md.get_stock_history(symbol, period="1mo")
-                            indicators = md.get_technical_indicators(symbol)
-                            news = md.get_stock_news(symbol)
-
-                            signal = ai.analyze_stock(
-                                ai_provider, api_key, symbol, quote,
-                                indicators, history, news,
-                                portfolio_context, blog_context,
-                                rl_lessons=rl_lessons,
-                                global_context=gc.build_global_context()
-                            )
-
-                            db_signal = AISignal(
-                                user_id=user.id,
-                                symbol=symbol,
-                                signal=signal.get("signal", "HOLD"),
-                                confidence=signal.get("confidence", 0),
-                                target_price=signal.get("target_price"),
-                                stop_loss=signal.get("stop_loss"),
-                                reasoning=f"[BLOG-ALERT] {signal.get('reasoning', '')}",
-                                model_used=signal.get("model", "unknown")
-                            )
-                            db.add(db_signal)
-                            db.commit()
+                    loop = asyncio.get_event_loop()
+                    sem = asyncio.Semaphore(URGENT_REANALYSIS_CONCURRENCY)
+                    signals_to_insert = []
+
+                    async def _reanalyze(symbol):
+                        async with sem:
+                            try:
+                                quote = price_cache.get(symbol)  # cache-only: price_refresh handles fetching
+                                if not quote:
+                                    return
+                                history, indicators, news, global_ctx = await asyncio.gather(
+                                    loop.run_in_executor(None, md.get_stock_history, symbol, "1mo"),
+                                    loop.run_in_executor(None, md.get_technical_indicators, symbol),
+                                    loop.run_in_executor(None, md.get_stock_news, symbol),
+                                    loop.run_in_executor(None, gc.build_global_context),
+                                )
 
-                            if signal.get("signal") in ("SELL", "COVER"):
-                                auto_result = engine.auto_trade(signal, quote["current"], indicators=indicators)
-                                if auto_result.get("success"):
-                                    logger.info(f"[BlogMonitor] Blog-triggered trade: {symbol} → {auto_result}")
-                                    await broadcast({
-                                        "type": "auto_trade",
-                                        "user": user.username,
-                                        "symbol": symbol,
-                                        "result": auto_result,
-                                        "trigger": "blog_alert",
-                                        "blog_title": high_alerts[0]["title"],
-                                    })
-                        except Exception as e:
-                            logger.error(f"[BlogMonitor] Error re-analyzing {symbol}: {e}")
+                                signal = await loop.run_in_executor(None, lambda: ai.analyze_stock(
+                                    ai_provider, api_key, symbol, quote,
+                                    indicators, history, news,
+                                    portfolio_context, blog_context,
+                                    rl_lessons=rl_lessons,
+                                    global_context=global_ctx
+                                ))
+
+                                db_signal = AISignal(
+                                    timestamp=datetime.utcnow(),
+                                    user_id=user.id,
+                                    symbol=symbol,
+                                    signal=signal.get("signal", "HOLD"),
+                                    confidence=signal.get("confidence", 0),
+                                    target_price=signal.get("target_price"),
+                                    stop_loss=signal.get("stop_loss"),
+                                    reasoning=f"[BLOG-ALERT] {signal.get('reasoning', '')}",
+                                    model_used=signal.get("model", "unknown")
+                                )
+                                signals_to_insert.append(db_signal)
+
+                                if signal.get("signal") in ("SELL", "COVER"):
+                                    auto_result = engine.auto_trade(signal, quote["current"], indicators=indicators)
+                                    if auto_result.get("success"):
+                                        logger.info(f"[BlogMonitor] Blog-triggered trade: {symbol} → {auto_result}")
+                                        await broadcast({
+                                            "type": "auto_trade",
+                                            "user": user.username,
+                                            "symbol": symbol,
+                                            "result": auto_result,
+                                            "trigger": "blog_alert",
+                                            "blog_title": high_alerts[0]["title"],
+                                        })
+                            except Exception as e:
+                                logger.error(f"[BlogMonitor] Error re-analyzing {symbol}: {e}")
+
+                    await asyncio.gather(*(_reanalyze(s) for s in urgent_symbols), return_exceptions=True)
+                    _persist_signals(db, signals_to_insert, "[BlogMonitor]")
 
         except Exception as e:
             logger.error(f"[BlogMonitor] Loop error: {e}")
@@ -1180,45 +1324,55 @@ async def background_event_scan():
                 portfolio_context = build_rich_portfolio_context(db, user.id, engine)
                 event_context = em.build_event_context(watchlist, days_ahead=3)
 
-                for symbol in priority_symbols:
-                    try:
-                        await asyncio.sleep(1)
-                        quote = price_cache.get(symbol)  # cache-only
-                        if not quote:
-                            continue
+                loop = asyncio.get_event_loop()
+                sem = asyncio.Semaphore(URGENT_REANALYSIS_CONCURRENCY)
+                signals_to_insert = []
 
-                        history = md.get_stock_history(symbol, period="3mo")
-                        indicators = md.get_technical_indicators(symbol)
-                        news = md.get_stock_news(symbol)
+                async def _analyze_pre_event(symbol):
+                    async with sem:
+                        try:
+                            quote = price_cache.get(symbol)  # cache-only
+                            if not quote:
+                                return
 
-                        signal = ai.analyze_stock(
-                            ai_provider, api_key, symbol, quote,
-                            indicators, history, news,
-                            portfolio_context, event_context,
-                            rl_lessons=rl_lessons,
-                            global_context=gc.build_global_context()
-                        )
+                            history, indicators, news, global_ctx = await asyncio.gather(
+                                loop.run_in_executor(None, md.get_stock_history, symbol, "3mo"),
+                                loop.run_in_executor(None, md.get_technical_indicators, symbol),
+                                loop.run_in_executor(None, md.get_stock_news, symbol),
+                                loop.run_in_executor(None, gc.build_global_context),
+                            )
 
-                        db_signal = AISignal(
-                            user_id=user.id,
-                            symbol=symbol,
-                            signal=signal.get("signal", "HOLD"),
-                            confidence=signal.get("confidence", 0),
-                            target_price=signal.get("target_price"),
-                            stop_loss=signal.get("stop_loss"),
-                            reasoning=f"[PRE-EVENT] {signal.get('reasoning', '')}",
-                            model_used=signal.get("model", "unknown")
-                        )
-                        db.add(db_signal)
-                        db.commit()
+                            signal = await loop.run_in_executor(None, lambda: ai.analyze_stock(
+                                ai_provider, api_key, symbol, quote,
+                                indicators, history, news,
+                                portfolio_context, event_context,
+                                rl_lessons=rl_lessons,
+                                global_context=global_ctx
+                            ))
 
-                        if signal.get("signal") in ("BUY", "SELL", "COVER"):
-                            auto_result = engine.auto_trade(signal, quote["current"], indicators=indicators)
-                            if auto_result.get("success"):
-                                logger.info(f"[EventScan] Pre-event trade: {user.username} {symbol} → {auto_result}")
-                                await broadcast({"type": "auto_trade", "user": user.username, "symbol": symbol, "result": auto_result, "trigger": "pre_event"})
-                    except Exception as e:
-                        logger.error(f"[EventScan] Error analyzing {symbol}: {e}")
+                            db_signal = AISignal(
+                                timestamp=datetime.utcnow(),
+                                user_id=user.id,
+                                symbol=symbol,
+                                signal=signal.get("signal", "HOLD"),
+                                confidence=signal.get("confidence", 0),
+                                target_price=signal.get("target_price"),
+                                stop_loss=signal.get("stop_loss"),
+                                reasoning=f"[PRE-EVENT] {signal.get('reasoning', '')}",
+                                model_used=signal.get("model", "unknown")
+                            )
+                            signals_to_insert.append(db_signal)
+
+                            if signal.get("signal") in ("BUY", "SELL", "COVER"):
+                                auto_result = engine.auto_trade(signal, quote["current"], indicators=indicators)
+                                if auto_result.get("success"):
+                                    logger.info(f"[EventScan] Pre-event trade: {user.username} {symbol} → {auto_result}")
+                                    await broadcast({"type": "auto_trade", "user": user.username, "symbol": symbol, "result": auto_result, "trigger": "pre_event"})
+                        except Exception as e:
+                            logger.error(f"[EventScan] Error analyzing {symbol}: {e}")
+
+                await asyncio.gather(*(_analyze_pre_event(s) for s in priority_symbols), return_exceptions=True)
+                _persist_signals(db, signals_to_insert, "[EventScan]")
 
         except Exception as e:
             logger.error(f"[EventScan] Loop error: {e}")
@@ -1237,7 +1391,12 @@ async def background_news_scan():
     last_threat_seen = {}   # symbol -> last threat title, to avoid re-trading same news
 
     while True:
+        # Signals are saved once per user pass; the finally below saves whatever
+        # a pass had collected when an error or cancellation cut it short.
+        db = None
+        signals_to_insert = []
         try:
+            loop = asyncio.get_running_loop()
             db = next(get_db())
             users = db.query(User).all()
 
@@ -1253,91 +1412,106 @@ async def background_news_scan():
                 watchlist = build_tradeable_watchlist(db, user.id)
 
                 # Scan for new competitive threats (last 2 hours only - fresh news)
-                threat_map = ni.scan_all_threats(watchlist, hours_back=2)
+                threat_map = await loop.run_in_executor(IO_POOL, partial(ni.scan_all_threats, watchlist, hours_back=2))
 
+                # Skip symbols whose newest threats we already acted on
+                fresh_threats = {}
                 for symbol, threats in threat_map.items():
-                    # Skip if we already acted on this exact news
                     new_threats = [
                         t for t in threats
                         if t["news_title"] != last_threat_seen.get(symbol)
                     ]
-                    if not new_threats:
-                        continue
-
-                    logger.info(f"[NewsScan] BREAKING: {len(new_threats)} new threat(s) for {symbol}")
+                    if new_threats:
+                        fresh_threats[symbol] = new_threats
 
+                if fresh_threats:
                     engine = TradingEngine(db, user.id)
                     portfolio_context = build_rich_portfolio_context(db, user.id, engine)
+                    sem = asyncio.Semaphore(NEWS_SCAN_CONCURRENCY)
 
-                    quote = price_cache.get(symbol)  # cache-only
-                    if not quote:
-                        continue
+                async def _scan_symbol(symbol, new_threats):
+                    async with sem:
+                        try:
+                            logger.info(f"[NewsScan] BREAKING: {len(new_threats)} new threat(s) for {symbol}")
 
-                    history = md.get_stock_history(symbol, period="1mo")
-                    indicators = md.get_technical_indicators(symbol)
-                    news = md.get_stock_news(symbol)
+                            quote = price_cache.get(symbol)  # cache-only
+                            if not quote:
+                                return
+
+                            history, indicators, news, catalysts, global_ctx = await asyncio.gather(
+                                loop.run_in_executor(IO_POOL, md.get_stock_history, symbol, "1mo"),
+                                loop.run_in_executor(IO_POOL, md.get_technical_indicators, symbol),
+                                loop.run_in_executor(IO_POOL, md.get_stock_news, symbol),
+                                # ── Fix 2 & 3: Positive catalysts + priority resolution ──
+                                loop.run_in_executor(IO_POOL, ni.detect_catalysts_for_symbol, symbol, 6),
+                                loop.run_in_executor(IO_POOL, gc.build_global_context),
+                            )
 
-                    threat_context = ni.build_threat_context(symbol, new_threats)
+                            threat_context = ni.build_threat_context(symbol, new_threats)
+                            catalyst_context = ni.build_catalyst_context(symbol, catalysts)
+                            priority_note = ni.resolve_signal_priority(symbol, catalysts, [])
 
-                    # ── Fix 2 & 3: Positive catalysts + priority resolution ──
-                    catalysts = ni.detect_catalysts_for_symbol(symbol, hours_back=6)
-                    catalyst_context = ni.build_catalyst_context(symbol, catalysts)
-                    priority_note = ni.resolve_signal_priority(symbol, catalysts, [])
+                            full_context = "\n\n".join(filter(None, [threat_context, catalyst_context, priority_note]))
 
-                    full_context = "\n\n".join(filter(None, [threat_context, catalyst_context, priority_note]))
+                            sector = ni.get_symbol_sector(symbol)
+                            signal = await loop.run_in_executor(None, lambda: ai.analyze_stock(
+                                ai_provider, api_key, symbol, quote,
+                                indicators, history, news,
+                                portfolio_context,
+                                full_context,
+                                rl_lessons=rl_lessons,
+                                global_context=global_ctx
+                            ))
+                            signal["sector"] = sector
 
-                    sector = ni.get_symbol_sector(symbol)
-                    signal = ai.analyze_stock(
-                        ai_provider, api_key, symbol, quote,
-                        indicators, history, news,
-                        portfolio_context,
-                        full_context,
-                        rl_lessons=rl_lessons,
-                        global_context=gc.build_global_context()
-                    )
-                    signal["sector"] = sector
-
-                    rl.record_signal_state(
-                        signal, quote, indicators or {},
-                        full_context,
-                        portfolio_context,
-                        catalysts=catalysts,
-                        active_macros=[]
-                    )
+                            rl.record_signal_state(
+                                signal, quote, indicators or {},
+                                full_context,
+                                portfolio_context,
+                                catalysts=catalysts,
+                                active_macros=[]
+                            )
 
-                    db_signal = AISignal(
-                        user_id=user.id,
-                        symbol=symbol,
-                        signal=signal.get("signal", "HOLD"),
-                        confidence=signal.get("confidence", 0),
-                        target_price=signal.get("target_price"),
-                        stop_loss=signal.get("stop_loss"),
-                        reasoning=f"[BREAKING NEWS] {signal.get('reasoning', '')}",
-                        model_used=signal.get("model", "unknown")
-                    )
-                    db.add(db_signal)
-                    db.commit()
+                            db_signal = AISignal(
+                                timestamp=datetime.utcnow(),
+                                user_id=user.id,
+                                symbol=symbol,
+                                signal=signal.get("signal", "HOLD"),
+                                confidence=signal.get("confidence", 0),
+                                target_price=signal.get("target_price"),
+                                stop_loss=signal.get("stop_loss"),
+                                reasoning=f"[BREAKING NEWS] {signal.get('reasoning', '')}",
+                                model_used=signal.get("model", "unknown")
+                            )
+                            signals_to_insert.append(db_signal)
 
-                    # Mark this news as seen
-                    last_threat_seen[symbol] = new_threats[0]["news_title"]
+                            # Mark this news as seen
+                            last_threat_seen[symbol] = new_threats[0]["news_title"]
 
-                    if signal.get("signal") in ("BUY", "SELL", "COVER"):
-                        auto_result = engine.auto_trade(signal, quote["current"], indicators=indicators)
-                        if auto_result.get("success"):
-                            logger.info(f"[NewsScan] Breaking-news trade: {symbol} → {signal['signal']}")
-                            await broadcast({
-                                "type": "auto_trade",
-                                "user": user.username,
-                                "symbol": symbol,
-                                "result": auto_result,
-                                "trigger": "breaking_news",
-                                "threat": new_threats[0]["news_title"]
-                            })
+                            if signal.get("signal") in ("BUY", "SELL", "COVER"):
+                                auto_result = engine.auto_trade(signal, quote["current"], indicators=indicators)
+                                if auto_result.get("success"):
+                                    logger.info(f"[NewsScan] Breaking-news trade: {symbol} → {signal['signal']}")
+                                    await broadcast({
+                                        "type": "auto_trade",
+                                        "user": user.username,
+                                        "symbol": symbol,
+                                        "result": auto_result,
+                                        "trigger": "breaking_news",
+                                        "threat": new_threats[0]["news_title"]
+                                    })
+                        except Exception as e:
+                            logger.error(f"[NewsScan] Error analyzing {symbol}: {e}")
+
+                await asyncio.gather(
+                    *(_scan_symbol(sym, t) for sym, t in fresh_threats.items()),
+                    return_exceptions=True,
+                )
 
                 # ── Geopolitical Macro Scan + Scenario Lifecycle ───────────
                 # Fetch geo news ONCE, reuse for all consumers below
-                geo_news = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: ni.fetch_geopolitical_news(hours_back=6)
+                geo_news = await loop.run_in_executor(
+                    IO_POOL, lambda: ni.fetch_geopolitical_news(hours_back=6)
                 )
 
                 # Run full lifecycle scan (trigger detection + resolution + decay + AI review)
@@ -1378,6 +1552,7 @@ async def background_news_scan():
                         await broadcast({"type": "watchlist_updated", "added": new_tickers, "reason": reason})
                 except Exception as _e:
                     logger.error(f"[AutoWatchlist] Error: {_e}")
+                wl_set = set(watchlist)
 
                 critical_macros = [m for m in active_macros if m["severity"] in ("CRITICAL", "HIGH")]
                 if critical_macros:
@@ -1389,6 +1564,7 @@ async def background_news_scan():
                     except Exception:
                         pass
 
+                    today_str = datetime.utcnow().strftime("%Y-%m-%d")
                     for macro in critical_macros:
                         # ── Adaptive scenario health check (replaces rigid "7 day" age gate) ──
                         # Assess actual price performance of beneficiaries since first trade.
@@ -1406,7 +1582,6 @@ async def background_news_scan():
                             f"VIX={geo_vix:.1f} pos_mult={scenario_mult:.1f}"
                         )
 
-                        today_str = datetime.utcnow().strftime("%Y-%m-%d")
                         for _k in list(_geo_traded_today.keys()):
                             if _geo_traded_today[_k] != today_str:
                                 del _geo_traded_today[_k]
@@ -1420,7 +1595,7 @@ async def background_news_scan():
                                 _geo_traded_today[_t.symbol] = today_str
 
                         for sym in macro["potential_beneficiaries"]:
-                            if sym not in watchlist:
+                            if sym not in wl_set:
                                 continue
                             if _geo_traded_today.get(sym) == today_str:
                                 logger.info(f"[GeoScan] {sym} already geo-traded today, skipping")
@@ -1474,6 +1649,7 @@ async def background_news_scan():
                             )
 
                             db_signal = AISignal(
+                                timestamp=datetime.utcnow(),
                                 user_id=user.id,
                                 symbol=sym,
                                 signal=signal.get("signal", "HOLD"),
@@ -1483,8 +1659,7 @@ async def background_news_scan():
                                 reasoning=f"[GEOPOLITICAL] {macro['name']}: {signal.get('reasoning', '')}",
                                 model_used=signal.get("model", "unknown")
                             )
-                            db.add(db_signal)
-                            db.commit()
+                            signals_to_insert.append(db_signal)
 
                             if signal.get("signal") in ("BUY", "COVER"):
                                 # Stop-loss cooldown: 3-day ban after any [STOP-LOSS] sell
@@ -1539,7 +1714,7 @@ async def background_news_scan():
                     affected_syms = set()
                     for imp in new_impacts:
                         for s in imp["affected_stocks"]:
-                            if s in watchlist:
+                            if s in wl_set:
                                 affected_syms.add(s)
                     
                     if affected_syms:
@@ -1575,6 +1750,7 @@ async def background_news_scan():
                             )
                            
                             db_signal = AISignal(
+                                timestamp=datetime.utcnow(),
                                 user_id=user.id,
                                 symbol=sym,
                                 signal=signal.get("signal", "HOLD"),
@@ -1584,8 +1760,7 @@ async def background_news_scan():
                                 reasoning=f"[TECH NEWS] {signal.get('reasoning', '')}",
                                 model_used=signal.get("model", "unknown")
                             )
-                            db.add(db_signal)
-                            db.commit()
+                            signals_to_insert.append(db_signal)
                             
                             if signal.get("signal") in ("BUY", "SELL", "COVER"):
                                 auto_result = engine.auto_trade(signal, quote["current"], indicators=indicators)
@@ -1641,11 +1816,11 @@ async def background_news_scan():
                             logger.info(f"[Restructuring] {sym} in stop-loss cooldown — skip")
                             continue
 
-                        indicators = await loop.run_in_executor(None, md.get_technical_indicators, sym)
+                        indicators = await loop.run_in_executor(IO_POOL, md.get_technical_indicators, sym)
                         engine = TradingEngine(db, user.id)
                         base_risk = float(get_setting(db, "risk_per_trade_pct", user.id, "2.0"))
                         orig_min_conf = get_setting(db, "auto_trade_min_confidence", user.id, "0.75")
-                        vix_now = (await loop.run_in_executor(None, gc.build_global_context)).get("vix", {}).get("value", 20)
+                        vix_now = (await loop.run_in_executor(IO_POOL, gc.build_global_context)).get("vix", {}).get("value", 20)
                         scaled_risk = ps.vix_position_scale(vix_now, base_risk)
 
                         if strength >= 2:
@@ -1673,8 +1848,8 @@ async def background_news_scan():
                             )
                         else:
                             # Strength 1: run AI analysis with restructuring context
-                            history = await loop.run_in_executor(None, md.get_stock_history, sym, "1mo")
-                            news_items = await loop.run_in_executor(None, md.get_stock_news, sym)
+                            history = await loop.run_in_executor(IO_POOL, md.get_stock_history, sym, "1mo")
+                            news_items = await loop.run_in_executor(IO_POOL, md.get_stock_news, sym)
                             portfolio_ctx = build_rich_portfolio_context(db, user.id, engine)
                             sector = ni.get_symbol_sector(sym)
                             signal = await loop.run_in_executor(
@@ -1692,6 +1867,7 @@ async def background_news_scan():
 
                         # Record signal to DB
                         db_signal = AISignal(
+                            timestamp=datetime.utcnow(),
                             user_id=user.id,
                             symbol=sym,
                             signal=signal.get("signal", "HOLD"),
@@ -1701,8 +1877,7 @@ async def background_news_scan():
                             reasoning=f"[RESTRUCTURING] {signal.get('reasoning', '')}",
                             model_used=signal.get("model", f"restructuring-s{strength}"),
                         )
-                        db.add(db_signal)
-                        db.commit()
+                        signals_to_insert.append(db_signal)
 
                         if signal.get("signal") in ("BUY", "COVER"):
                             # For strength>=2 lower the confidence gate to match forced signal
@@ -1740,14 +1915,19 @@ async def background_news_scan():
                     _seen_restr.add(hit["headline"])
 
                 background_news_scan._seen_restr_headlines = _seen_restr
+                _persist_signals(db, signals_to_insert, "[NewsScan]")
 
                 # Also backfill RL outcomes once per day (run at ~midnight UTC)
-                if datetime.utcnow().hour == 0 and datetime.utcnow().minute < 10:
+                now = datetime.utcnow()
+                if now.hour == 0 and now.minute < 10:
                     rl.update_trade_outcomes()
                     _run_daily_maintenance(db)
 
         except Exception as e:
             logger.error(f"[NewsScan] Loop error: {e}")
+        finally:
+            if db is not None:
+                _persist_signals(db, signals_to_insert, "[NewsScan]")
 
         await asyncio.sleep(900)  # Every 15 minutes (reduced from 10 min to lower CPU)
 
@@ -1761,88 +1941,86 @@ async def background_daily_summary():
     """
     await asyncio.sleep(120)  # Wait 2 min after startup before first check
 
-    # Track which emails we've sent today so we don't double-send
-    _sent_today = {"pre_market": None, "post_market": None}  # date string -> sent flag
-
+    target = datetime.utcnow()
     while True:
+        # Sleep straight to the next digest window instead of polling every minute.
+        # Anchoring on the previous target means an early wake-up can't re-fire it.
+        now = datetime.utcnow()
+        target, fire_type = _next_digest_fire(now, after=target)
+        await asyncio.sleep(max(1.0, (target - now).total_seconds()))
+
+        now = datetime.utcnow()
+        loop = asyncio.get_running_loop()
         try:
-            now = datetime.utcnow()
-            today_str = now.strftime("%Y-%m-%d")
-
-            # Reset tracker at UTC midnight
-            if _sent_today["pre_market"] and _sent_today["pre_market"] != today_str:
-                _sent_today = {"pre_market": None, "post_market": None}
-
-            h, m = now.hour, now.minute
-
-            # Determine if it's time to fire
-            fire_type = None
-            if h == 14 and 20 <= m <= 29 and _sent_today["pre_market"] != today_str:
-                fire_type = "pre_market"
-            elif h == 21 and 5 <= m <= 14 and _sent_today["post_market"] != today_str:
-                fire_type = "post_market"
-
-            if fire_type:
-                try:
-                    db = next(get_db())
-                    users = db.query(User).all()
+            db = next(get_db())
+            users = db.query(User).all()
 
-                    for user in users:
-                        if get_setting(db, "notify_enabled", user.id, "false") != "true":
-                            continue
+            # One settings query for every user instead of 2 get_setting calls each
+            user_settings = {
+                (r.user_id, r.key): r.value
+                for r in db.query(Settings).filter(
+                    Settings.user_id.in_([u.id for u in users]),
+                    Settings.key.in_(("notify_enabled", "watchlist")),
+                ).all()
+            }
+            notify_users = [u for u in users
+                            if user_settings.get((u.id, "notify_enabled"), "false") == "true"]
+
+            if notify_users:
+                # Blog / macro alerts don't depend on the user — scan once
+                blog_alerts, macro_alerts = await asyncio.gather(
+                    loop.run_in_executor(IO_POOL, partial(bm.scan_all_blogs, hours_back=12)),
+                    loop.run_in_executor(IO_POOL, partial(ni.detect_active_macro_scenarios, hours_back=12)),
+                )
 
-                        engine = TradingEngine(db, user.id)
-                        portfolio = engine.get_portfolio_summary()
-
-                        # Today's trades from DB
-                        from sqlalchemy import func
-                        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-                        db_trades = db.query(Trade).filter(
-                            Trade.user_id == user.id,
-                            Trade.timestamp >= today_start
-                        ).order_by(Trade.timestamp.desc()).all()
-                        trades_today = [
-                            {
-                                "symbol": t.symbol,
-                                "side": t.side,
-                                "quantity": t.quantity,
-                                "price": t.price,
-                                "total": t.total_value,
-                                "reasoning": t.reasoning or "",
-                                "trigger": t.trigger if hasattr(t, "trigger") else "auto",
-                            }
-                            for t in db_trades
-                        ]
-
-                        # Gather current blog / macro / sentiment alerts
-                        watchlist_json = get_setting(db, "watchlist", user.id, json.dumps(md.DEFAULT_WATCHLIST))
-                        watchlist = json.loads(watchlist_json)
-
-                        loop = asyncio.get_event_loop()
-                        blog_alerts = await loop.run_in_executor(None, lambda: bm.scan_all_blogs(hours_back=12))
-                        macro_alerts = await loop.run_in_executor(None, lambda: ni.detect_active_macro_scenarios(hours_back=12))
-                        sentiment_alerts = await loop.run_in_executor(
-                            None, lambda: ss.scan_sentiment_alerts(watchlist)
-                        )
+                # Today's trades for all notifying users in a single query
+                today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+                # Only the digest's columns; (user_id, timestamp) order matches ix_trade_user_ts
+                rows = db.execute(
+                    select(
+                        Trade.user_id, Trade.symbol, Trade.side, Trade.quantity,
+                        Trade.price, Trade.total_value, Trade.reasoning,
+                    ).where(
+                        Trade.user_id.in_([u.id for u in notify_users]),
+                        Trade.timestamp >= today_start,
+                    ).order_by(Trade.user_id, Trade.timestamp.desc())
+                ).all()
+                trades_by_user = {
+                    uid: [
+                        {
+                            "symbol": t.symbol,
+                            "side": t.side,
+                            "quantity": t.quantity,
+                            "price": t.price,
+                            "total": t.total_value,
+                            "reasoning": t.reasoning or "",
+                            "trigger": "auto",  # Trade has no trigger column
+                        }
+                        for t in group
+                    ]
+                    for uid, group in groupby(rows, key=lambda t: t.user_id)
+                }
 
-                        await loop.run_in_executor(
-                            None,
-                            lambda: notifier.notify_daily_summary(
-                                db, fire_type, portfolio,
-                                trades_today, blog_alerts, macro_alerts, sentiment_alerts
-                            )
-                        )
-                        logger.info(f"[DailySummary] Sent {fire_type} digest for user {user.username}")
+            for user in notify_users:
+                engine = TradingEngine(db, user.id)
+                portfolio = engine.get_portfolio_summary()
 
-                    _sent_today[fire_type] = today_str
+                trades_today = trades_by_user.get(user.id, [])
 
-                except Exception as e:
-                    logger.error(f"[DailySummary] Error sending {fire_type} digest: {e}")
+                watchlist = json.loads(user_settings.get((user.id, "watchlist"), _DEFAULT_WATCHLIST_JSON))
+                # Users sharing a watchlist share one (cached) sentiment scan
+                sentiment_alerts = await loop.run_in_executor(
+                    IO_POOL, _scan_sentiment_cached, watchlist
+                )
 
+                await loop.run_in_executor(
+                    IO_POOL, notifier.notify_daily_summary,
+                    db, fire_type, portfolio,
+                    trades_today, blog_alerts, macro_alerts, sentiment_alerts,
+                )
+                logger.info(f"[DailySummary] Sent {fire_type} digest for user {user.username}")
         except Exception as e:
-            logger.error(f"[DailySummary] Loop error: {e}")
-
-        await asyncio.sleep(60)  # Check every minute
+            logger.error(f"[DailySummary] Error sending {fire_type} digest: {e}")
 
 
 async def background_pending_trade_executor():
@@ -1867,7 +2045,7 @@ async def background_pending_trade_executor():
             for pending in pendings:
                 try:
                     engine = TradingEngine(db, pending.user_id)
-                    quote = price_cache.get(pending.symbol) or md.get_stock_quote(pending.symbol)
+                    quote = price_cache.get(pending.symbol) or md.get_stock_quote_light(pending.symbol)
                     if not quote:
                         pending.last_error = "No market quote available"
                         db.commit()
@@ -2083,18 +2261,55 @@ def _run_daily_maintenance(db):
     logger.info("[Maintenance] Daily housekeeping complete.")
 
 
+def _refresh_price_snapshot() -> None:
+    """Re-serialize the connect-time price snapshot after price_cache changes."""
+    global _price_snapshot_msg
+    _price_snapshot_msg = _dumps({
+        "type": "price_update",
+        "prices": {k: v["current"] for k, v in price_cache.items()},
+        "timestamp": datetime.utcnow().isoformat()
+    }) if price_cache else None
+
+
 async def broadcast(data: dict):
-    """Broadcast message to all connected WebSocket clients."""
-    dead = []
-    message = json.dumps(data)
-    for ws in active_connections:
+    """Queue a message for all connected WebSocket clients.
+
+    Returns immediately: the message is serialized once and dropped into each
+    client's own queue, drained by that client's _client_sender task, so a
+    slow client only ever delays itself.
+    """
+    # Dashboard closed (the common single-user case): skip serialization entirely.
+    if not active_connections:
+        return
+    message = _dumps(data)
+    for queue in list(active_connections.values()):
+        _enqueue_drop_oldest(queue, message)
+
+
+def _enqueue_drop_oldest(queue: asyncio.Queue, message: str) -> None:
+    if queue.full():
         try:
-            await ws.send_text(message)
+            queue.get_nowait()  # drop oldest — stale prices are worthless
+        except asyncio.QueueEmpty:
+            pass
+    queue.put_nowait(message)
+
+
+async def _client_sender(websocket: WebSocket, queue: asyncio.Queue):
+    """Sole writer for one WebSocket: drain its queue until a send fails."""
+    try:
+        while True:
+            message = await queue.get()
+            await asyncio.wait_for(websocket.send_text(message), BROADCAST_SEND_TIMEOUT)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.info(f"[Broadcast] dropping slow/dead WebSocket client: {e!r}")
+        active_connections.pop(websocket, None)
+        try:
+            await websocket.close()  # unblocks the endpoint's receive loop
         except Exception:
-            dead.append(ws)
-    for ws in dead:
-        if ws in active_connections:
-            active_connections.remove(ws)
+            pass
 
 @app.get("/api/auth/alpaca/login")
 async def alpaca_login():
@@ -2158,10 +2373,14 @@ async def alpaca_callback(code: str, db: Session = Depends(get_db)):
                 "auto_trade_min_confidence": "0.75",
                 "risk_per_trade_pct": "2.0",
                 "ai_provider": "ollama",
-                "watchlist": json.dumps(md.DEFAULT_WATCHLIST),
+                "watchlist": _DEFAULT_WATCHLIST_JSON,
             }
-            for k, v in defaults.items():
-                set_setting(db, k, v, user.id)
+            # Brand-new user → no existing rows to upsert; one INSERT batch + one commit
+            db.bulk_insert_mappings(Settings, [
+                {"user_id": user.id, "key": k, "value": v} for k, v in defaults.items()
+            ])
+            db.commit()
+            invalidate_settings_cache(user.id)
                 
         # Save OAuth token for this user
         set_setting(db, "alpaca_oauth_token", access_token, user.id)
@@ -2214,13 +2433,19 @@ async def get_markets():
     """Get all global market indices with market open/close status."""
     global market_cache, last_market_fetch
     now = datetime.utcnow()
-    if not market_cache or last_market_fetch is None or (now - last_market_fetch).seconds > 300:
+    # background_market_warmer keeps this fresh; fetch here only on a cold start
+    # or when the warmer has stopped landing updates
+    if (not market_cache or last_market_fetch is None
+            or (now - last_market_fetch).total_seconds() > 2 * MARKET_WARM_INTERVAL):
         try:
-            market_cache = md.get_all_indices()
+            market_cache = await asyncio.get_running_loop().run_in_executor(IO_POOL, md.get_all_indices)
             last_market_fetch = now
         except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
-    return {"data": market_cache, "timestamp": now.isoformat()}
+            if not market_cache:
+                raise HTTPException(status_code=500, detail=str(e))
+            logger.warning(f"Market refetch failed, serving data from {last_market_fetch}: {e}")
+    stale = (now - last_market_fetch).total_seconds() > 2 * MARKET_WARM_INTERVAL
+    return {"data": market_cache, "timestamp": last_market_fetch.isoformat(), "stale": stale}
 
 
 @app.get("/api/global-context")
@@ -2282,7 +2507,7 @@ async def get_popular_stocks(region: str = None):
 async def get_global_news():
     """Fetch latest news bucketed by market region (CN, HK, JP, EU, US, EM, GLOBAL)."""
     loop = asyncio.get_event_loop()
-    news_map = await loop.run_in_executor(None, lambda: ni.fetch_global_market_news(hours_back=8))
+    news_map = await loop.run_in_executor(IO_POOL, partial(ni.fetch_global_market_news, hours_back=8))
     return {"data": news_map, "timestamp": datetime.utcnow().isoformat()}
 
 
@@ -2369,31 +2594,25 @@ async def get_stock(symbol: str, period: str = "3mo"):
         parts = symbol.rsplit(".", 1)
         symbol = parts[0] + "." + parts[1].upper()
     loop = asyncio.get_event_loop()
-    
-    quote, history, indicators, news = await asyncio.gather(
-        loop.run_in_executor(None, md.get_stock_quote, symbol),
-        loop.run_in_executor(None, lambda: md.get_stock_history(symbol, period=period)),
-        loop.run_in_executor(None, md.get_technical_indicators, symbol),
-        loop.run_in_executor(None, md.get_stock_news, symbol),
-    )
-    
-    if not quote:
+
+    # One executor hop, one Ticker, one daily download for all four parts
+    snapshot = await loop.run_in_executor(IO_POOL, md.get_full_snapshot, symbol, period)
+
+    if not snapshot["quote"]:
         raise HTTPException(status_code=404, detail=f"Stock {symbol} not found")
-        
-    return {
-        "quote": quote,
-        "history": history,
-        "indicators": indicators,
-        "news": news,
-    }
+
+    snapshot["history"] = md.history_columns(snapshot["history"] or [])
+    return snapshot
 
 
 @app.get("/api/stock/{symbol}/history")
 async def get_stock_history(symbol: str, period: str = "3mo", interval: str = "1d"):
     """Get OHLCV historical data."""
     symbol = symbol.upper()
-    history = md.get_stock_history(symbol, period=period, interval=interval)
-    return {"symbol": symbol, "period": period, "interval": interval, "data": history}
+    history = await asyncio.get_running_loop().run_in_executor(
+        IO_POOL, partial(md.get_stock_history, symbol, period=period, interval=interval)
+    )
+    return {"symbol": symbol, "period": period, "interval": interval, "data": md.history_columns(history or [])}
 
 
 @app.get("/api/portfolio")
@@ -2442,21 +2661,15 @@ async def get_nz_tax_summary(
 @app.get("/api/trades")
 async def get_trades(limit: int = 50, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Get trade history."""
-    trades = db.query(Trade).filter(Trade.user_id == current_user.id).order_by(Trade.timestamp.desc()).limit(limit).all()
+    # Core select (served by ix_trade_user_ts): rows map straight to dicts, no ORM hydration
+    stmt = select(
+        Trade.id, Trade.symbol, Trade.side, Trade.quantity, Trade.price, Trade.total_value,
+        Trade.ai_triggered, Trade.ai_confidence, Trade.reasoning, Trade.timestamp,
+    ).where(Trade.user_id == current_user.id).order_by(Trade.timestamp.desc()).limit(limit)
+    rows = db.execute(stmt).mappings().all()
     return {"trades": [
-        {
-            "id": t.id,
-            "symbol": t.symbol,
-            "side": t.side,
-            "quantity": t.quantity,
-            "price": t.price,
-            "total_value": t.total_value,
-            "ai_triggered": t.ai_triggered,
-            "ai_confidence": t.ai_confidence,
-            "reasoning": t.reasoning,
-            "timestamp": t.timestamp.isoformat() if t.timestamp else None,
-        }
-        for t in trades
+        {**r, "timestamp": r["timestamp"].isoformat() if r["timestamp"] else None}
+        for r in rows
     ]}
 
 
@@ -2466,7 +2679,7 @@ async def execute_trade(request: TradeRequest, current_user: User = Depends(get_
     engine = TradingEngine(db, current_user.id)
     price = request.price
     if price is None:
-        quote = md.get_stock_quote(request.symbol.upper())
+        quote = await asyncio.get_running_loop().run_in_executor(IO_POOL, md.get_stock_quote_light, request.symbol.upper())
         if not quote:
             raise HTTPException(status_code=404, detail="Cannot fetch live price")
         price = quote["current"]
@@ -2493,13 +2706,16 @@ async def analyze_stock(request: AnalyzeRequest, current_user: User = Depends(ge
     api_key = get_setting(db, "deepseek_api_key", current_user.id, "")
     ai_provider = get_setting(db, "ai_provider", current_user.id, "ollama")
 
-    quote = md.get_stock_quote(symbol)
+    loop = asyncio.get_running_loop()
+    quote, history, indicators, news, global_ctx = await asyncio.gather(
+        loop.run_in_executor(IO_POOL, md.get_stock_quote, symbol),
+        loop.run_in_executor(IO_POOL, md.get_stock_history, symbol, "6mo"),
+        loop.run_in_executor(IO_POOL, md.get_technical_indicators, symbol),
+        loop.run_in_executor(IO_POOL, md.get_stock_news, symbol),
+        loop.run_in_executor(IO_POOL, gc.build_global_context),
+    )
     if not quote:
         raise HTTPException(status_code=404, detail=f"Stock {symbol} not found")
-
-    history = md.get_stock_history(symbol, period="6mo")
-    indicators = md.get_technical_indicators(symbol)
-    news = md.get_stock_news(symbol)
     sector = ni.get_symbol_sector(symbol)
 
     # Portfolio context
@@ -2507,7 +2723,10 @@ async def analyze_stock(request: AnalyzeRequest, current_user: User = Depends(ge
     summary = engine.get_portfolio_summary()
     portfolio_context = f"Portfolio equity: ${summary['total_equity']:,.2f}, Cash: ${summary['cash']:,.2f}"
 
-    signal = ai.analyze_stock(ai_provider, api_key, symbol, quote, indicators, history, news, portfolio_context, rl_lessons=rl_lessons, sector=sector, global_context=gc.build_global_context())
+    signal = await loop.run_in_executor(None, partial(
+        ai.analyze_stock, ai_provider, api_key, symbol, quote, indicators, history, news,
+        portfolio_context, rl_lessons=rl_lessons, sector=sector, global_context=global_ctx,
+    ))
     signal["sector"] = sector
 
     # Record to RL training dataset
@@ -2575,126 +2794,132 @@ async def chat(request: ChatRequest, current_user: User = Depends(get_current_us
 @app.get("/api/signals")
 async def get_signals(limit: int = 20, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Get recent AI signals."""
-    signals = db.query(AISignal).filter(AISignal.user_id == current_user.id).order_by(AISignal.timestamp.desc()).limit(limit).all()
+    stmt = select(
+        AISignal.id, AISignal.symbol, AISignal.signal, AISignal.confidence, AISignal.target_price,
+        AISignal.stop_loss, AISignal.reasoning, AISignal.model_used.label("model"), AISignal.timestamp,
+    ).where(AISignal.user_id == current_user.id).order_by(AISignal.timestamp.desc()).limit(limit)
+    rows = db.execute(stmt).mappings().all()
     return {"signals": [
-        {
-            "id": s.id,
-            "symbol": s.symbol,
-            "signal": s.signal,
-            "confidence": s.confidence,
-            "target_price": s.target_price,
-            "stop_loss": s.stop_loss,
-            "reasoning": s.reasoning,
-            "model": s.model_used,
-            "timestamp": s.timestamp.isoformat() if s.timestamp else None,
-        }
-        for s in signals
+        {**r, "timestamp": r["timestamp"].isoformat() if r["timestamp"] else None}
+        for r in rows
     ]}
 
 
 @app.get("/api/watchlist")
 async def get_watchlist(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Get current watchlist."""
-    watchlist_json = get_setting(db, "watchlist", current_user.id, json.dumps(md.DEFAULT_WATCHLIST))
-    return {"symbols": json.loads(watchlist_json)}
+    watchlist_json = get_setting(db, "watchlist", current_user.id, _DEFAULT_WATCHLIST_JSON)
+    return {"symbols": _loads(watchlist_json)}
 
 
 @app.post("/api/watchlist")
 async def update_watchlist(item: WatchlistUpdate, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Add or remove from watchlist."""
     symbol = item.symbol.upper()
-    watchlist_json = get_setting(db, "watchlist", current_user.id, json.dumps(md.DEFAULT_WATCHLIST))
-    watchlist = set(json.loads(watchlist_json))
+    watchlist_json = get_setting(db, "watchlist", current_user.id, _DEFAULT_WATCHLIST_JSON)
+    watchlist = set(_loads(watchlist_json))
     if item.action == "add":
         watchlist.add(symbol)
     elif item.action == "remove":
         watchlist.discard(symbol)
     
-    set_setting(db, "watchlist", json.dumps(list(watchlist)), current_user.id)
+    set_setting(db, "watchlist", _dumps(list(watchlist)), current_user.id)
     return {"watchlist": list(watchlist)}
 
 # ─────────────────────────────────────────────
 # OpenClaw Integration
 # ─────────────────────────────────────────────
 
+async def _handle_portfolio(request: OpenClawWebhook, db: Session) -> dict:
+    engine = TradingEngine(db)
+    summary = engine.get_portfolio_summary()
+
+    msg = f"💼 **SerenityAlphaTrader Portfolio ({summary['provider']})**\n\n"
+    msg += f"Total Equity: ${summary['total_equity']:,.2f}\n"
+    msg += f"Cash Balance: ${summary['cash']:,.2f}\n"
+    pnl_sign = "+" if summary['total_return'] >= 0 else ""
+    msg += f"Total Return: {pnl_sign}${summary['total_return']:,.2f} ({summary['total_return_pct']:.2f}%)\n\n"
+
+    if summary['positions']:
+        msg += "📈 **Top Open Positions:**\n"
+        # Sort by weight or market value
+        sorted_pos = sorted(summary['positions'], key=lambda x: x['market_value'], reverse=True)[:5]
+        for p in sorted_pos:
+            upnl_sign = "+" if p['unrealized_pnl'] >= 0 else ""
+            msg += f"- {p['symbol']}: {p['quantity']} shares @ ${p['current_price']} ({upnl_sign}${p['unrealized_pnl']:,.2f})\n"
+    else:
+        msg += "No open positions."
+
+    return {"response": msg}
+
+
+async def _handle_analyze(request: OpenClawWebhook, db: Session) -> dict:
+    if not request.symbol:
+        return {"response": _WEBHOOK_UNKNOWN}
+    symbol = request.symbol.upper()
+    quote = md.get_stock_quote(symbol)
+    if not quote:
+        return {"response": f"❌ Error: Could not fetch real-time data for {symbol}"}
+
+    indicators = md.get_technical_indicators(symbol)
+    history = md.get_stock_history(symbol, period="3mo")
+    news = md.get_stock_news(symbol)
+
+    api_key = get_setting(db, "deepseek_api_key", "")
+    ai_provider = get_setting(db, "ai_provider", "ollama")
+    engine = TradingEngine(db)
+    summary = engine.get_portfolio_summary()
+    portfolio_context = f"Portfolio equity: ${summary['total_equity']:,.2f}, Cash: ${summary['cash']:,.2f}"
+
+    signal_data = ai.analyze_stock(ai_provider, api_key, symbol, quote, indicators, history, news, portfolio_context, rl_lessons=get_rl_lessons(), global_context=gc.build_global_context())
+
+    sig = signal_data.get("signal", "HOLD")
+    conf = signal_data.get("confidence", 0) * 100
+    reasoning = signal_data.get("reasoning", "")
+
+    emoji = "📈" if sig == "BUY" else "📉" if sig == "SELL" else "⏸️"
+    msg = f"{emoji} **DeepSeek-R1 Analysis: {symbol}**\n"
+    msg += f"**Signal:** {sig} ({conf:.0f}% confidence)\n"
+    msg += f"**Current Price:** ${quote['current']}\n\n"
+    msg += f"**Reasoning:**\n{reasoning}\n\n"
+
+    target = signal_data.get("target_price")
+    stop = signal_data.get("stop_loss")
+    if target: msg += f"🎯 Target: ${target}\n"
+    if stop: msg += f"🛡️ Stop Loss: ${stop}\n"
+
+    return {"response": msg}
+
+
+_WEBHOOK_COMMANDS = {
+    "/portfolio": _handle_portfolio,
+    "portfolio": _handle_portfolio,
+    "balance": _handle_portfolio,
+    "status": _handle_portfolio,
+    "/analyze": _handle_analyze,
+    "analyze": _handle_analyze,
+}
+_WEBHOOK_UNKNOWN = "Unknown command. Use '/portfolio' or '/analyze AAPL'."
+
+
 @app.post("/api/openclaw/webhook")
 async def openclaw_webhook(request: OpenClawWebhook, db: Session = Depends(get_db)):
     """Endpoint for OpenClaw Skill to query portfolio or analyze stocks remotely."""
-    
+
     # Allow messages from both DMs and group chats seamlessly
     # The user requested to invite the AI into a group to avoid using their personal number.
-    pass
-        
     command = request.command.lower().strip()
-    
+
     # 2. Isolation Strategy 1: Command Prefix Checking
-    if not command.startswith("/") and command not in ["portfolio", "balance", "status", "analyze"]:
+    if not command.startswith("/") and command not in _WEBHOOK_COMMANDS:
         # Drop all normal conversational chatter
         return {"response": ""}
 
     try:
-        if command in ["/portfolio", "portfolio", "balance", "status"]:
-            engine = TradingEngine(db)
-            summary = engine.get_portfolio_summary()
-            
-            msg = f"💼 **SerenityAlphaTrader Portfolio ({summary['provider']})**\n\n"
-            msg += f"Total Equity: ${summary['total_equity']:,.2f}\n"
-            msg += f"Cash Balance: ${summary['cash']:,.2f}\n"
-            pnl_sign = "+" if summary['total_return'] >= 0 else ""
-            msg += f"Total Return: {pnl_sign}${summary['total_return']:,.2f} ({summary['total_return_pct']:.2f}%)\n\n"
-            
-            if summary['positions']:
-                msg += "📈 **Top Open Positions:**\n"
-                # Sort by weight or market value
-                sorted_pos = sorted(summary['positions'], key=lambda x: x['market_value'], reverse=True)[:5]
-                for p in sorted_pos:
-                    upnl_sign = "+" if p['unrealized_pnl'] >= 0 else ""
-                    msg += f"- {p['symbol']}: {p['quantity']} shares @ ${p['current_price']} ({upnl_sign}${p['unrealized_pnl']:,.2f})\n"
-            else:
-                msg += "No open positions."
-                
-            return {"response": msg}
-            
-        elif command in ["/analyze", "analyze"] and request.symbol:
-            symbol = request.symbol.upper()
-            quote = md.get_stock_quote(symbol)
-            if not quote:
-                return {"response": f"❌ Error: Could not fetch real-time data for {symbol}"}
-                
-            indicators = md.get_technical_indicators(symbol)
-            history = md.get_stock_history(symbol, period="3mo")
-            news = md.get_stock_news(symbol)
-            
-            api_key = get_setting(db, "deepseek_api_key", "")
-            ai_provider = get_setting(db, "ai_provider", "ollama")
-            engine = TradingEngine(db)
-            summary = engine.get_portfolio_summary()
-            portfolio_context = f"Portfolio equity: ${summary['total_equity']:,.2f}, Cash: ${summary['cash']:,.2f}"
-            
-            import deepseek_ai as ai
-            import global_context as _gc
-            signal_data = ai.analyze_stock(ai_provider, api_key, symbol, quote, indicators, history, news, portfolio_context, rl_lessons=rl_lessons, global_context=_gc.build_global_context())
-            
-            sig = signal_data.get("signal", "HOLD")
-            conf = signal_data.get("confidence", 0) * 100
-            reasoning = signal_data.get("reasoning", "")
-            
-            emoji = "📈" if sig == "BUY" else "📉" if sig == "SELL" else "⏸️"
-            msg = f"{emoji} **DeepSeek-R1 Analysis: {symbol}**\n"
-            msg += f"**Signal:** {sig} ({conf:.0f}% confidence)\n"
-            msg += f"**Current Price:** ${quote['current']}\n\n"
-            msg += f"**Reasoning:**\n{reasoning}\n\n"
-            
-            target = signal_data.get("target_price")
-            stop = signal_data.get("stop_loss")
-            if target: msg += f"🎯 Target: ${target}\n"
-            if stop: msg += f"🛡️ Stop Loss: ${stop}\n"
-            
-            return {"response": msg}
-            
-        else:
-            return {"response": "Unknown command. Use '/portfolio' or '/analyze AAPL'."}
-            
+        handler = _WEBHOOK_COMMANDS.get(command.split()[0])
+        if handler is None:
+            return {"response": _WEBHOOK_UNKNOWN}
+        return await handler(request, db)
     except Exception as e:
         logger.error(f"OpenClaw webhook error: {e}")
         return {"response": f"⚠️ SerenityAlphaTrader Error: {str(e)}"}
@@ -2712,18 +2937,18 @@ async def get_settings(current_user: User = Depends(get_current_user), db: Sessi
         "futu_cn_acc_id", "futu_hk_acc_id", "futu_us_acc_id",
         "ibkr_enabled", "ibkr_host", "ibkr_port", "ibkr_client_id", "ibkr_account",
     ]
-    result = {}
-    for key in keys:
-        result[key] = get_setting(db, key, current_user.id, "")
+    secret_keys = ["deepseek_api_key", "alpaca_api_key", "alpaca_secret_key"]
+    values = get_settings_bulk(db, keys + secret_keys, current_user.id)
+    result = {key: values.get(key, "") for key in keys}
 
     # Mask deepseek api key
-    api_key = get_setting(db, "deepseek_api_key", current_user.id, "")
+    api_key = values.get("deepseek_api_key", "")
     result["deepseek_api_key_set"] = bool(api_key)
     result["deepseek_api_key_preview"] = f"{api_key[:8]}..." if len(api_key) > 8 else ("" if not api_key else api_key)
 
     # Mask alpaca keys
-    alpaca_key = get_setting(db, "alpaca_api_key", current_user.id, "")
-    alpaca_secret = get_setting(db, "alpaca_secret_key", current_user.id, "")
+    alpaca_key = values.get("alpaca_api_key", "")
+    alpaca_secret = values.get("alpaca_secret_key", "")
     result["alpaca_api_key_set"] = bool(alpaca_key)
     result["alpaca_secret_key_set"] = bool(alpaca_secret)
     result["alpaca_api_key_preview"] = f"{alpaca_key[:8]}..." if len(alpaca_key) > 8 else ("" if not alpaca_key else alpaca_key)
@@ -2917,7 +3142,7 @@ async def discover_layoff_candidates(
 
     symbols = [s.upper() for s in (payload.symbols or []) if s]
     if payload.use_watchlist:
-        watchlist_json = get_setting(db, "watchlist", current_user.id, json.dumps(md.DEFAULT_WATCHLIST))
+        watchlist_json = get_setting(db, "watchlist", current_user.id, _DEFAULT_WATCHLIST_JSON)
         try:
             watchlist = json.loads(watchlist_json)
         except Exception:
@@ -2951,7 +3176,7 @@ async def reset_portfolio(current_user: User = Depends(get_current_user), db: Se
 @app.get("/api/search")
 async def search_stocks(q: str):
     """Search for stocks by symbol."""
-    results = md.search_stocks(q)
+    results = await asyncio.get_running_loop().run_in_executor(IO_POOL, md.search_stocks, q)
     return {"results": results}
 
 
@@ -3215,28 +3440,27 @@ async def rl_shadow_comparison(days: int = 7):
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
-    active_connections.append(websocket)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+    active_connections[websocket] = queue
+    sender = asyncio.create_task(_client_sender(websocket, queue))
     logger.info(f"WebSocket client connected. Total: {len(active_connections)}")
     try:
-        # Send initial data
-        if price_cache:
-            await websocket.send_text(json.dumps({
-                "type": "price_update",
-                "prices": {k: v["current"] for k, v in price_cache.items()},
-                "timestamp": datetime.utcnow().isoformat()
-            }))
+        # Send initial data (serialized once per price refresh, not per client)
+        if _price_snapshot_msg:
+            _enqueue_drop_oldest(queue, _price_snapshot_msg)
         while True:
             data = await websocket.receive_text()
-            msg = json.loads(data)
+            msg = _loads(data)
             if msg.get("type") == "ping":
-                await websocket.send_text(json.dumps({"type": "pong"}))
+                _enqueue_drop_oldest(queue, _dumps({"type": "pong"}))
     except WebSocketDisconnect:
-        active_connections.remove(websocket)
-        logger.info(f"WebSocket client disconnected. Total: {len(active_connections)}")
+        pass
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
-        if websocket in active_connections:
-            active_connections.remove(websocket)
+    finally:
+        active_connections.pop(websocket, None)
+        sender.cancel()
+        logger.info(f"WebSocket client disconnected. Total: {len(active_connections)}")
 
 
 async def background_email_reporter():
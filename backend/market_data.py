@@ -1,13 +1,20 @@
 """Market data service using yfinance + Sina Finance for global stock market data."""
 import yfinance as yf
+import numpy as np
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Optional
+from urllib.parse import quote
 import logging
 from quant_models import QuantitativeModels
 import ashare_data
+import cache
 from market_calendar import detect_market, get_currency
 
 logger = logging.getLogger(__name__)
@@ -17,7 +24,7 @@ class _TTLCache:
     """Simple thread-safe TTL cache keyed by (function_name, symbol, *args)."""
 
     def __init__(self):
-        self._store: dict = {}  # key → (value, expire_ts)
+        self._store: dict = {}  # key → (value, expire_ts, keep_until_ts)
         self._lock = threading.Lock()
         self._hits = 0
         self._misses = 0
@@ -26,16 +33,43 @@ class _TTLCache:
         with self._lock:
             entry = self._store.get(key)
             if entry:
-                if entry[1] > time.time():
+                now = time.time()
+                if entry[1] > now:
                     self._hits += 1
                     return entry[0]
-                del self._store[key]  # evict expired on access
+                if entry[2] <= now:
+                    del self._store[key]  # evict expired on access
+        # L2: another process (server / cron script) may already have fetched it
+        value, ttl = cache.cache_get(key)
+        with self._lock:
+            if value is not None:
+                self._hits += 1
+                expire = time.time() + ttl
+                self._store[key] = (value, expire, expire)
+                return value
             self._misses += 1
             return None
 
-    def set(self, key, value, ttl: int):
+    def peek(self, key, stale_for: float):
+        """L1-only lookup that tolerates expiry: (value, fresh). Entries more
+        than `stale_for` seconds past their TTL count as missing."""
+        now = time.time()
         with self._lock:
-            self._store[key] = (value, time.time() + ttl)
+            entry = self._store.get(key)
+            if entry and entry[1] + stale_for > now:
+                fresh = entry[1] > now
+                if fresh:
+                    self._hits += 1
+                return entry[0], fresh
+        return None, False
+
+    def set(self, key, value, ttl: int, stale_for: float = 0):
+        """Store `value` for `ttl` s; keep it `stale_for` s longer in L1 so
+        peek() can still serve it while a refresh runs."""
+        expire = time.time() + ttl
+        with self._lock:
+            self._store[key] = (value, expire, expire + stale_for)
+        cache.cache_set(key, value, ttl)
 
     def stats(self) -> dict:
         total = self._hits + self._misses
@@ -43,10 +77,10 @@ class _TTLCache:
         return {"hits": self._hits, "misses": self._misses, "hit_rate": f"{rate:.0f}%", "entries": len(self._store)}
 
     def evict_expired(self):
-        """Remove expired entries to free memory. Call periodically."""
+        """Remove entries past their TTL and stale window. Call periodically."""
         now = time.time()
         with self._lock:
-            expired = [k for k, (_, exp) in self._store.items() if exp <= now]
+            expired = [k for k, (_, _, keep) in self._store.items() if keep <= now]
             for k in expired:
                 del self._store[k]
 
@@ -54,10 +88,57 @@ class _TTLCache:
 _cache = _TTLCache()
 
 # TTL values (seconds) — tuned for trading data freshness
+INDEX_TTL = 60        # 1 min — index levels for the ticker tape / market overview
+INDEX_STALE_SEC = 300  # 5 min — how long past INDEX_TTL an index may be served while refreshing
 QUOTE_TTL = 300       # 5 min — quotes change frequently but 5 min is fine for analysis
+LIGHT_QUOTE_TTL = 30  # 30 s — price-only quotes are one tiny request, keep them fresh
 HISTORY_TTL = 600     # 10 min — historical OHLCV doesn't change within minutes
 INDICATORS_TTL = 600  # 10 min — derived from history, same TTL
 NEWS_TTL = 600        # 10 min — news updates are not second-critical
+INFO_TTL = 86400      # 1 day — fundamentals (FCF, debt, shares out) only change on filings
+SEARCH_TTL = 86400    # 1 day — symbol → name/exchange lookups are effectively static
+SEARCH_MISS_TTL = 60  # 1 min — an empty result may just be a failed/throttled lookup
+
+
+# ── Stale-while-revalidate ────────────────────────────────────────────────────
+# For data polled far more often than it changes (index levels, price-only
+# quotes) an expired entry is still served while one background refresh runs
+# on _io_pool, so only a cold key ever waits on Yahoo.
+_refreshing: set = set()
+_refreshing_lock = threading.Lock()
+
+
+def _refresh(cache_key, ttl: int, stale_for: float, fetch):
+    try:
+        value = fetch()
+        if value:
+            _cache.set(cache_key, value, ttl, stale_for)
+    except Exception as e:
+        logger.debug(f"[SWR] refresh of {cache_key} failed: {e}")
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(cache_key)
+
+
+def _get_swr(cache_key, ttl: int, stale_for: float, fetch):
+    """Cached fetch() that serves entries up to `stale_for` s past TTL while
+    refreshing them in the background."""
+    value, fresh = _cache.peek(cache_key, stale_for)
+    if value is not None:
+        if not fresh:
+            with _refreshing_lock:
+                start = cache_key not in _refreshing
+                _refreshing.add(cache_key)
+            if start:
+                _io_pool.submit(_refresh, cache_key, ttl, stale_for, fetch)
+        return value
+    value = _cache.get(cache_key)  # L2 / miss
+    if value is not None:
+        return value
+    value = fetch()
+    if value:
+        _cache.set(cache_key, value, ttl, stale_for)
+    return value
 
 
 def get_cache_stats() -> dict:
@@ -69,6 +150,22 @@ def evict_cache():
     """Remove expired entries to free memory."""
     _cache.evict_expired()
 
+
+# ── I/O thread pool for per-symbol Yahoo / Sina requests ─────────────────────
+# Whatever a batched download can't cover (A-shares, fundamentals, fallbacks)
+# is still one HTTP round-trip per symbol; overlap the network waits.
+_io_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="md-io")
+
+# One keep-alive session for yfinance Tickers and the direct endpoint helpers.
+# yfinance otherwise goes through module-level requests.get, i.e. a fresh
+# TCP+TLS handshake per request. The pinned yfinance's download() takes no
+# session argument, so batched downloads keep yfinance's own.
+# Sized so every _io_pool worker can hold its own pooled connection.
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+_http.headers["User-Agent"] = "Mozilla/5.0"
+
+
 # ── Global market indices ─────────────────────────────────────────────────────
 GLOBAL_INDICES = {
     # ── Americas ──────────────────────────────────────────────────────────────
@@ -135,6 +232,14 @@ GLOBAL_INDICES = {
     },
 }
 
+# Flattened once at import for get_all_indices: (region, symbol, meta, market_code)
+_FLAT_INDICES = tuple(
+    (region, symbol, meta, detect_market(symbol))
+    for region, indices in GLOBAL_INDICES.items()
+    for symbol, meta in indices.items()
+)
+_ALL_INDEX_SYMBOLS = tuple(symbol for _, symbol, _, _ in _FLAT_INDICES)
+
 # ── Popular international stocks (yfinance tickers) ───────────────────────────
 # These are organized by region for easy discovery
 
@@ -288,6 +393,9 @@ GLOBAL_POPULAR_STOCKS = {
     ],
 }
 
+# Flattened once at import: get_global_popular_stocks() with no region
+_ALL_POPULAR_STOCKS = tuple(dict.fromkeys(s for stocks in GLOBAL_POPULAR_STOCKS.values() for s in stocks))
+
 # Default watchlist (US-focused, backward compatible)
 DEFAULT_WATCHLIST = [
     # ---- AI & Semiconductors (user-prioritized — see memory feedback_report_topics) ----
@@ -316,7 +424,12 @@ DEFAULT_WATCHLIST = [
 
 
 def get_index_data(symbol: str) -> dict:
-    """Fetch current data for a market index."""
+    """Fetch current data for a market index. Cached for INDEX_TTL, served
+    stale for up to INDEX_STALE_SEC while refreshing."""
+    return _get_swr(("index", symbol), INDEX_TTL, INDEX_STALE_SEC, partial(_fetch_index_data, symbol))
+
+
+def _fetch_index_data(symbol: str) -> dict:
     # CN A-share indices → Sina Finance
     if ashare_data.is_ashare_symbol(symbol):
         data = ashare_data.get_ashare_quote(symbol)
@@ -331,42 +444,115 @@ def get_index_data(symbol: str) -> dict:
             }
         return None
     try:
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period="2d")
+        chart = _yahoo_chart(symbol, "2d", "1d")
+        bars = chart["indicators"]["quote"][0]
+        closes = [c for c in bars["close"] if c is not None]
+        if closes:
+            volumes = [v for v in bars.get("volume") or [] if v is not None]
+            return _index_from_closes(symbol, closes, volumes[-1] if volumes else 0)
+    except Exception as e:
+        logger.debug(f"[Index] chart endpoint failed for {symbol}, falling back to yfinance: {e}")
+    try:
+        ticker = yf.Ticker(symbol, session=_http)
+        hist = ticker.history(period="2d", actions=False, auto_adjust=False)
         if hist.empty:
             return None
-        current = float(hist["Close"].iloc[-1])
-        prev = float(hist["Close"].iloc[-2]) if len(hist) > 1 else current
-        change = current - prev
-        change_pct = (change / prev * 100) if prev != 0 else 0
-        return {
-            "symbol": symbol,
-            "current": round(current, 2),
-            "change": round(change, 2),
-            "change_pct": round(change_pct, 3),
-            "volume": int(hist["Volume"].iloc[-1]) if not pd.isna(hist["Volume"].iloc[-1]) else 0,
-            "currency": get_currency(symbol),
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        return _index_payload(symbol, hist)
     except Exception as e:
         logger.error(f"Error fetching index {symbol}: {e}")
         return None
 
 
-def get_all_indices() -> dict:
-    """Fetch all global market indices."""
-    from market_calendar import is_market_open, detect_market
+def _index_payload(symbol: str, hist: pd.DataFrame) -> dict:
+    """Index dict from a >=1-row daily frame (last close vs previous close)."""
+    volume = hist["Volume"].iloc[-1]
+    return _index_from_closes(symbol, hist["Close"].iloc[-2:].tolist(),
+                              0 if pd.isna(volume) else volume)
+
+
+def _index_from_closes(symbol: str, closes: list, volume) -> dict:
+    current = float(closes[-1])
+    prev = float(closes[-2]) if len(closes) > 1 else current
+    change = current - prev
+    change_pct = (change / prev * 100) if prev != 0 else 0
+    return {
+        "symbol": symbol,
+        "current": round(current, 2),
+        "change": round(change, 2),
+        "change_pct": round(change_pct, 3),
+        "volume": int(volume),
+        "currency": get_currency(symbol),
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
+def get_indices_batch(symbols: list) -> dict:
+    """
+    Index data for many symbols from one batched `yf.download` instead of one
+    `.history` request per index. Returns {symbol: index_dict}; A-share indices
+    (Sina) and anything missing from the batch go through `get_index_data`.
+    Fresh cached indices are reused and batch results populate that cache.
+    """
     result = {}
-    for region, indices in GLOBAL_INDICES.items():
-        result[region] = []
-        for symbol, meta in indices.items():
-            data = get_index_data(symbol)
-            if data:
-                mkt = detect_market(symbol)
-                data.update(meta)
-                data["market_open"] = is_market_open(mkt)
-                data["market_code"] = mkt
-                result[region].append(data)
+    pending = []
+    for symbol in dict.fromkeys(symbols):
+        cached, fresh = _cache.peek(("index", symbol), 0)
+        if fresh:
+            result[symbol] = cached
+        else:
+            pending.append(symbol)
+    ashare = [s for s in pending if ashare_data.is_ashare_symbol(s)]
+    pending = [s for s in pending if s not in ashare]
+    for symbol, data in zip(ashare, _io_pool.map(get_index_data, ashare)):
+        if data:
+            result[symbol] = data
+    if not pending:
+        return result
+
+    try:
+        frame = yf.download(" ".join(pending), period="2d", interval="1d", group_by="ticker",
+                            threads=True, progress=False, auto_adjust=False)
+    except Exception as e:
+        logger.warning(f"[IndexBatch] yf.download failed for {len(pending)} indices: {e}")
+        frame = None
+
+    missing = []
+    for symbol in pending:
+        data = None
+        if frame is not None:
+            try:
+                hist = frame[symbol] if len(pending) > 1 else frame
+                hist = hist.dropna(subset=["Close"])
+                if not hist.empty:
+                    data = _index_payload(symbol, hist)
+            except Exception as e:
+                logger.debug(f"[IndexBatch] {symbol} missing from batch: {e}")
+        if data:
+            _cache.set(("index", symbol), data, INDEX_TTL, INDEX_STALE_SEC)
+            result[symbol] = data
+        else:
+            missing.append(symbol)
+    for symbol, data in zip(missing, _io_pool.map(get_index_data, missing)):
+        if data:
+            result[symbol] = data
+    return result
+
+
+def get_all_indices() -> dict:
+    """Fetch all global market indices (one batched download for all regions)."""
+    from market_calendar import is_market_open
+    batch = get_indices_batch(_ALL_INDEX_SYMBOLS)
+    result = {region: [] for region in GLOBAL_INDICES}
+    open_by_market = {}
+    for region, symbol, meta, mkt in _FLAT_INDICES:
+        data = batch.get(symbol)
+        if data:
+            data = {**data, **meta}  # batch dicts may be shared cache entries
+            if mkt not in open_by_market:
+                open_by_market[mkt] = is_market_open(mkt)
+            data["market_open"] = open_by_market[mkt]
+            data["market_code"] = mkt
+            result[region].append(data)
     return result
 
 
@@ -374,10 +560,7 @@ def get_global_popular_stocks(region: str = None) -> list:
     """Return list of popular international stock symbols, optionally filtered by region."""
     if region and region in GLOBAL_POPULAR_STOCKS:
         return GLOBAL_POPULAR_STOCKS[region]
-    all_stocks = []
-    for stocks in GLOBAL_POPULAR_STOCKS.values():
-        all_stocks.extend(stocks)
-    return list(dict.fromkeys(all_stocks))  # deduplicate while preserving order
+    return list(_ALL_POPULAR_STOCKS)  # deduplicated, order preserved
 
 
 def _moomoo_hk_quote(symbol: str) -> dict | None:
@@ -434,6 +617,107 @@ def _moomoo_hk_quote(symbol: str) -> dict | None:
         return None
 
 
+# The `ticker.info` fields quotes and search read. marketCap / trailingPE and
+# the 52-week range move with the price, so they are kept together with the
+# price they were quoted at and re-based on the live price in _build_quote.
+_INFO_FIELDS = (
+    "longName", "shortName", "sector", "currency", "exchange",
+    "freeCashflow", "totalDebt", "totalCash", "sharesOutstanding", "dividendRate",
+    "marketCap", "trailingPE", "fiftyTwoWeekHigh", "fiftyTwoWeekLow",
+    "regularMarketPrice", "currentPrice",
+)
+
+
+def _get_info(symbol: str, ticker=None) -> dict:
+    """Fundamentals from `ticker.info`, cached for INFO_TTL. Fundamentals move
+    quarterly, so re-fetching them on every 5-min quote refresh was wasted HTTP."""
+    cache_key = ("info", symbol)
+    cached = _cache.get(cache_key)
+    if cached is not None:
+        return cached
+    info = (ticker or yf.Ticker(symbol, session=_http)).info or {}
+    info = {k: info[k] for k in _INFO_FIELDS if info.get(k) is not None}
+    _cache.set(cache_key, info, INFO_TTL)
+    return info
+
+
+def _at_price(info: dict, field: str, current: float) -> Optional[float]:
+    """A price-proportional `info` field (marketCap, trailingPE) re-based from
+    the price it was quoted at to `current`; None if either is unknown."""
+    value = info.get(field)
+    quoted_at = info.get("regularMarketPrice") or info.get("currentPrice")
+    if not value or not quoted_at:
+        return None
+    return value * current / quoted_at
+
+
+def _build_quote(symbol: str, info: dict, hist: pd.DataFrame) -> dict:
+    """Assemble the quote dict (price, fundamentals-based valuation, VPA) from
+    `ticker.info` and a recent daily OHLCV frame."""
+    o, h, l, c, v = (hist[col].to_numpy(np.float64) for col in ("Open", "High", "Low", "Close", "Volume"))
+    current = float(c[-1])
+    prev = float(c[-2]) if len(c) > 1 else current
+    change = current - prev
+    change_pct = (change / prev * 100) if prev != 0 else 0
+
+    # Extract Fundamentals for Models
+    fcf = info.get("freeCashflow", 0)
+    total_debt = info.get("totalDebt", 0)
+    cash = info.get("totalCash", 0)
+    shares_out = info.get("sharesOutstanding", 0)
+    div_rate = info.get("dividendRate", 0.0)
+
+    # Calculate Intrinsic Values
+    dcf_value = QuantitativeModels.calculate_dcf(fcf, total_debt, cash, shares_out)
+    ddm_value = QuantitativeModels.calculate_ddm(div_rate) if div_rate else 0.0
+    
+    # Use DDM for high dividend stocks, else DCF (Whichever is higher provides a safer floor, or just average)
+    intrinsic_value = ddm_value if div_rate > 0 and ddm_value > dcf_value else dcf_value
+    valuation_gap = QuantitativeModels.calculate_valuation_gap(current, intrinsic_value)
+
+    # Calculate Microstructure (VPA)
+    vpa_metrics = QuantitativeModels.analyze_volume_price_action_np(o, h, l, c, v)
+
+    # Price-derived fields from the live price, not the day-cached info
+    market_cap = _at_price(info, "marketCap", current)
+    pe_ratio = _at_price(info, "trailingPE", current)
+    high_52w = info.get("fiftyTwoWeekHigh")
+    low_52w = info.get("fiftyTwoWeekLow")
+
+    result = {
+        "symbol": symbol,
+        "name": info.get("longName", symbol),
+        "current": round(current, 2),
+        "open": round(float(o[-1]), 2),
+        "high": round(float(h[-1]), 2),
+        "low": round(float(l[-1]), 2),
+        "volume": int(v[-1]),
+        "change": round(change, 2),
+        "change_pct": round(change_pct, 3),
+        "market_cap": int(market_cap) if market_cap else None,
+        "pe_ratio": round(pe_ratio, 2) if pe_ratio else None,
+        "fifty_two_week_high": max(high_52w, round(float(h.max()), 2)) if high_52w else None,
+        "fifty_two_week_low": min(low_52w, round(float(l.min()), 2)) if low_52w else None,
+        "sector": info.get("sector", ""),
+        "currency": info.get("currency", "") or get_currency(symbol),
+        "exchange": info.get("exchange", ""),
+        "market": detect_market(symbol),
+        "timestamp": datetime.utcnow().isoformat(),
+        "dcf_value": round(dcf_value, 2),
+        "ddm_value": round(ddm_value, 2),
+        "intrinsic_value": round(intrinsic_value, 2),
+        "valuation_gap_pct": round(valuation_gap, 3),
+        # Defensive: thinly-traded HK IPO names (e.g. 0100.HK MiniMax) can
+        # yield incomplete VPA dicts when yfinance returns sparse history.
+        # Was raising KeyError 'volume_ratio' which crashed the whole quote.
+        "vpa_signal": vpa_metrics.get("vpa_signal", "NEUTRAL"),
+        "crowding": vpa_metrics.get("crowding", "NORMAL"),
+        "liquidity": vpa_metrics.get("liquidity", "UNKNOWN"),
+        "vpa_volume_ratio": vpa_metrics.get("volume_ratio", 1.0),
+    }
+    return result
+
+
 def get_stock_quote(symbol: str) -> dict:
     """Fetch current quote for a stock (all markets). Cached for 5 min."""
     cache_key = ("quote", symbol)
@@ -446,9 +730,8 @@ def get_stock_quote(symbol: str) -> dict:
             _cache.set(cache_key, result, QUOTE_TTL)
         return result
     try:
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
-        hist = ticker.history(period="20d")
+        ticker = yf.Ticker(symbol, session=_http)
+        hist = ticker.history(period="20d", actions=False)
         if hist.empty:
             # yfinance couldn't resolve — try Moomoo for HK
             mq = _moomoo_hk_quote(symbol)
@@ -456,69 +739,7 @@ def get_stock_quote(symbol: str) -> dict:
                 _cache.set(cache_key, mq, QUOTE_TTL)
             return mq
 
-        current = float(hist["Close"].iloc[-1])
-        prev = float(hist["Close"].iloc[-2]) if len(hist) > 1 else current
-        change = current - prev
-        change_pct = (change / prev * 100) if prev != 0 else 0
-
-        # Extract Fundamentals for Models
-        fcf = info.get("freeCashflow", 0)
-        total_debt = info.get("totalDebt", 0)
-        cash = info.get("totalCash", 0)
-        shares_out = info.get("sharesOutstanding", 0)
-        div_rate = info.get("dividendRate", 0.0)
-
-        # Calculate Intrinsic Values
-        dcf_value = QuantitativeModels.calculate_dcf(fcf, total_debt, cash, shares_out)
-        ddm_value = QuantitativeModels.calculate_ddm(div_rate) if div_rate else 0.0
-        
-        # Use DDM for high dividend stocks, else DCF (Whichever is higher provides a safer floor, or just average)
-        intrinsic_value = ddm_value if div_rate > 0 and ddm_value > dcf_value else dcf_value
-        valuation_gap = QuantitativeModels.calculate_valuation_gap(current, intrinsic_value)
-
-        # Calculate Microstructure (VPA)
-        hist_records = []
-        for idx, row in hist.iterrows():
-            hist_records.append({
-                "open": float(row["Open"]),
-                "high": float(row["High"]),
-                "low": float(row["Low"]),
-                "close": float(row["Close"]),
-                "volume": float(row["Volume"])
-            })
-        vpa_metrics = QuantitativeModels.analyze_volume_price_action(hist_records)
-
-        result = {
-            "symbol": symbol,
-            "name": info.get("longName", symbol),
-            "current": round(current, 2),
-            "open": round(float(hist["Open"].iloc[-1]), 2),
-            "high": round(float(hist["High"].iloc[-1]), 2),
-            "low": round(float(hist["Low"].iloc[-1]), 2),
-            "volume": int(hist["Volume"].iloc[-1]),
-            "change": round(change, 2),
-            "change_pct": round(change_pct, 3),
-            "market_cap": info.get("marketCap"),
-            "pe_ratio": info.get("trailingPE"),
-            "fifty_two_week_high": info.get("fiftyTwoWeekHigh"),
-            "fifty_two_week_low": info.get("fiftyTwoWeekLow"),
-            "sector": info.get("sector", ""),
-            "currency": info.get("currency", "") or get_currency(symbol),
-            "exchange": info.get("exchange", ""),
-            "market": detect_market(symbol),
-            "timestamp": datetime.utcnow().isoformat(),
-            "dcf_value": round(dcf_value, 2),
-            "ddm_value": round(ddm_value, 2),
-            "intrinsic_value": round(intrinsic_value, 2),
-            "valuation_gap_pct": round(valuation_gap, 3),
-            # Defensive: thinly-traded HK IPO names (e.g. 0100.HK MiniMax) can
-            # yield incomplete VPA dicts when yfinance returns sparse history.
-            # Was raising KeyError 'volume_ratio' which crashed the whole quote.
-            "vpa_signal": vpa_metrics.get("vpa_signal", "NEUTRAL"),
-            "crowding": vpa_metrics.get("crowding", "NORMAL"),
-            "liquidity": vpa_metrics.get("liquidity", "UNKNOWN"),
-            "vpa_volume_ratio": vpa_metrics.get("volume_ratio", 1.0),
-        }
+        result = _build_quote(symbol, _get_info(symbol, ticker), hist)
         _cache.set(cache_key, result, QUOTE_TTL)
         return result
     except Exception as e:
@@ -531,6 +752,106 @@ def get_stock_quote(symbol: str) -> dict:
         return None
 
 
+def get_stock_quote_light(symbol: str) -> Optional[dict]:
+    """
+    Price-only quote (current/open/high/low/volume/change) from one small
+    chart request — no fundamentals, valuation or VPA. For callers that only
+    need the price, e.g. filling a manual trade. Cached for LIGHT_QUOTE_TTL
+    and never served past it, since trades are priced from it; falls back to
+    the full get_stock_quote if the chart call fails.
+    """
+    if ashare_data.is_ashare_symbol(symbol):
+        return get_stock_quote(symbol)
+    cache_key = ("quote_light", symbol)
+    cached = _cache.get(cache_key)
+    if cached is not None:
+        return cached
+    result = _fetch_light_quote(symbol)
+    if result:
+        _cache.set(cache_key, result, LIGHT_QUOTE_TTL)
+    return result
+
+
+def _fetch_light_quote(symbol: str) -> Optional[dict]:
+    try:
+        chart = _yahoo_chart(symbol, "2d", "1d")
+        bars = chart["indicators"]["quote"][0]
+        closes = [c for c in bars["close"] if c is not None]
+        current = float(chart["meta"].get("regularMarketPrice") or closes[-1])
+        prev = float(closes[-2]) if len(closes) > 1 else current
+        change = current - prev
+        result = {
+            "symbol": symbol,
+            "current": round(current, 2),
+            "open": round(float(bars["open"][-1] or current), 2),
+            "high": round(float(bars["high"][-1] or current), 2),
+            "low": round(float(bars["low"][-1] or current), 2),
+            "volume": int(bars["volume"][-1] or 0),
+            "change": round(change, 2),
+            "change_pct": round((change / prev * 100) if prev != 0 else 0, 3),
+            "currency": chart["meta"].get("currency") or get_currency(symbol),
+            "market": detect_market(symbol),
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+    except Exception as e:
+        logger.debug(f"[LightQuote] chart endpoint failed for {symbol}, using full quote: {e}")
+        return get_stock_quote(symbol)
+    return result
+
+
+def get_stock_quotes_batch(symbols: list) -> dict:
+    """
+    Fetch quotes for many symbols with one batched `yf.download` request instead
+    of one `.history` round-trip per symbol. Returns {symbol: quote_dict} for the
+    symbols that resolved. Fresh cache entries are reused; A-shares and anything
+    the batch could not resolve fall back to `get_stock_quote` individually.
+    """
+    result = {}
+    pending = []
+    for symbol in dict.fromkeys(symbols):
+        cached = _cache.get(("quote", symbol))
+        if cached is not None:
+            result[symbol] = cached
+        elif ashare_data.is_ashare_symbol(symbol):
+            q = get_stock_quote(symbol)
+            if q:
+                result[symbol] = q
+        else:
+            pending.append(symbol)
+    if not pending:
+        return result
+
+    frames = {}
+    try:
+        data = yf.download(" ".join(pending), period="20d", interval="1d",
+                           group_by="ticker", threads=True, progress=False)
+        for symbol in pending:
+            try:
+                hist = data[symbol] if len(pending) > 1 else data
+                hist = hist.dropna(subset=["Close"])
+                if not hist.empty:
+                    frames[symbol] = hist
+            except KeyError:
+                pass
+    except Exception as e:
+        logger.warning(f"[QuoteBatch] yf.download failed for {len(pending)} symbols: {e}")
+
+    def _finish(symbol):
+        hist = frames.get(symbol)
+        try:
+            return _build_quote(symbol, _get_info(symbol), hist) if hist is not None else get_stock_quote(symbol)
+        except Exception as e:
+            logger.debug(f"[QuoteBatch] {symbol} batch build failed, falling back: {e}")
+            return get_stock_quote(symbol)
+
+    # _get_info / fallback quotes are still one HTTP call per symbol — overlap them
+    for symbol, q in zip(pending, _io_pool.map(_finish, pending)):
+        if q:
+            _cache.set(("quote", symbol), q, QUOTE_TTL)
+            result[symbol] = q
+    return result
+
+
 def get_stock_history(symbol: str, period: str = "3mo", interval: str = "1d") -> list:
     """Fetch OHLCV historical data for charting. Cached for 10 min."""
     cache_key = ("history", symbol, period, interval)
@@ -543,20 +864,11 @@ def get_stock_history(symbol: str, period: str = "3mo", interval: str = "1d") ->
             _cache.set(cache_key, result, HISTORY_TTL)
         return result
     try:
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period=period, interval=interval)
+        ticker = yf.Ticker(symbol, session=_http)
+        hist = ticker.history(period=period, interval=interval, actions=False)
         if hist.empty:
             return []
-        result = []
-        for idx, row in hist.iterrows():
-            result.append({
-                "time": int(idx.timestamp()),
-                "open": round(float(row["Open"]), 4),
-                "high": round(float(row["High"]), 4),
-                "low": round(float(row["Low"]), 4),
-                "close": round(float(row["Close"]), 4),
-                "volume": int(row["Volume"]) if not pd.isna(row["Volume"]) else 0,
-            })
+        result = _history_records(hist)
         _cache.set(cache_key, result, HISTORY_TTL)
         return result
     except Exception as e:
@@ -564,6 +876,27 @@ def get_stock_history(symbol: str, period: str = "3mo", interval: str = "1d") ->
         return []
 
 
+def _history_records(hist: pd.DataFrame) -> list:
+    """OHLCV frame -> chart-ready list of {time, open, high, low, close, volume}."""
+    # Pull each column out once instead of building a Series per row (iterrows)
+    times = (hist.index.asi8 // 10**9).tolist()
+    cols = [np.round(hist[c].to_numpy(np.float64), 4).tolist() for c in ("Open", "High", "Low", "Close")]
+    volumes = np.nan_to_num(hist["Volume"].to_numpy(np.float64), nan=0.0).astype(np.int64).tolist()
+    return [
+        {"time": t, "open": o, "high": h, "low": l, "close": c, "volume": v}
+        for t, o, h, l, c, v in zip(times, *cols, volumes)
+    ]
+
+
+_HISTORY_FIELDS = ("time", "open", "high", "low", "close", "volume")
+
+
+def history_columns(records: list) -> dict:
+    """Row records -> {"time": [...], "open": [...], ...} for API responses.
+    Column arrays repeat no keys, so the JSON is a fraction of the row form."""
+    return {f: [r[f] for r in records] for f in _HISTORY_FIELDS}
+
+
 def get_technical_indicators(symbol: str) -> dict:
     """Calculate basic technical indicators. Cached for 10 min."""
     cache_key = ("indicators", symbol)
@@ -576,80 +909,11 @@ def get_technical_indicators(symbol: str) -> dict:
             _cache.set(cache_key, result, INDICATORS_TTL)
         return result
     try:
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period="6mo")
+        hist = _daily_window(symbol)
         if hist.empty or len(hist) < 20:
             return {}
 
-        closes = hist["Close"]
-        highs  = hist["High"]
-        lows   = hist["Low"]
-        volumes = hist["Volume"]
-
-        # ATR (Average True Range, 14-day) — used for adaptive stop-loss
-        prev_close = closes.shift(1)
-        tr = (highs - lows).combine(
-            (highs - prev_close).abs(), max
-        ).combine(
-            (lows - prev_close).abs(), max
-        )
-        atr14 = float(tr.rolling(14).mean().iloc[-1]) if len(tr) >= 14 else float(highs.iloc[-1] - lows.iloc[-1])
-
-        # Moving averages
-        ma20 = float(closes.rolling(20).mean().iloc[-1])
-        ma50 = float(closes.rolling(50).mean().iloc[-1]) if len(closes) >= 50 else None
-        ma200 = float(closes.rolling(200).mean().iloc[-1]) if len(closes) >= 200 else None
-
-        # RSI
-        delta = closes.diff()
-        gain = delta.clip(lower=0).rolling(14).mean()
-        loss = (-delta.clip(upper=0)).rolling(14).mean()
-        rs = gain / loss
-        rsi = float(100 - (100 / (1 + rs)).iloc[-1])
-
-        # MACD
-        ema12 = closes.ewm(span=12).mean()
-        ema26 = closes.ewm(span=26).mean()
-        macd = float((ema12 - ema26).iloc[-1])
-        signal = float((ema12 - ema26).ewm(span=9).mean().iloc[-1])
-
-        # Bollinger Bands
-        bb_mid = float(closes.rolling(20).mean().iloc[-1])
-        bb_std = float(closes.rolling(20).std().iloc[-1])
-        bb_upper = bb_mid + 2 * bb_std
-        bb_lower = bb_mid - 2 * bb_std
-
-        current = float(closes.iloc[-1])
-        avg_volume = float(volumes.rolling(20).mean().iloc[-1])
-        volume_ratio = float(volumes.iloc[-1]) / avg_volume if avg_volume > 0 else 1
-
-        # RSI State
-        rsi_state = "NEUTRAL"
-        if rsi > 70: rsi_state = "OVERBOUGHT"
-        elif rsi < 30: rsi_state = "OVERSOLD"
-        
-        # MA200 Distance
-        dist_ma200 = ((current - ma200) / ma200) if ma200 else 0
-
-        result = {
-            "ma20": round(ma20, 2),
-            "ma50": round(ma50, 2) if ma50 else None,
-            "ma200": round(ma200, 2) if ma200 else None,
-            "dist_from_ma200_pct": round(dist_ma200 * 100, 2) if ma200 else 0,
-            "rsi": round(rsi, 2),
-            "rsi_state": rsi_state,
-            "macd": round(macd, 4),
-            "macd_signal": round(signal, 4),
-            "bb_upper": round(bb_upper, 2),
-            "bb_mid": round(bb_mid, 2),
-            "bb_lower": round(bb_lower, 2),
-            "volume_ratio": round(volume_ratio, 2),
-            "above_ma20": current > ma20,
-            "above_ma50": current > ma50 if ma50 else None,
-            "above_ma200": current > ma200 if ma200 else None,
-            "atr14": round(atr14, 4),
-            "atr14_pct": round(atr14 / current * 100, 2) if current > 0 else 0,
-        }
+        result = _indicators_from_hist(hist)
         _cache.set(cache_key, result, INDICATORS_TTL)
         return result
     except Exception as e:
@@ -657,6 +921,151 @@ def get_technical_indicators(symbol: str) -> dict:
         return {}
 
 
+# ── Rolling 6mo daily window per symbol ───────────────────────────────────────
+# Every indicator refresh used to re-download six months of bars to learn
+# about the newest one or two. Keep the window in memory and top it up with a
+# 5-day download; a full refetch happens when the window is missing, a day
+# old (so split/dividend re-adjustments get picked up) or no longer overlaps.
+_OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+DAILY_WINDOW_REFRESH = 86400  # 1 day
+
+_daily_windows: dict = {}  # symbol -> (frame, fetched_at)
+_daily_windows_lock = threading.Lock()
+
+
+def _daily_window(symbol: str) -> pd.DataFrame:
+    """Trailing ~6mo of daily OHLCV bars for a Yahoo symbol."""
+    ticker = yf.Ticker(symbol, session=_http)
+    now = time.time()
+    with _daily_windows_lock:
+        entry = _daily_windows.get(symbol)
+
+    if entry is not None and now - entry[1] < DAILY_WINDOW_REFRESH:
+        frame, fetched_at = entry
+        recent = ticker.history(period="5d", actions=False)
+        # The top-up must overlap the held window, otherwise bars are missing
+        if not recent.empty and recent.index[0] <= frame.index[-1]:
+            merged = pd.concat([frame[frame.index < recent.index[0]], recent[_OHLCV_COLUMNS]])
+            window = merged[merged.index > merged.index[-1] - pd.DateOffset(months=6)]
+            with _daily_windows_lock:
+                _daily_windows[symbol] = (window, fetched_at)
+            return window
+
+    hist = ticker.history(period="6mo", actions=False)
+    if not hist.empty:
+        with _daily_windows_lock:
+            _daily_windows[symbol] = (hist[_OHLCV_COLUMNS], now)
+    return hist
+
+
+def _indicators_from_hist(hist: pd.DataFrame) -> dict:
+    """Run _compute_indicators on a ~6mo daily frame. The math only touches the
+    trailing windows, so it runs inline; shipping the frame to a worker process
+    would cost more than the calculation."""
+    return _compute_indicators(hist[["High", "Low", "Close", "Volume"]])
+
+
+def _ewm_mean(x: np.ndarray, span: int) -> np.ndarray:
+    """pandas `Series.ewm(span=span).mean()` (adjust=True) in one O(N) pass."""
+    decay = 1.0 - 2.0 / (span + 1.0)
+    out = np.empty_like(x)
+    num = den = 0.0
+    for i, v in enumerate(x):
+        num = v + decay * num
+        den = 1.0 + decay * den
+        out[i] = num / den
+    return out
+
+
+def _indicator_scalars_np(highs, lows, closes, volumes) -> tuple:
+    """NumPy twin of indicators_numba.compute_indicator_scalars (same tuple)."""
+    n = len(closes)
+
+    # ATR (Average True Range, 14-day) — used for adaptive stop-loss
+    prev_close = np.concatenate(([np.nan], closes[:-1]))
+    tr = np.fmax(highs - lows, np.fmax(np.abs(highs - prev_close), np.abs(lows - prev_close)))
+    atr14 = tr[-14:].mean() if n >= 14 else highs[-1] - lows[-1]
+
+    # Moving averages
+    ma20 = closes[-20:].mean()
+    ma50 = closes[-50:].mean() if n >= 50 else np.nan
+    ma200 = closes[-200:].mean() if n >= 200 else np.nan
+
+    # RSI (simple 14-day mean of gains / losses)
+    delta = np.diff(closes[-15:])
+    gain = np.clip(delta, 0, None).mean()
+    loss = np.clip(-delta, 0, None).mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + gain / loss))
+
+    # MACD
+    macd_line = _ewm_mean(closes, 12) - _ewm_mean(closes, 26)
+    signal = _ewm_mean(macd_line, 9)[-1]
+
+    # Bollinger Bands
+    bb_std = closes[-20:].std(ddof=1)
+
+    return atr14, ma20, ma50, ma200, rsi, macd_line[-1], signal, bb_std, volumes[-20:].mean()
+
+
+try:
+    from indicators_numba import compute_indicator_scalars as _indicator_scalars
+except ImportError:  # numba not installed
+    _indicator_scalars = _indicator_scalars_np
+
+
+def _compute_indicators(hist: pd.DataFrame) -> dict:
+    """Pure indicator math over a daily OHLCV frame. Works on float64 arrays
+    and only evaluates the trailing window each indicator reports, rather than
+    full rolling series."""
+    closes = hist["Close"].to_numpy(np.float64)
+    highs = hist["High"].to_numpy(np.float64)
+    lows = hist["Low"].to_numpy(np.float64)
+    volumes = hist["Volume"].to_numpy(np.float64)
+
+    atr14, ma20, ma50, ma200, rsi, macd, signal, bb_std, avg_volume = (
+        float(x) for x in _indicator_scalars(highs, lows, closes, volumes)
+    )
+    ma50 = None if np.isnan(ma50) else ma50
+    ma200 = None if np.isnan(ma200) else ma200
+
+    bb_mid = ma20
+    bb_upper = bb_mid + 2 * bb_std
+    bb_lower = bb_mid - 2 * bb_std
+
+    current = float(closes[-1])
+    volume_ratio = float(volumes[-1]) / avg_volume if avg_volume > 0 else 1
+
+    # RSI State
+    rsi_state = "NEUTRAL"
+    if rsi > 70: rsi_state = "OVERBOUGHT"
+    elif rsi < 30: rsi_state = "OVERSOLD"
+    
+    # MA200 Distance
+    dist_ma200 = ((current - ma200) / ma200) if ma200 else 0
+
+    result = {
+        "ma20": round(ma20, 2),
+        "ma50": round(ma50, 2) if ma50 else None,
+        "ma200": round(ma200, 2) if ma200 else None,
+        "dist_from_ma200_pct": round(dist_ma200 * 100, 2) if ma200 else 0,
+        "rsi": round(rsi, 2),
+        "rsi_state": rsi_state,
+        "macd": round(macd, 4),
+        "macd_signal": round(signal, 4),
+        "bb_upper": round(bb_upper, 2),
+        "bb_mid": round(bb_mid, 2),
+        "bb_lower": round(bb_lower, 2),
+        "volume_ratio": round(volume_ratio, 2),
+        "above_ma20": current > ma20,
+        "above_ma50": current > ma50 if ma50 else None,
+        "above_ma200": current > ma200 if ma200 else None,
+        "atr14": round(atr14, 4),
+        "atr14_pct": round(atr14 / current * 100, 2) if current > 0 else 0,
+    }
+    return result
+
+
 def get_stock_news(symbol: str, limit: int = 5) -> list:
     """Fetch recent news for a stock. Cached for 10 min."""
     cache_key = ("news", symbol, limit)
@@ -669,16 +1078,8 @@ def get_stock_news(symbol: str, limit: int = 5) -> list:
             _cache.set(cache_key, result, NEWS_TTL)
         return result
     try:
-        ticker = yf.Ticker(symbol)
-        news = ticker.news or []
-        result = []
-        for item in news[:limit]:
-            result.append({
-                "title": item.get("title", ""),
-                "publisher": item.get("publisher", ""),
-                "link": item.get("link", ""),
-                "published": item.get("providerPublishTime", 0),
-            })
+        ticker = yf.Ticker(symbol, session=_http)
+        result = _news_records(ticker.news or [], limit)
         _cache.set(cache_key, result, NEWS_TTL)
         return result
     except Exception as e:
@@ -686,10 +1087,132 @@ def get_stock_news(symbol: str, limit: int = 5) -> list:
         return []
 
 
+def _news_records(news: list, limit: int) -> list:
+    result = []
+    for item in news[:limit]:
+        result.append({
+            "title": item.get("title", ""),
+            "publisher": item.get("publisher", ""),
+            "link": item.get("link", ""),
+            "published": item.get("providerPublishTime", 0),
+        })
+    return result
+
+
+# Daily-bar periods ordered by length; get_full_snapshot fetches the longer of
+# the requested chart period and the 6mo window the indicators need.
+_SNAPSHOT_PERIODS = ("1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "max")
+
+
+def get_full_snapshot(symbol: str, period: str = "3mo") -> dict:
+    """
+    Quote, chart history, indicators and news for one symbol from a single
+    `yf.Ticker` and a single daily `.history` download, instead of four
+    independent fetches. Each part is read from / written to the same cache
+    entries the individual getters use. Returns {"quote", "history",
+    "indicators", "news"}; quote is None if the symbol cannot be resolved.
+    """
+    if ashare_data.is_ashare_symbol(symbol) or period not in _SNAPSHOT_PERIODS:
+        return {
+            "quote": get_stock_quote(symbol),
+            "history": get_stock_history(symbol, period=period),
+            "indicators": get_technical_indicators(symbol),
+            "news": get_stock_news(symbol),
+        }
+
+    quote = _cache.get(("quote", symbol))
+    history = _cache.get(("history", symbol, period, "1d"))
+    indicators = _cache.get(("indicators", symbol))
+    news = _cache.get(("news", symbol, 5))
+
+    try:
+        ticker = yf.Ticker(symbol, session=_http)
+        if quote is None or history is None or indicators is None:
+            fetch_period = max(period, "6mo", key=_SNAPSHOT_PERIODS.index)
+            hist = ticker.history(period=fetch_period, actions=False)
+            if not hist.empty:
+                last = hist.index[-1]
+                if quote is None:
+                    recent = hist[hist.index > last - pd.Timedelta(days=20)]
+                    quote = _build_quote(symbol, _get_info(symbol, ticker), recent)
+                    _cache.set(("quote", symbol), quote, QUOTE_TTL)
+                if history is None:
+                    chart = hist if period == fetch_period else hist[hist.index > last - _period_offset(period)]
+                    history = _history_records(chart)
+                    _cache.set(("history", symbol, period, "1d"), history, HISTORY_TTL)
+                if indicators is None:
+                    window = hist[hist.index > last - pd.DateOffset(months=6)]
+                    indicators = _indicators_from_hist(window) if len(window) >= 20 else {}
+                    if indicators:
+                        _cache.set(("indicators", symbol), indicators, INDICATORS_TTL)
+        if news is None:
+            news = _news_records(ticker.news or [], 5)
+            _cache.set(("news", symbol, 5), news, NEWS_TTL)
+    except Exception as e:
+        logger.warning(f"[Snapshot] {symbol} combined fetch failed, using individual getters: {e}")
+
+    return {
+        "quote": quote if quote is not None else get_stock_quote(symbol),
+        "history": history if history is not None else get_stock_history(symbol, period=period),
+        "indicators": indicators if indicators is not None else get_technical_indicators(symbol),
+        "news": news if news is not None else get_stock_news(symbol),
+    }
+
+
+def _period_offset(period: str) -> pd.DateOffset:
+    """yfinance period string ("3mo", "1y") -> pandas offset for slicing a frame."""
+    if period.endswith("mo"):
+        return pd.DateOffset(months=int(period[:-2]))
+    return pd.DateOffset(years=int(period[:-1]))
+
+
+_YAHOO_SEARCH_URL = "https://query2.finance.yahoo.com/v1/finance/search"
+_YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+
+
+def _yahoo_chart(symbol: str, rng: str, interval: str) -> dict:
+    """First result of Yahoo's v8 chart endpoint — the same JSON yfinance parses
+    for `.history`, without building a Ticker or a DataFrame. Raises on any
+    HTTP error or schema mismatch so callers can fall back to yfinance."""
+    resp = _http.get(
+        _YAHOO_CHART_URL.format(symbol=quote(symbol, safe="")),
+        params={"range": rng, "interval": interval},
+        timeout=5,
+    )
+    resp.raise_for_status()
+    return resp.json()["chart"]["result"][0]
+
+
+def _yahoo_symbol_search(symbol: str) -> Optional[dict]:
+    """Exact-symbol hit from Yahoo's ~2 KB search endpoint (name/exchange/sector),
+    instead of the full quoteSummary behind `ticker.info`. None if not found."""
+    resp = _http.get(
+        _YAHOO_SEARCH_URL,
+        params={"q": symbol, "quotesCount": 5, "newsCount": 0},
+        timeout=5,
+    )
+    resp.raise_for_status()
+    for item in resp.json().get("quotes", []):
+        if item.get("symbol", "").upper() == symbol.upper():
+            return item
+    return None
+
+
 def search_stocks(query: str) -> list:
-    """Search for stocks by symbol or name (global markets)."""
-    results = []
+    """Search for stocks by symbol or name (global markets). Cached for 1 day;
+    empty results only briefly, since lookup errors are swallowed into them."""
     q = query.strip()
+    cache_key = ("search", q)
+    cached = _cache.get(cache_key)
+    if cached is not None:
+        return cached
+    results = _search_stocks(q)
+    _cache.set(cache_key, results, SEARCH_TTL if results else SEARCH_MISS_TTL)
+    return results
+
+
+def _search_stocks(q: str) -> list:
+    results = []
 
     # Try as-is first (handles AAPL, 0700.HK, 600519.SH, SAP.DE, etc.)
     for sym in [q, q.upper()]:
@@ -707,8 +1230,22 @@ def search_stocks(query: str) -> list:
                     })
                     return results
             else:
-                ticker = yf.Ticker(sym)
-                info = ticker.info
+                try:
+                    match = _yahoo_symbol_search(sym)
+                except Exception as e:
+                    logger.debug(f"[Search] Yahoo search endpoint failed for {sym}: {e}")
+                    match = None
+                if match:
+                    results.append({
+                        "symbol": sym.upper(),
+                        "name": match.get("longname") or match.get("shortname", sym),
+                        "exchange": match.get("exchange", ""),
+                        "sector": match.get("sector", ""),
+                        "currency": get_currency(sym),
+                        "market": detect_market(sym),
+                    })
+                    return results
+                info = _get_info(sym.upper())
                 if info.get("longName") or info.get("shortName"):
                     results.append({
                         "symbol": sym.upper(),
@@ -744,12 +1281,8 @@ def get_multi_market_quotes(symbols: list) -> dict:
     Batch-fetch quotes for a list of symbols from multiple markets.
     Returns {symbol: quote_dict} mapping.
     """
-    result = {}
-    for symbol in symbols:
-        try:
-            quote = get_stock_quote(symbol)
-            if quote:
-                result[symbol] = quote
-        except Exception as e:
-            logger.debug(f"[MultiMarket] Could not fetch {symbol}: {e}")
-    return result
+    try:
+        return get_stock_quotes_batch(symbols)
+    except Exception as e:
+        logger.debug(f"[MultiMarket] Batch fetch failed: {e}")
+        return {}
@@ -11,15 +11,189 @@ The system checks:
 2. News from known competitors/disruptors
 3. AI analyzes cross-company impact
 """
+import io
 import logging
+import re
+import threading
+import time
 import xml.etree.ElementTree as ET
 import requests
-import yfinance as yf
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
+from typing import Optional
+
+import cache
+
+try:
+    import ahocorasick  # pyahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    _HAS_AHOCORASICK = False
+
+try:
+    import hyperscan  # Intel Hyperscan literal/regex matcher
+    _HAS_HYPERSCAN = True
+except ImportError:
+    _HAS_HYPERSCAN = False
+
+try:
+    from lxml import etree as LET  # libxml2-backed; tolerates malformed feeds
+    _HAS_LXML = True
+except ImportError:
+    _HAS_LXML = False
+
+try:
+    from keywords_numba import pack_utf8, scan_titles as _scan_titles
+except ImportError:  # numba not installed
+    _scan_titles = None
 
 logger = logging.getLogger(__name__)
 
+# News fetching is pure network wait (yfinance JSON + Yahoo RSS), so fan the
+# per-ticker requests out. Only leaf fetches run here — never submit work that
+# itself waits on this pool, or every worker can end up blocked.
+_FETCH_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="news-io")
+
+# One keep-alive session for every RSS / news-page request, so repeat fetches
+# to the same hosts reuse pooled TLS connections instead of handshaking again.
+# Only connection failures are retried (read=0): retrying a read timeout would
+# triple the worst-case wait on a slow feed.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                                       max_retries=Retry(total=2, read=0, backoff_factor=0.2)))
+
+
+class _HyperscanAutomaton:
+    """
+    The same add_word / make_automaton / iter interface over a compiled
+    Hyperscan database, so one scan of the headline bytes reports every
+    keyword. Reported ends are byte offsets; callers only use the values.
+    A database has a single scratch space, so scans are serialised.
+    """
+
+    def __init__(self):
+        self._values = []
+        self._patterns = []
+        self._db = None
+        self._lock = threading.Lock()
+
+    def add_word(self, key: str, value) -> None:
+        self._patterns.append(re.escape(key).encode())
+        self._values.append(value)
+
+    def make_automaton(self) -> None:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=self._patterns,
+            ids=list(range(len(self._patterns))),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(self._patterns),
+        )
+        self._db = db
+
+    def iter(self, text: str):
+        hits = []
+        values = self._values
+
+        def on_match(pattern_id, _start, end, _flags, _context):
+            hits.append((end - 1, values[pattern_id]))
+
+        with self._lock:
+            self._db.scan(text.encode(), match_event_handler=on_match)
+        return iter(hits)
+
+
+# Batches at least this large go through the compiled kernel when numba is
+# installed; below it, packing the titles into a byte buffer costs more than
+# the str.find pass it replaces.
+_NUMBA_MIN_TITLES = 2000
+
+# Without a compiled automaton the matcher falls back to one C-level substring
+# scan per keyword. A compiled `kw1|kw2|...` regex is not a usable alternative:
+# sre tries the alternatives at each position (no faster than the scans on 9-22
+# keywords) and reports non-overlapping matches only, so "trump xi summit"
+# would hide "xi summit".
+class _KeywordMatcher:
+    """
+    Which of a fixed keyword list occur in a headline. Built once per keyword
+    list at import: with hyperscan or pyahocorasick installed one walk over
+    the title finds every keyword instead of one substring scan per keyword.
+    match() returns keywords in list order, duplicates included, same as
+    `[kw for kw in keywords if kw in title_lower]`.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = tuple(k.lower() for k in keywords)
+        self._automaton = None
+        self._packed_keywords = None  # numba batch path, packed on first use
+        if not self.keywords or not all(self.keywords):
+            return
+        if _HAS_HYPERSCAN:
+            automaton = _HyperscanAutomaton()
+        elif _HAS_AHOCORASICK:
+            automaton = ahocorasick.Automaton()
+        else:
+            return
+        for kw in set(self.keywords):
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+        self._automaton = automaton
+
+    def found(self, title_lower: str) -> set:
+        """Set of keywords occurring in the title."""
+        if self._automaton is None:
+            return {kw for kw in self.keywords if kw in title_lower}
+        return {kw for _end, kw in self._automaton.iter(title_lower)}
+
+    def found_many(self, titles_lower: list) -> list:
+        """
+        found() for a batch of titles. Without an automaton, the titles are
+        joined into one string and each keyword is located with str.find over
+        the whole batch: K C-level scans in total instead of K per title.
+        Matching stays on str: lowercased headlines are compact 1-byte strings
+        that use the same fastsearch as bytes, and `in` on bytes measured ~3x
+        slower here (buffer-protocol overhead per test).
+        """
+        if self._automaton is not None or len(titles_lower) < 8:
+            return [self.found(t) for t in titles_lower]
+        if _scan_titles is not None and len(titles_lower) >= _NUMBA_MIN_TITLES:
+            return self._found_many_numba(titles_lower)
+        corpus = "\n".join(titles_lower)
+        starts = [0]
+        for t in titles_lower[:-1]:
+            starts.append(starts[-1] + len(t) + 1)
+        found = [set() for _ in titles_lower]
+        last = len(starts) - 1
+        for kw in set(self.keywords):
+            pos = corpus.find(kw)
+            while pos != -1:
+                i = bisect_right(starts, pos) - 1
+                found[i].add(kw)
+                pos = corpus.find(kw, starts[i + 1]) if i < last else -1
+        return found
+
+    def _found_many_numba(self, titles_lower: list) -> list:
+        distinct = tuple(dict.fromkeys(self.keywords))
+        if self._packed_keywords is None:
+            self._packed_keywords = pack_utf8(distinct)
+        hits = _scan_titles(*pack_utf8(titles_lower), *self._packed_keywords)
+        found = [set() for _ in titles_lower]
+        rows, cols = hits.nonzero()
+        for i, j in zip(rows.tolist(), cols.tolist()):
+            found[i].add(distinct[j])
+        return found
+
+    def match(self, title_lower: str) -> list:
+        if self._automaton is None:
+            return [kw for kw in self.keywords if kw in title_lower]
+        found = self.found(title_lower)
+        return [kw for kw in self.keywords if kw in found] if found else []
+
+
 # ── Competitive Threat Map ───────────────────────────────────────────────────
 # Maps watchlist stocks to companies whose news could threaten them.
 # When we detect significant news from a DISRUPTOR, we flag the TARGET for analysis.
@@ -82,22 +256,6 @@ COMPETITIVE_THREAT_MAP = {
         ],
         "vulnerability": "EV market share and FSD timeline",
     },
-    # Gold / Safe Haven ETFs
-    "GLD": {
-        "disruptors": [],
-        "threat_keywords": ["rate hike", "Fed hawkish", "dollar surge", "crypto replaces gold"],
-        "vulnerability": "Rate hikes reduce gold appeal; strong dollar hurts gold",
-    },
-    "IAU": {
-        "disruptors": [],
-        "threat_keywords": ["rate hike", "Fed hawkish", "dollar surge"],
-        "vulnerability": "Same as GLD - rate sensitivity",
-    },
-    "SLV": {
-        "disruptors": [],
-        "threat_keywords": ["industrial demand drop", "rate hike", "dollar surge", "recession"],
-        "vulnerability": "Industrial demand + rate sensitivity",
-    },
     # Crypto Proxies
     "MSTR": {
         "disruptors": [],
@@ -176,36 +334,57 @@ COMPETITIVE_THREAT_MAP = {
         ],
         "vulnerability": "3x leveraged semiconductor ETF - amplifies any chip sector downside; tariffs hurt TSMC/ASML supply chains",
     },
-    # ── Gold / Silver ETFs: tariff & crisis beneficiaries ────────────────────
+    # ── Gold / Silver ETFs: rate sensitivity + tariff & crisis beneficiaries ──
+    # One entry per symbol: these used to be defined twice, and the second
+    # (tariff) block silently replaced the first (rate-hike) one.
     "GLD": {
         "disruptors": [],
         "threat_keywords": [
+            "rate hike", "Fed hawkish", "dollar surge", "crypto replaces gold",
             "tariff", "trade war", "global tariff", "Trump tariff",
             "recession", "inflation surge", "dollar weakness", "safe haven",
             "geopolitical risk", "market crash", "intelligence crisis"
         ],
-        "vulnerability": "Gold rises on tariff/crisis fear — POSITIVE signal for GLD",
+        "vulnerability": "Rate hikes / strong dollar reduce gold appeal; gold rises on tariff/crisis fear — POSITIVE signal for GLD",
     },
     "IAU": {
         "disruptors": [],
         "threat_keywords": [
+            "rate hike", "Fed hawkish", "dollar surge",
             "tariff", "trade war", "global tariff", "Trump tariff",
             "recession", "inflation surge", "dollar weakness", "safe haven",
             "geopolitical risk", "market crash", "intelligence crisis"
         ],
-        "vulnerability": "Gold ETF rises on tariff/crisis fear — POSITIVE signal for IAU",
+        "vulnerability": "Same rate sensitivity as GLD; gold ETF rises on tariff/crisis fear — POSITIVE signal for IAU",
     },
     "SLV": {
         "disruptors": [],
         "threat_keywords": [
+            "industrial demand drop", "rate hike", "dollar surge",
             "tariff", "trade war", "silver demand", "safe haven",
             "inflation hedge", "precious metals", "dollar collapse",
             "market crash", "recession"
         ],
-        "vulnerability": "Silver ETF benefits from tariff inflation + industrial demand — POSITIVE signal for SLV",
+        "vulnerability": "Industrial demand + rate sensitivity; silver ETF benefits from tariff inflation — POSITIVE signal for SLV",
     },
 }
 
+_THREAT_MATCHERS = {
+    symbol: _KeywordMatcher(cfg["threat_keywords"]) for symbol, cfg in COMPETITIVE_THREAT_MAP.items()
+}
+# One matcher over every distinct threat keyword, so scan_all_threats matches
+# each headline once for all targets.
+_THREAT_MASTER_MATCHER = _KeywordMatcher(
+    sorted({kw for matcher in _THREAT_MATCHERS.values() for kw in matcher.keywords})
+)
+# Reverse index keyword -> targets listing it: a headline only needs checking
+# against the targets that own one of its keywords.
+_THREAT_KEYWORD_OWNERS = {}
+for _symbol, _matcher in _THREAT_MATCHERS.items():
+    for _kw in _matcher.keywords:
+        _THREAT_KEYWORD_OWNERS.setdefault(_kw, set()).add(_symbol)
+del _symbol, _matcher, _kw
+
 # Bonus: disruptors not in watchlist but whose news matters
 DISRUPTOR_TICKERS = {
     "anthropic": None,  # Private company - monitor via news search on other stocks
@@ -221,26 +400,86 @@ DISRUPTOR_TICKERS = {
 }
 
 
+def _fetch_feeds(sources: list, timeout: int, headers: dict) -> list:
+    """
+    GET every source["url"] concurrently, so a multi-feed fetch takes about as
+    long as its slowest feed instead of the sum. Returns responses in source
+    order, with the exception in place of any request that failed.
+    """
+    def _get(source):
+        try:
+            return _SESSION.get(source["url"], timeout=timeout, headers=headers)
+        except Exception as e:
+            return e
+    return list(_FETCH_POOL.map(_get, sources))
+
+
+# SPY/QQQ/GLD and friends are macro proxies, threat disruptors and watchlist
+# targets at once; one yfinance call per (symbol, hours_back) per few minutes
+# serves all of those paths.
+_RECENT_NEWS_CACHE: dict = {}  # (symbol, hours_back) -> (items, fetched_at monotonic)
+_RECENT_NEWS_TTL_SEC = 300
+_RECENT_NEWS_LOCK = threading.Lock()
+
+
 def fetch_recent_news(symbol: str, hours_back: int = 24) -> list:
-    """Fetch recent news for a symbol from yfinance."""
+    """Fetch recent news for a symbol from yfinance.
+    Cached per (symbol, hours_back) for _RECENT_NEWS_TTL_SEC; treat as read-only."""
+    key = (symbol, hours_back)
+    now = time.monotonic()
+    with _RECENT_NEWS_LOCK:
+        entry = _RECENT_NEWS_CACHE.get(key)
+    if entry and now - entry[1] < _RECENT_NEWS_TTL_SEC:
+        return entry[0]
+    import yfinance as yf  # deferred: pulls in pandas/numpy, not needed by the context builders
     try:
         ticker = yf.Ticker(symbol)
         news = ticker.news or []
-        cutoff = datetime.utcnow() - timedelta(hours=hours_back)
-        recent = []
-        for item in news:
-            pub_time = datetime.utcfromtimestamp(item.get("providerPublishTime", 0))
-            if pub_time >= cutoff:
-                recent.append({
-                    "title": item.get("title", ""),
-                    "publisher": item.get("publisher", ""),
-                    "time": pub_time.isoformat(),
-                    "symbol": symbol,
-                })
-        return recent
+        recent = list(_iter_yf_news(symbol, news, time.time() - hours_back * 3600))
     except Exception as e:
-        logger.debug(f"[NewsIntel] Could not fetch news for {symbol}: {e}")
-        return []
+        logger.debug("[NewsIntel] Could not fetch news for %s: %s", symbol, e)
+        return []  # not cached: retry on the next call
+    with _RECENT_NEWS_LOCK:
+        if len(_RECENT_NEWS_CACHE) > 1024:  # drop expired entries now and then
+            for k in [k for k, (_, ts) in _RECENT_NEWS_CACHE.items() if now - ts >= _RECENT_NEWS_TTL_SEC]:
+                del _RECENT_NEWS_CACHE[k]
+        _RECENT_NEWS_CACHE[key] = (recent, now)
+    return recent
+
+
+def _iter_yf_news(symbol: str, news: list, cutoff_ts: float):
+    """Yield news dicts for yfinance items published at or after `cutoff_ts`."""
+    for item in news:
+        # Compare raw epoch seconds; only build datetimes for kept items
+        pub_ts = item.get("providerPublishTime", 0)
+        if pub_ts >= cutoff_ts:
+            yield {
+                "title": item.get("title", ""),
+                "publisher": item.get("publisher", ""),
+                "time": _utc_from_ts(pub_ts).isoformat(),
+                "symbol": symbol,
+            }
+
+
+def _utcnow() -> datetime:
+    """Naive UTC now, the form every timestamp in this module uses
+    (datetime.utcnow() is deprecated as of Python 3.12)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _utc_from_ts(ts: float) -> datetime:
+    """Naive UTC datetime for an epoch timestamp (replaces utcfromtimestamp)."""
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None)
+
+
+_DC_CREATOR = "{http://purl.org/dc/elements/1.1/}creator"
+
+
+@lru_cache(maxsize=4096)
+def _parse_pub_date(text: str) -> datetime:
+    """RFC 2822 pubDate -> naive datetime (offset dropped, as before). Memoized:
+    feeds are re-polled every few minutes and mostly repeat the same items."""
+    return parsedate_to_datetime(text).replace(tzinfo=None)
 
 
 def _fetch_rss_news(symbol: str, hours_back: int = 24) -> list:
@@ -252,42 +491,53 @@ def _fetch_rss_news(symbol: str, hours_back: int = 24) -> list:
         f"https://feeds.finance.yahoo.com/rss/2.0/headline"
         f"?s={symbol}&region=US&lang=en-US"
     )
-    cutoff = datetime.utcnow() - timedelta(hours=hours_back)
+    cutoff = _utcnow() - timedelta(hours=hours_back)
     recent = []
     try:
-        resp = requests.get(url, timeout=10, headers={"User-Agent": "SerenityAlphaTrader/1.0"})
+        resp = _SESSION.get(url, timeout=10, headers={"User-Agent": "SerenityAlphaTrader/1.0"})
         if resp.status_code != 200:
-            logger.debug(f"[RSS] {symbol} HTTP {resp.status_code}")
-            return []
-        root = ET.fromstring(resp.text)
-        ns = {"dc": "http://purl.org/dc/elements/1.1/"}
-        channel = root.find("channel")
-        if channel is None:
+            logger.debug("[RSS] %s HTTP %s", symbol, resp.status_code)
             return []
-        for item in channel.findall("item"):
-            title_el = item.find("title")
-            pub_el = item.find("pubDate")
-            creator_el = item.find("dc:creator", ns)
-            if title_el is None or pub_el is None:
-                continue
-            try:
-                pub_time = parsedate_to_datetime(pub_el.text).replace(tzinfo=None)
-            except Exception:
-                continue
-            if pub_time < cutoff:
-                continue
-            recent.append({
-                "title": title_el.text or "",
-                "publisher": creator_el.text if creator_el is not None else "Yahoo Finance",
-                "time": pub_time.isoformat(),
-                "symbol": symbol,
-                "source": "rss",
-            })
+        recent.extend(_iter_rss_news(symbol, resp.content, cutoff))
     except Exception as e:
-        logger.debug(f"[RSS] Could not fetch RSS for {symbol}: {e}")
+        logger.debug("[RSS] Could not fetch RSS for %s: %s", symbol, e)
     return recent
 
 
+def _iter_rss_news(symbol: str, content: bytes, cutoff: datetime):
+    """
+    Yield news dicts from a Yahoo headline feed, streaming the XML. Yahoo
+    lists items newest first, so parsing stops at the first one older than
+    the cutoff instead of reading the rest.
+    """
+    if _HAS_LXML:
+        events = LET.iterparse(io.BytesIO(content), events=("end",), tag="item", recover=True)
+    else:
+        events = ET.iterparse(io.BytesIO(content), events=("end",))
+    for _event, item in events:
+        if item.tag != "item":
+            continue
+        title = item.findtext("title")
+        pub_text = item.findtext("pubDate")
+        creator = item.findtext(_DC_CREATOR)
+        item.clear()
+        if title is None or pub_text is None:
+            continue
+        try:
+            pub_time = _parse_pub_date(pub_text)
+        except Exception:
+            continue
+        if pub_time < cutoff:
+            return
+        yield {
+            "title": title,
+            "publisher": creator if creator is not None else "Yahoo Finance",
+            "time": pub_time.isoformat(),
+            "symbol": symbol,
+            "source": "rss",
+        }
+
+
 # ── Geopolitical RSS Sources ─────────────────────────────────────────────────
 # Global news feeds that carry breaking geopolitical events:
 # wars, sanctions, oil supply disruptions, central bank policy, etc.
@@ -528,17 +778,17 @@ def fetch_tech_news(hours_back: int = 12) -> list:
     Fetch recent tech/semiconductor news from specialized RSS sources.
     Returns unified list of items with: title, publisher, url, time, source_name.
     """
-    cutoff = datetime.utcnow() - timedelta(hours=hours_back)
+    cutoff = _utcnow() - timedelta(hours=hours_back)
     all_items = []
 
-    for source in TECH_RSS_SOURCES:
+    responses = _fetch_feeds(TECH_RSS_SOURCES, timeout=10,
+                             headers={"User-Agent": "SerenityAlphaTrader-TechNews/1.0"})
+    for source, resp in zip(TECH_RSS_SOURCES, responses):
         try:
-            resp = requests.get(
-                source["url"], timeout=10,
-                headers={"User-Agent": "SerenityAlphaTrader-TechNews/1.0"}
-            )
+            if isinstance(resp, Exception):
+                raise resp
             if resp.status_code != 200:
-                logger.debug(f"[TechNews] {source['name']} HTTP {resp.status_code}")
+                logger.debug("[TechNews] %s HTTP %s", source["name"], resp.status_code)
                 continue
 
             # Try feedparser first, fall back to raw XML
@@ -565,9 +815,9 @@ def fetch_tech_news(hours_back: int = 12) -> list:
                         link = (link_el.text or link_el.get("href", "")) if link_el is not None else ""
                         pub_str = date_el.text if date_el is not None else ""
                         try:
-                            pub_dt = parsedate_to_datetime(pub_str).replace(tzinfo=None)
+                            pub_dt = _parse_pub_date(pub_str)
                         except Exception:
-                            pub_dt = datetime.utcnow()
+                            pub_dt = _utcnow()
                         if pub_dt >= cutoff:
                             all_items.append({
                                 "title": title,
@@ -586,11 +836,11 @@ def fetch_tech_news(hours_back: int = 12) -> list:
                 if pub:
                     try:
                         from calendar import timegm
-                        pub_dt = datetime.utcfromtimestamp(timegm(pub))
+                        pub_dt = _utc_from_ts(timegm(pub))
                     except Exception:
-                        pub_dt = datetime.utcnow()
+                        pub_dt = _utcnow()
                 else:
-                    pub_dt = datetime.utcnow()
+                    pub_dt = _utcnow()
 
                 if pub_dt >= cutoff:
                     all_items.append({
@@ -601,12 +851,21 @@ def fetch_tech_news(hours_back: int = 12) -> list:
                     })
 
         except Exception as e:
-            logger.debug(f"[TechNews] {source['name']} failed: {e}")
+            logger.debug("[TechNews] %s failed: %s", source["name"], e)
 
     logger.info(f"[TechNews] Fetched {len(all_items)} items from {len(TECH_RSS_SOURCES)} sources")
     return all_items
 
 
+# lowercased keyword -> (keyword, affected stocks), in map order
+_TECH_KEYWORDS_BY_LOWER = {}
+for _keyword, _stocks in TECH_KEYWORD_STOCK_MAP.items():
+    _TECH_KEYWORDS_BY_LOWER.setdefault(_keyword.lower(), (_keyword, _stocks))
+del _keyword, _stocks
+_TECH_MATCHER = _KeywordMatcher(_TECH_KEYWORDS_BY_LOWER)
+_TECH_HIGH_IMPACT_WORDS = ("challenge", "beat", "outperform", "replace", "rival")
+
+
 def detect_tech_market_impacts(hours_back: int = 2) -> list:
     """
     Scan tech RSS feeds for keyword hits and return list of impacted stocks.
@@ -617,24 +876,26 @@ def detect_tech_market_impacts(hours_back: int = 2) -> list:
     seen_titles = set()
 
     for item in items:
+        if item["title"] in seen_titles:
+            continue
         title_lower = item["title"].lower()
-        for keyword, stocks in TECH_KEYWORD_STOCK_MAP.items():
-            if keyword.lower() in title_lower:
-                if item["title"] in seen_titles:
-                    continue
-                seen_titles.add(item["title"])
-                impacts.append({
-                    "keyword": keyword,
-                    "title": item["title"],
-                    "publisher": item["publisher"],
-                    "url": item.get("url", ""),
-                    "time": item["time"],
-                    "affected_stocks": stocks,
-                    "impact_level": "HIGH" if any(
-                        k in title_lower for k in ["challenge", "beat", "outperform", "replace", "rival"]
-                    ) else "MEDIUM",
-                })
-                break  # one keyword match per article is enough
+        matched = _TECH_MATCHER.match(title_lower)
+        if not matched:
+            continue
+        # one keyword match per article is enough: the first in map order
+        keyword, stocks = _TECH_KEYWORDS_BY_LOWER[matched[0]]
+        seen_titles.add(item["title"])
+        impacts.append({
+            "keyword": keyword,
+            "title": item["title"],
+            "publisher": item["publisher"],
+            "url": item.get("url", ""),
+            "time": item["time"],
+            "affected_stocks": stocks,
+            "impact_level": "HIGH" if any(
+                k in title_lower for k in _TECH_HIGH_IMPACT_WORDS
+            ) else "MEDIUM",
+        })
 
     if impacts:
         logger.info(f"[TechNews] {len(impacts)} tech market impact(s) detected")
@@ -683,17 +944,17 @@ def fetch_geopolitical_news(hours_back: int = 12) -> list:
             and _GEO_NEWS_CACHE["items"]):
         return _GEO_NEWS_CACHE["items"]
 
-    cutoff = datetime.utcnow() - timedelta(hours=hours_back)
+    cutoff = _utcnow() - timedelta(hours=hours_back)
     all_items = []
 
-    for source in GEOPOLITICAL_RSS_SOURCES:
+    responses = _fetch_feeds(GEOPOLITICAL_RSS_SOURCES, timeout=10,
+                             headers={"User-Agent": "SerenityAlphaTrader-GeoNews/1.0"})
+    for source, resp in zip(GEOPOLITICAL_RSS_SOURCES, responses):
         try:
-            resp = requests.get(
-                source["url"], timeout=10,
-                headers={"User-Agent": "SerenityAlphaTrader-GeoNews/1.0"}
-            )
+            if isinstance(resp, Exception):
+                raise resp
             if resp.status_code != 200:
-                logger.debug(f"[GeoNews] {source['name']} HTTP {resp.status_code}")
+                logger.debug("[GeoNews] %s HTTP %s", source["name"], resp.status_code)
                 continue
 
             try:
@@ -719,7 +980,7 @@ def fetch_geopolitical_news(hours_back: int = 12) -> list:
                 pub_time = None
                 if pub_el is not None and pub_el.text:
                     try:
-                        pub_time = parsedate_to_datetime(pub_el.text).replace(tzinfo=None)
+                        pub_time = _parse_pub_date(pub_el.text)
                     except Exception:
                         pass
 
@@ -730,17 +991,17 @@ def fetch_geopolitical_news(hours_back: int = 12) -> list:
                 all_items.append({
                     "title": title,
                     "publisher": source["name"],
-                    "time": pub_time.isoformat() if pub_time else datetime.utcnow().isoformat(),
+                    "time": pub_time.isoformat() if pub_time else _utcnow().isoformat(),
                     "symbol": "MACRO",
                     "source": "geopolitical_rss",
                 })
                 count += 1
 
             if count:
-                logger.debug(f"[GeoNews] {source['name']}: {count} items")
+                logger.debug("[GeoNews] %s: %d items", source["name"], count)
 
         except Exception as e:
-            logger.debug(f"[GeoNews] {source['name']} failed: {e}")
+            logger.debug("[GeoNews] %s failed: %s", source["name"], e)
 
     logger.info(f"[GeoNews] Fetched {len(all_items)} geopolitical news items from {len(GEOPOLITICAL_RSS_SOURCES)} sources")
     _GEO_NEWS_CACHE["items"] = all_items
@@ -755,16 +1016,16 @@ def fetch_cn_finance_news(hours_back: int = 6) -> list:
     Catches: CSRC policy announcements, PBOC decisions, exchange notices,
              major A-share corporate actions, northbound/southbound capital flows.
     """
-    cutoff = datetime.utcnow() - timedelta(hours=hours_back)
+    cutoff = _utcnow() - timedelta(hours=hours_back)
     all_items = []
 
-    for source in CN_FINANCE_RSS_SOURCES:
+    responses = _fetch_feeds(CN_FINANCE_RSS_SOURCES, timeout=8,
+                             headers={"User-Agent": "SerenityAlphaTrader-CNFinance/1.0",
+                                      "Accept-Language": "zh-CN,zh;q=0.9"})
+    for source, resp in zip(CN_FINANCE_RSS_SOURCES, responses):
         try:
-            resp = requests.get(
-                source["url"], timeout=8,
-                headers={"User-Agent": "SerenityAlphaTrader-CNFinance/1.0",
-                         "Accept-Language": "zh-CN,zh;q=0.9"}
-            )
+            if isinstance(resp, Exception):
+                raise resp
             if resp.status_code != 200:
                 continue
             try:
@@ -783,11 +1044,11 @@ def fetch_cn_finance_news(hours_back: int = 6) -> list:
                 all_items.append({
                     "title": title,
                     "publisher": source["name"],
-                    "time": datetime.utcnow().isoformat(),
+                    "time": _utcnow().isoformat(),
                     "region": "CN",
                 })
         except Exception as e:
-            logger.debug(f"[CNFinNews] {source['name']} failed: {e}")
+            logger.debug("[CNFinNews] %s failed: %s", source["name"], e)
 
     logger.info(f"[CNFinNews] Fetched {len(all_items)} items from {len(CN_FINANCE_RSS_SOURCES)} CN sources")
     return all_items
@@ -819,11 +1080,12 @@ def fetch_global_market_news(hours_back: int = 6) -> dict:
     us_keywords  = ["fed", "federal reserve", "nasdaq", "s&p", "dow", "wall street",
                     "美联储", "美股", "美元"]
 
+    cn_publishers = {s["name"] for s in CN_FINANCE_RSS_SOURCES}
     for item in geo_news + cn_news:
         t = (item.get("title") or "").lower()
         p = (item.get("publisher") or "")
         # CN finance sources → CN bucket
-        if p in [s["name"] for s in CN_FINANCE_RSS_SOURCES] or any(k in t for k in cn_keywords):
+        if p in cn_publishers or any(k in t for k in cn_keywords):
             region_map["CN"].append(item)
         elif any(k in t for k in hk_keywords):
             region_map["HK"].append(item)
@@ -843,11 +1105,107 @@ def fetch_global_market_news(hours_back: int = 6) -> dict:
     return region_map
 
 
+# Threat, catalyst, next-day-buy and LLM-catalyst scans all pull news for the
+# same popular tickers within one cycle; share the result for a few minutes.
+# With REDIS_URL set, results also go through the market-data Redis L2 so a
+# restarted server or a cron script reuses them instead of re-hitting Yahoo.
+_SYMBOL_NEWS_CACHE: dict = {}  # (symbol, hours_back) -> (items, fetched_at)
+_SYMBOL_NEWS_TTL_SEC = 300
+_SYMBOL_NEWS_LOCK = threading.Lock()
+
+
 def fetch_news_with_fallback(symbol: str, hours_back: int = 24) -> list:
     """
     Primary: yfinance.  Fallback: Yahoo Finance RSS.
     Always returns a list (empty if both sources fail).
+    Cached per (symbol, hours_back) for _SYMBOL_NEWS_TTL_SEC; treat as read-only.
     """
+    results = _cached_symbol_news(symbol, hours_back)
+    if results is None:
+        results = _fetch_news_uncached(symbol, hours_back)
+        _store_symbol_news(symbol, hours_back, results)
+    return results
+
+
+def _cached_symbol_news(symbol: str, hours_back: int) -> Optional[list]:
+    """Cached news for (symbol, hours_back) from the L1 dict or Redis L2, else None."""
+    key = (symbol, hours_back)
+    now_ts = time.time()
+    with _SYMBOL_NEWS_LOCK:
+        entry = _SYMBOL_NEWS_CACHE.get(key)
+    if entry and now_ts - entry[1] < _SYMBOL_NEWS_TTL_SEC:
+        return entry[0]
+
+    results, ttl_left = cache.cache_get(("newsintel", symbol, hours_back))
+    if results is not None:
+        _store_symbol_news(symbol, hours_back, results,
+                           fetched_at=now_ts - (_SYMBOL_NEWS_TTL_SEC - ttl_left))
+    return results
+
+
+def _store_symbol_news(symbol: str, hours_back: int, results: list,
+                       fetched_at: Optional[float] = None) -> None:
+    """Cache freshly fetched news (fetched_at None) in L1 and L2, or promote an
+    L2 hit (fetched_at set) into L1 only."""
+    now_ts = time.time()
+    if fetched_at is None:
+        fetched_at = now_ts
+        cache.cache_set(("newsintel", symbol, hours_back), results, _SYMBOL_NEWS_TTL_SEC)
+
+    with _SYMBOL_NEWS_LOCK:
+        if len(_SYMBOL_NEWS_CACHE) > 1024:  # drop expired entries now and then
+            for k in [k for k, (_, ts) in _SYMBOL_NEWS_CACHE.items() if now_ts - ts >= _SYMBOL_NEWS_TTL_SEC]:
+                del _SYMBOL_NEWS_CACHE[k]
+        _SYMBOL_NEWS_CACHE[(symbol, hours_back)] = (results, fetched_at)
+
+
+# detect_threats_for_symbol / detect_catalysts_for_symbol results. The same
+# symbol is asked for by the threat context, priority resolution and the UI
+# within seconds; the keyword and LLM passes needn't run again for each.
+_DETECT_CACHE: dict = {}  # (kind, symbol, hours_back) -> (results, computed_at)
+_DETECT_TTL_SEC = 60
+_THREAT_SCAN_TTL_SEC = 30
+
+
+def _memo_detect(kind: str, symbol, hours_back: int, compute, ttl: int = _DETECT_TTL_SEC):
+    """compute(symbol, hours_back), reused for `ttl` seconds; treat as read-only."""
+    key = (kind, symbol, hours_back)
+    now_ts = time.time()
+    with _SYMBOL_NEWS_LOCK:
+        entry = _DETECT_CACHE.get(key)
+    if entry and now_ts - entry[1] < ttl:
+        return entry[0]
+    results = compute(symbol, hours_back)
+    with _SYMBOL_NEWS_LOCK:
+        if len(_DETECT_CACHE) > 1024:
+            for k in [k for k, (_, ts) in _DETECT_CACHE.items() if now_ts - ts >= _DETECT_TTL_SEC]:
+                del _DETECT_CACHE[k]
+        _DETECT_CACHE[key] = (results, now_ts)
+    return results
+
+
+def invalidate_news_cache(symbol: Optional[str] = None) -> None:
+    """Force the next fetch_news_with_fallback (and detect_* call) to hit the
+    network, for one symbol or (symbol=None) for all of them. Drops the L1
+    entries and this module's Redis L2 news keys; market-data keys stay."""
+    with _SYMBOL_NEWS_LOCK:
+        if symbol is None:
+            _SYMBOL_NEWS_CACHE.clear()
+            _DETECT_CACHE.clear()
+        else:
+            for k in [k for k in _SYMBOL_NEWS_CACHE if k[0] == symbol]:
+                del _SYMBOL_NEWS_CACHE[k]
+            # threat_scan entries are keyed by the scanned symbol tuple
+            for k in [k for k in _DETECT_CACHE
+                      if k[1] == symbol or (isinstance(k[1], tuple) and symbol in k[1])]:
+                del _DETECT_CACHE[k]
+    with _RECENT_NEWS_LOCK:
+        for k in [k for k in _RECENT_NEWS_CACHE if symbol is None or k[0] == symbol]:
+            del _RECENT_NEWS_CACHE[k]
+    cache.invalidate("newsintel", symbol)
+
+
+def _fetch_news_uncached(symbol: str, hours_back: int) -> list:
     results = fetch_recent_news(symbol, hours_back)
     if results:
         return results
@@ -858,32 +1216,46 @@ def fetch_news_with_fallback(symbol: str, hours_back: int = 24) -> list:
     return rss_results
 
 
-def detect_threats_for_symbol(target_symbol: str, hours_back: int = 24) -> list:
+def _build_threat_sources(target_symbol: str) -> tuple:
+    """(disruptor, ticker) pairs whose news can threaten `target_symbol`,
+    ending with the target itself (self-reported risks). Private companies
+    (ticker None) are skipped; the target's own news covers them."""
+    pairs = [(d, DISRUPTOR_TICKERS.get(d, d))
+             for d in list(COMPETITIVE_THREAT_MAP[target_symbol]["disruptors"]) + [target_symbol]]
+    return tuple((d, t) for d, t in pairs if t is not None)
+
+
+# Both maps are static, so the source lists and their inverse (ticker -> the
+# targets whose threat scan reads that ticker's news) are built once.
+_THREAT_SOURCES = {target: _build_threat_sources(target) for target in COMPETITIVE_THREAT_MAP}
+_TICKER_TO_TARGETS: dict = {}
+for _target, _pairs in _THREAT_SOURCES.items():
+    for _disruptor, _ticker in _pairs:
+        _TICKER_TO_TARGETS.setdefault(_ticker, set()).add(_target)
+del _target, _pairs, _disruptor, _ticker
+
+
+def _gather_unique_tickers(sources: dict) -> list:
+    """Distinct tickers across every target's (disruptor, ticker) sources,
+    in first-seen order, so each is fetched once per scan."""
+    return list(dict.fromkeys(t for pairs in sources.values() for _, t in pairs))
+
+
+def _collect_threats(target_symbol: str, sources: list, news_by_ticker: dict, found_in) -> list:
     """
-    Check if any disruptors of `target_symbol` have published threatening news.
-    Returns list of detected threats with context.
+    Threat dicts for `target_symbol` from already-fetched news. `found_in(title)`
+    returns the set of threat keywords present in a headline; each symbol keeps
+    the hits from its own list, in list order.
     """
-    config = COMPETITIVE_THREAT_MAP.get(target_symbol)
-    if not config:
-        return []
-
+    config = COMPETITIVE_THREAT_MAP[target_symbol]
+    keywords = _THREAT_MATCHERS[target_symbol].keywords
     threats = []
-    keywords = [k.lower() for k in config["threat_keywords"]]
-
-    # Check news from each disruptor
-    disruptors_to_check = list(config["disruptors"])
-    # Also check news ON the target itself for self-reported risks
-    disruptors_to_check.append(target_symbol)
-
-    for disruptor in disruptors_to_check:
-        # Resolve to real ticker if needed
-        ticker = DISRUPTOR_TICKERS.get(disruptor, disruptor)
-        if ticker is None:
-            continue  # Private company - skip direct fetch, rely on target's own news
-        news_items = fetch_news_with_fallback(ticker, hours_back)
-        for item in news_items:
-            title_lower = item["title"].lower()
-            matched_keywords = [kw for kw in keywords if kw in title_lower]
+    for disruptor, ticker in sources:
+        for item in news_by_ticker.get(ticker, ()):
+            found = found_in(item["title"])
+            if not found:
+                continue
+            matched_keywords = [kw for kw in keywords if kw in found]
             if matched_keywords:
                 threats.append({
                     "target_symbol": target_symbol,
@@ -895,24 +1267,88 @@ def detect_threats_for_symbol(target_symbol: str, hours_back: int = 24) -> list:
                     "vulnerability": config["vulnerability"],
                     "threat_level": "HIGH" if len(matched_keywords) >= 2 else "MEDIUM",
                 })
-
     return threats
 
 
+def detect_threats_for_symbol(target_symbol: str, hours_back: int = 24,
+                              news_cache: Optional[dict] = None) -> list:
+    """
+    Check if any disruptors of `target_symbol` have published threatening news.
+    Returns list of detected threats with context.
+    Cached for _DETECT_TTL_SEC; treat as read-only. Pass `news_cache`
+    (ticker -> news items, e.g. from a batch fetch) to match against news the
+    caller already has; only tickers missing from it are fetched.
+    """
+    if target_symbol not in COMPETITIVE_THREAT_MAP:
+        return []
+    if news_cache is not None:
+        return _detect_threats_uncached(target_symbol, hours_back, news_cache)
+    return _memo_detect("threats", target_symbol, hours_back, _detect_threats_uncached)
+
+
+def _detect_threats_uncached(target_symbol: str, hours_back: int,
+                             news_cache: Optional[dict] = None) -> list:
+    sources = _THREAT_SOURCES[target_symbol]
+    news_by_ticker = dict(news_cache or {})
+    tickers = [t for t in dict.fromkeys(t for _, t in sources) if t not in news_by_ticker]
+    news_by_ticker.update(zip(tickers, _FETCH_POOL.map(
+        partial(fetch_news_with_fallback, hours_back=hours_back), tickers)))
+    matcher = _THREAT_MATCHERS[target_symbol]
+    return _collect_threats(target_symbol, sources, news_by_ticker,
+                            lambda title: matcher.found(title.lower()))
+
+
 def scan_all_threats(watchlist: list, hours_back: int = 24) -> dict:
     """
     Scan all watchlist stocks for competitive threats.
     Returns dict: symbol -> list of threats.
+
+    Disruptors are shared across many targets (MSFT/GOOGL/AMZN appear in most
+    entries), so each distinct ticker's news is fetched once and each headline
+    is matched once against the union of all threat keywords; every target
+    then keeps the hits from its own list. The result for a given watchlist
+    is reused for _THREAT_SCAN_TTL_SEC; treat as read-only.
     """
+    symbols = tuple(s for s in dict.fromkeys(watchlist) if s in COMPETITIVE_THREAT_MAP)
+    return _memo_detect("threat_scan", symbols, hours_back, _scan_threats, ttl=_THREAT_SCAN_TTL_SEC)
+
+
+def _scan_threats(symbols: tuple, hours_back: int) -> dict:
+    sources = {s: _THREAT_SOURCES[s] for s in symbols}
+    tickers = _gather_unique_tickers(sources)
+    news_by_ticker = dict(zip(tickers, _FETCH_POOL.map(
+        partial(fetch_news_with_fallback, hours_back=hours_back), tickers)))
+
+    titles = list({item["title"]: None for items in news_by_ticker.values() for item in items})
+    found_by_title = {
+        title: found
+        for title, found in zip(titles, _THREAT_MASTER_MATCHER.found_many([t.lower() for t in titles]))
+        if found
+    }
+    # Targets with at least one hit: a keyword from the target's own list in a
+    # headline from one of the target's own sources. The rest have nothing to
+    # collect.
+    hit_targets = set()
+    for ticker, items in news_by_ticker.items():
+        readers = _TICKER_TO_TARGETS.get(ticker)
+        if not readers:
+            continue
+        for item in items:
+            for kw in found_by_title.get(item["title"], ()):
+                hit_targets |= _THREAT_KEYWORD_OWNERS[kw] & readers
+    found_in = found_by_title.get
+
     results = {}
-    for symbol in watchlist:
-        threats = detect_threats_for_symbol(symbol, hours_back)
+    for symbol in symbols:
+        if symbol not in hit_targets:
+            continue
+        threats = _collect_threats(symbol, sources[symbol], news_by_ticker, found_in)
         if threats:
             results[symbol] = threats
             for t in threats:
                 logger.warning(
-                    f"[NewsIntel] THREAT DETECTED: {symbol} threatened by '{t['news_title']}' "
-                    f"(keywords: {t['matched_keywords']}) → Level: {t['threat_level']}"
+                    "[NewsIntel] THREAT DETECTED: %s threatened by '%s' (keywords: %s) → Level: %s",
+                    symbol, t["news_title"], t["matched_keywords"], t["threat_level"],
                 )
     return results
 
@@ -921,17 +1357,21 @@ def build_threat_context(symbol: str, threats: list) -> str:
     """Build a context string for the AI about detected competitive threats."""
     if not threats:
         return ""
+    # The instruction line only depends on the symbol; format it once.
+    instruction = (
+        f"  → INSTRUCTION: This news may negatively impact {symbol}. "
+        f"Strongly consider recommending SELL if already holding, or avoid BUY."
+    )
     lines = [f"### ⚠️ COMPETITIVE THREAT ALERTS for {symbol}"]
-    for t in threats:
-        lines.append(
-            f"\n[{t['threat_level']}] Threat from {t['disruptor'].upper()}:\n"
-            f"  News: \"{t['news_title']}\"\n"
-            f"  Source: {t['publisher']} ({t['time'][:10]})\n"
-            f"  Keywords: {', '.join(t['matched_keywords'])}\n"
-            f"  Vulnerability: {t['vulnerability']}\n"
-            f"  → INSTRUCTION: This news may negatively impact {symbol}. "
-            f"Strongly consider recommending SELL if already holding, or avoid BUY."
-        )
+    lines.extend(
+        f"\n[{t['threat_level']}] Threat from {t['disruptor'].upper()}:\n"
+        f"  News: \"{t['news_title']}\"\n"
+        f"  Source: {t['publisher']} ({t['time'][:10]})\n"
+        f"  Keywords: {', '.join(t['matched_keywords'])}\n"
+        f"  Vulnerability: {t['vulnerability']}\n"
+        f"{instruction}"
+        for t in threats
+    )
     return "\n".join(lines)
 
 
@@ -1129,6 +1569,45 @@ MACRO_SCENARIOS = {
     },
 }
 
+_MACRO_MATCHERS = {
+    scenario_id: _KeywordMatcher(scenario["trigger_keywords"])
+    for scenario_id, scenario in MACRO_SCENARIOS.items()
+}
+_MACRO_MASTER_MATCHER = _KeywordMatcher(
+    sorted({kw for matcher in _MACRO_MATCHERS.values() for kw in matcher.keywords})
+)
+# keyword -> scenarios listing it, so each matched headline is routed only to
+# the scenarios it can activate.
+_MACRO_KEYWORD_OWNERS: dict = {}
+for _scenario_id, _matcher in _MACRO_MATCHERS.items():
+    for _kw in _matcher.keywords:
+        _MACRO_KEYWORD_OWNERS.setdefault(_kw, set()).add(_scenario_id)
+del _scenario_id, _matcher, _kw
+
+# Broad market ETFs used as a proxy for macro/financial news
+_MACRO_PROXY_TICKERS = ("SPY", "QQQ", "VIX", "GLD", "XOM")
+_MACRO_PROXY_CACHE: dict = {}  # hours_back -> (items, fetched_at)
+_MACRO_PROXY_LOCK = threading.Lock()
+
+
+def _fetch_macro_proxy_news(hours_back: int) -> list:
+    """
+    Proxy-ticker news for the macro scan, fetched in parallel. Single-flight:
+    the news scan, daily summary and catalyst loops can all start a macro scan
+    at once; the lock makes late callers wait for the in-flight fetch and reuse
+    its result (for _SYMBOL_NEWS_TTL_SEC) instead of issuing their own.
+    """
+    with _MACRO_PROXY_LOCK:
+        entry = _MACRO_PROXY_CACHE.get(hours_back)
+        if entry and time.time() - entry[1] < _SYMBOL_NEWS_TTL_SEC:
+            return entry[0]
+        items = [item
+                 for batch in _FETCH_POOL.map(partial(fetch_recent_news, hours_back=hours_back),
+                                              _MACRO_PROXY_TICKERS)
+                 for item in batch]
+        _MACRO_PROXY_CACHE[hours_back] = (items, time.time())
+        return items
+
 # ── Auto-Watchlist Expansion Maps ────────────────────────────────────────────
 # When a macro scenario activates, automatically add these tickers to watchlist
 SCENARIO_AUTO_WATCHLIST: dict = {
@@ -1216,13 +1695,19 @@ def detect_active_macro_scenarios(hours_back: int = 6, db=None) -> list:
 
     If `db` (SQLAlchemy Session) is provided, uses the dynamic scenario lifecycle
     system (DB-backed with resolution detection). Otherwise falls back to the
-    static MACRO_SCENARIOS dict for backward compatibility.
+    static MACRO_SCENARIOS dict for backward compatibility; that scan's result
+    is reused for _DETECT_TTL_SEC (treat as read-only), since its inputs are
+    themselves cached for minutes. The lifecycle scan writes scenario state,
+    so it always runs.
     """
-    # Use broad market ETFs as proxy for macro/financial news
-    proxy_tickers = ["SPY", "QQQ", "VIX", "GLD", "XOM"]
-    all_news = []
-    for ticker in proxy_tickers:
-        all_news.extend(fetch_recent_news(ticker, hours_back))
+    if db is not None:
+        return _detect_active_macro_scenarios(hours_back, db)
+    return _memo_detect("macro", None, hours_back,
+                        lambda _symbol, hours: _detect_active_macro_scenarios(hours))
+
+
+def _detect_active_macro_scenarios(hours_back: int, db=None) -> list:
+    all_news = list(_fetch_macro_proxy_news(hours_back))
 
     # Also scan geopolitical RSS feeds (Reuters, BBC, Al Jazeera, etc.)
     geo_news = fetch_geopolitical_news(hours_back=max(hours_back, 12))
@@ -1241,8 +1726,8 @@ def detect_active_macro_scenarios(hours_back: int = 6, db=None) -> list:
             if active:
                 for s in active:
                     logger.warning(
-                        f"[MacroScenario] ACTIVE (lifecycle): '{s['name']}' — "
-                        f"{len(s.get('evidence', []))} evidence item(s)"
+                        "[MacroScenario] ACTIVE (lifecycle): '%s' — %d evidence item(s)",
+                        s["name"], len(s.get("evidence", [])),
                     )
             return active
         except Exception as e:
@@ -1271,17 +1756,29 @@ def detect_active_macro_scenarios(hours_back: int = 6, db=None) -> list:
             )
             muted_ids = set()
 
+    # Lowercase and match every headline once against all scenario keywords,
+    # route each hit headline to the scenarios owning its keywords, and let
+    # each scenario filter its own keywords out of the hit set.
+    found_all = _MACRO_MASTER_MATCHER.found_many([item["title"].lower() for item in all_news])
+    hits_by_scenario: dict = {}  # scenario_id -> [(item, found)], in news order
+    for item, found in zip(all_news, found_all):
+        if not found:
+            continue
+        scenario_ids = set()
+        for kw in found:
+            scenario_ids |= _MACRO_KEYWORD_OWNERS[kw]
+        for scenario_id in scenario_ids:
+            hits_by_scenario.setdefault(scenario_id, []).append((item, found))
+
     active = []
     for scenario_id, scenario in MACRO_SCENARIOS.items():
-        if scenario_id in muted_ids:
+        if scenario_id in muted_ids or scenario_id not in hits_by_scenario:
             continue
-        keywords = [k.lower() for k in scenario["trigger_keywords"]]
-        matched_items = []
-        for item in all_news:
-            title_lower = item["title"].lower()
-            hits = [kw for kw in keywords if kw in title_lower]
-            if hits:
-                matched_items.append({"title": item["title"], "keywords": hits})
+        keywords = _MACRO_MATCHERS[scenario_id].keywords
+        matched_items = [
+            {"title": item["title"], "keywords": [kw for kw in keywords if kw in found]}
+            for item, found in hits_by_scenario[scenario_id]
+        ]
 
         if matched_items:
             active.append({
@@ -1294,8 +1791,8 @@ def detect_active_macro_scenarios(hours_back: int = 6, db=None) -> list:
                 "potential_beneficiaries": scenario["potential_beneficiaries"],
             })
             logger.warning(
-                f"[MacroScenario] ACTIVE: '{scenario['name']}' — "
-                f"{len(matched_items)} news item(s) matched keywords"
+                "[MacroScenario] ACTIVE: '%s' — %d news item(s) matched keywords",
+                scenario["name"], len(matched_items),
             )
 
     return active
@@ -1357,8 +1854,7 @@ def build_macro_scenario_context(active_scenarios: list) -> str:
     if not active_scenarios:
         return ""
 
-    from datetime import datetime, timedelta
-    now = datetime.utcnow()
+    now = _utcnow()
 
     lines = [
         "### MACRO SCENARIO ALERTS",
@@ -1398,9 +1894,10 @@ def build_macro_scenario_context(active_scenarios: list) -> str:
         evidence = s.get("evidence", [])
         if evidence:
             lines.append(f"  Evidence ({len(evidence)} articles):")
-            for ev in evidence[:2]:
-                if isinstance(ev, dict):
-                    lines.append(f'    • "{ev.get("title", "")}" → keywords: {ev.get("keywords", [])}')
+            lines.extend(
+                f'    • "{ev.get("title", "")}" → keywords: {ev.get("keywords", [])}'
+                for ev in evidence[:2] if isinstance(ev, dict)
+            )
         if s.get("stocks_to_avoid"):
             lines.append(f"  → AVOID / SELL: {', '.join(s['stocks_to_avoid'])}")
         if s.get("potential_beneficiaries"):
@@ -1662,7 +2159,7 @@ CATALYST_MAP = {
         "catalyst_keywords": [
             "xiaomi earnings", "xiaomi ev", "su7", "yu7", "xiaomi auto",
             "smartphone share", "iot revenue", "xiaomi ai", "guidance raised", "beats estimates",
-            "小米财报", "小米业绩", "小米汽车", "su7", "yu7",
+            "小米财报", "小米业绩", "小米汽车",
         ],
         "linked_symbols": [],
         "upside_thesis": "Xiaomi EV (SU7/YU7) ramp + premium smartphone share gain + IoT ecosystem",
@@ -1759,6 +2256,17 @@ CATALYST_MAP = {
 }
 
 
+# Per-stock catalyst keywords, plus the cross-stock macro keywords for
+# TRUMP_CHINA_BENEFICIARIES (same order detect_catalysts_for_symbol reports them)
+_CATALYST_MATCHERS = {
+    symbol: _KeywordMatcher(
+        (CATALYST_MAP[symbol]["catalyst_keywords"] if symbol in CATALYST_MAP else [])
+        + (TRUMP_CHINA_VISIT_2026_KWS if symbol in TRUMP_CHINA_BENEFICIARIES else [])
+    )
+    for symbol in set(CATALYST_MAP) | TRUMP_CHINA_BENEFICIARIES
+}
+
+
 # ── Next-Day Buy Rules (Event-Driven) ────────────────────────────────────────
 # These are specific, high-impact catalysts that we want to buy on the next
 # market open (e.g., Meta buying AMD chips; NVDA earnings beat).
@@ -1868,19 +2376,23 @@ def detect_catalysts_for_symbol(target_symbol: str, hours_back: int = 24) -> lis
          still useful for high-precision exact-phrase matches)
 
     Deduped by news_title so the same headline isn't reported twice if both
-    pipelines match it.
+    pipelines match it. Cached for _DETECT_TTL_SEC; treat as read-only.
 
     Unlike detect_threats_for_symbol(), this looks for BULLISH signals
     such as large contracts, partnerships, earnings beats, product launches.
     """
+    return _memo_detect("catalysts", target_symbol, hours_back, _detect_catalysts_uncached)
+
+
+def _detect_catalysts_uncached(target_symbol: str, hours_back: int) -> list:
     # ── LLM-driven extraction (covers novel event types) ──
     llm_catalysts = []
     try:
         import llm_catalyst_extractor as _lce
         llm_catalysts = _lce.extract_catalysts_for_symbol(target_symbol, hours_back=hours_back)
     except Exception as e:
-        logger.debug(f"[CatalystMap] LLM extractor failed for {target_symbol}: {e}; "
-                     f"falling back to static-keyword map only")
+        logger.debug("[CatalystMap] LLM extractor failed for %s: %s; "
+                     "falling back to static-keyword map only", target_symbol, e)
     config = CATALYST_MAP.get(target_symbol)
     is_macro_beneficiary = target_symbol in TRUMP_CHINA_BENEFICIARIES
 
@@ -1892,11 +2404,7 @@ def detect_catalysts_for_symbol(target_symbol: str, hours_back: int = 24) -> lis
         return []
 
     catalysts = []
-    keywords = []
-    if config:
-        keywords += [k.lower() for k in config["catalyst_keywords"]]
-    if is_macro_beneficiary:
-        keywords += [k.lower() for k in TRUMP_CHINA_VISIT_2026_KWS]
+    matcher = _CATALYST_MATCHERS[target_symbol]
 
     # Cap the thesis even when there's no per-stock config (macro-only beneficiary).
     upside_thesis = (
@@ -1914,7 +2422,7 @@ def detect_catalysts_for_symbol(target_symbol: str, hours_back: int = 24) -> lis
         try:
             news_sources.append((linked, fetch_news_with_fallback(linked, hours_back)))
         except Exception as e:
-            logger.debug(f"[CatalystMap] linked-symbol news fetch failed for {linked}: {e}")
+            logger.debug("[CatalystMap] linked-symbol news fetch failed for %s: %s", linked, e)
 
     # Also scan the geopolitical RSS feeds — cross-stock macro catalysts
     # (state visits, CEO delegations, trade thaws) live there, not in any
@@ -1926,7 +2434,7 @@ def detect_catalysts_for_symbol(target_symbol: str, hours_back: int = 24) -> lis
         if geo_news:
             news_sources.append(("__geopolitical__", geo_news))
     except Exception as e:
-        logger.debug(f"[CatalystMap] geopolitical news fetch failed: {e}")
+        logger.debug("[CatalystMap] geopolitical news fetch failed: %s", e)
 
     for src_sym, news_items in news_sources:
         for item in news_items:
@@ -1937,8 +2445,7 @@ def detect_catalysts_for_symbol(target_symbol: str, hours_back: int = 24) -> lis
             title = item.get("title") or ""
             if not title:
                 continue
-            title_lower = title.lower()
-            matched_keywords = [kw for kw in keywords if kw in title_lower]
+            matched_keywords = matcher.match(title.lower())
             if matched_keywords:
                 strength = len(matched_keywords)
                 catalysts.append({
@@ -1982,6 +2489,11 @@ def build_catalyst_context(symbol: str, catalysts: list) -> str:
     if not catalysts:
         return ""
 
+    instruction = (
+        f"  → INSTRUCTION: This is a BULLISH signal for {symbol}. "
+        f"Strongly consider BUY if not already positioned. "
+        f"This catalyst may outweigh general macro headwinds."
+    )
     lines = [f"### 🚀 POSITIVE CATALYST ALERTS for {symbol}"]
     for c in catalysts:
         origin = c.get("news_origin", symbol)
@@ -1994,9 +2506,7 @@ def build_catalyst_context(symbol: str, catalysts: list) -> str:
             f"  Source: {c['publisher']} ({c['time'][:10]})\n"
             f"  Keywords matched: {', '.join(c['matched_keywords'])}\n"
             f"  Thesis: {c['upside_thesis']}\n"
-            f"  → INSTRUCTION: This is a BULLISH signal for {symbol}. "
-            f"Strongly consider BUY if not already positioned. "
-            f"This catalyst may outweigh general macro headwinds."
+            f"{instruction}"
         )
     return "\n".join(lines)
 
@@ -2038,7 +2548,7 @@ def resolve_signal_priority(symbol: str, catalysts: list, active_macros: list) -
     # Find macro scenarios that list this symbol as one to avoid
     conflicting_macros = [
         m for m in active_macros
-        if symbol in m.get("stocks_to_avoid", [])
+        if symbol in (m.get("stocks_to_avoid") or ())
     ]
     if not conflicting_macros:
         # No conflict — catalyst is purely additive
@@ -2048,13 +2558,12 @@ def resolve_signal_priority(symbol: str, catalysts: list, active_macros: list) -
             f"The bullish catalyst signal is ADDITIVE — weight it alongside technical analysis."
         )
 
-    # Find the most severe conflicting macro
-    worst_macro = max(
-        conflicting_macros,
-        key=lambda m: _MACRO_SEVERITY_RANK.get(m.get("severity", "LOW"), 1)
+    # Find the most severe conflicting macro (rank looked up once per macro)
+    macro_rank, worst_macro = max(
+        ((_MACRO_SEVERITY_RANK.get(m.get("severity", "LOW"), 1), m) for m in conflicting_macros),
+        key=lambda pair: pair[0],
     )
     macro_severity = worst_macro.get("severity", "LOW")
-    macro_rank = _MACRO_SEVERITY_RANK.get(macro_severity, 1)
 
     # Apply override rules
     lines = [f"### ⚖️ SIGNAL CONFLICT RESOLUTION for {symbol}"]
@@ -2104,6 +2613,9 @@ _RESTRUCTURING_KEYWORDS = [
     "cost reduction plan", "right-sizing", "streamlining workforce",
     "eliminat", "trimming staff", "reduce headcount",
 ]
+# Strength scoring: explicit job cuts (2), then a stated scale (3)
+_RESTRUCTURING_EXPLICIT_CUT_WORDS = ("job cuts", "workforce reduction", "headcount reduction", "laid off")
+_RESTRUCTURING_SCALE_WORDS = ("%", "thousand", "workers", "employees")
 
 # Ticker → company name fragments (for matching news headlines to the right company)
 # Covers major global tech companies — layoff/restructuring by these = BUY signal for that ticker
@@ -2225,7 +2737,8 @@ def detect_restructuring_catalysts(symbols: list, hours_back: int = 48) -> list:
     - Market typically rewards discipline over growth-at-all-costs
     - Oracle +6% on layoffs is a real example of this pattern
     """
-    cutoff = datetime.utcnow() - timedelta(hours=hours_back)
+    import yfinance as yf
+    cutoff_ts = time.time() - hours_back * 3600
     results = []
 
     for symbol in symbols:
@@ -2236,6 +2749,11 @@ def detect_restructuring_catalysts(symbols: list, hours_back: int = 48) -> list:
             continue
 
         for item in news:
+            # Cheapest test first: most items fall outside the window
+            pub_ts = item.get("providerPublishTime", 0) or 0
+            if pub_ts < cutoff_ts:
+                continue
+
             title = (item.get("title") or "").lower()
             if not title:
                 continue
@@ -2249,19 +2767,16 @@ def detect_restructuring_catalysts(symbols: list, hours_back: int = 48) -> list:
             if not matched_kws:
                 continue
 
-            pub_ts = item.get("providerPublishTime", 0) or 0
             try:
-                pub_dt = datetime.utcfromtimestamp(pub_ts)
+                pub_dt = _utc_from_ts(pub_ts)
             except Exception:
                 continue
-            if pub_dt < cutoff:
-                continue
 
             # Score strength
             strength = 1
-            if any(k in title for k in ["job cuts", "workforce reduction", "headcount reduction", "laid off"]):
+            if any(k in title for k in _RESTRUCTURING_EXPLICIT_CUT_WORDS):
                 strength = 2
-            if any(k in title for k in ["%", "thousand", "workers", "employees"]):
+            if any(k in title for k in _RESTRUCTURING_SCALE_WORDS):
                 strength = 3
 
             results.append({
@@ -20,12 +20,20 @@ Gmail App Password setup:
   3. Copy the 16-char password → paste into notify_email_password
 """
 import sys
-sys.path.append("/home/qbao775/.local/lib/python3.8/site-packages")
+if "/home/qbao775/.local/lib/python3.8/site-packages" not in sys.path:
+    sys.path.append("/home/qbao775/.local/lib/python3.8/site-packages")
 
+import atexit
 import logging
 import smtplib
 import json
+import queue
+import threading
+import time
 import requests
+from collections import deque
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
@@ -35,6 +43,8 @@ logger = logging.getLogger(__name__)
 
 SMTP_HOST = "smtp.gmail.com"
 SMTP_PORT = 587
+SMTP_MAX_MSGS_PER_CONN = 100    # recycle long-lived sessions
+SMTP_IDLE_TIMEOUT_SEC = 240     # Gmail drops idle sessions after a few minutes
 
 
 # ── Credential helpers ────────────────────────────────────────────────────────
@@ -67,6 +77,83 @@ def _get_config(db) -> dict:
 
 # ── Email sender ──────────────────────────────────────────────────────────────
 
+class _SMTPConnection:
+    __slots__ = ("smtp", "last_used", "msgs_sent")
+
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.last_used = time.monotonic()
+        self.msgs_sent = 0
+
+    def close(self):
+        try:
+            self.smtp.quit()
+        except Exception:
+            try:
+                self.smtp.close()
+            except Exception:
+                pass
+
+
+class _SMTPPool:
+    """
+    Logged-in SMTP sessions kept open between sends, keyed by (host, port, user),
+    so a burst of notifications (daily summary, blog-alert sweep) pays for
+    EHLO + STARTTLS + AUTH once instead of per email. An idle session is checked
+    with NOOP before reuse; stale, over-used or broken ones are closed and
+    replaced by a fresh login.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle: dict = {}  # (host, port, user) -> deque[_SMTPConnection]
+
+    def acquire(self, sender: str, password: str) -> _SMTPConnection:
+        key = (SMTP_HOST, SMTP_PORT, sender)
+        while True:
+            with self._lock:
+                conns = self._idle.get(key)
+                conn = conns.pop() if conns else None
+            if conn is None:
+                break
+            if (time.monotonic() - conn.last_used < SMTP_IDLE_TIMEOUT_SEC
+                    and conn.msgs_sent < SMTP_MAX_MSGS_PER_CONN):
+                try:
+                    if conn.smtp.noop()[0] == 250:
+                        return conn
+                except (smtplib.SMTPException, OSError):
+                    pass
+            conn.close()
+
+        server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30)
+        try:
+            server.ehlo()
+            server.starttls()
+            server.ehlo()
+            server.login(sender, password)
+        except Exception:
+            server.close()
+            raise
+        return _SMTPConnection(server)
+
+    def release(self, sender: str, conn: _SMTPConnection):
+        conn.last_used = time.monotonic()
+        conn.msgs_sent += 1
+        with self._lock:
+            self._idle.setdefault((SMTP_HOST, SMTP_PORT, sender), deque()).append(conn)
+
+    def close_all(self):
+        with self._lock:
+            conns = [c for q in self._idle.values() for c in q]
+            self._idle.clear()
+        for conn in conns:
+            conn.close()
+
+
+_SMTP_POOL = _SMTPPool()
+atexit.register(_SMTP_POOL.close_all)
+
+
 def _send_email(sender: str, password: str, recipient: str, subject: str, body: str) -> bool:
     """Send an email via Gmail SMTP with TLS."""
     try:
@@ -86,11 +173,23 @@ def _send_email(sender: str, password: str, recipient: str, subject: str, body:
         msg.attach(text_part)
         msg.attach(html_part)
 
-        with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-            server.ehlo()
-            server.starttls()
-            server.login(sender, password)
-            server.sendmail(sender, recipient, msg.as_string())
+        raw = msg.as_string()
+        conn = _SMTP_POOL.acquire(sender, password)
+        try:
+            conn.smtp.sendmail(sender, recipient, raw)
+        except smtplib.SMTPServerDisconnected:
+            # Dropped between the NOOP check and the send: retry once on a fresh login
+            conn.close()
+            conn = _SMTP_POOL.acquire(sender, password)
+            try:
+                conn.smtp.sendmail(sender, recipient, raw)
+            except Exception:
+                conn.close()
+                raise
+        except Exception:
+            conn.close()
+            raise
+        _SMTP_POOL.release(sender, conn)
 
         logger.info(f"[Notifier] Email sent: {subject}")
         return True
@@ -101,18 +200,40 @@ def _send_email(sender: str, password: str, recipient: str, subject: str, body:
 
 # ── Slack sender ──────────────────────────────────────────────────────────────
 
+# Keep-alive session so consecutive alerts reuse the TLS connection to
+# hooks.slack.com. urllib3 only retries connection failures here: a webhook
+# POST isn't idempotent, so a 5xx is not resent (it may have been delivered).
+_SLACK_SESSION = requests.Session()
+_SLACK_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                             max_retries=Retry(total=3, read=0, backoff_factor=0.3)))
+SLACK_MAX_RETRY_AFTER_SEC = 30
+
+
 def _send_slack(webhook_url: str, text: str, blocks: Optional[list] = None) -> bool:
     """Send a message to Slack via Incoming Webhook."""
     try:
         payload = {"text": text}
         if blocks:
             payload["blocks"] = blocks
-        resp = requests.post(
+        resp = _SLACK_SESSION.post(
             webhook_url,
             json=payload,
             headers={"Content-Type": "application/json"},
             timeout=10
         )
+        if resp.status_code == 429:
+            # Rate limited: nothing was posted, so wait as told and try once more
+            try:
+                wait = float(resp.headers.get("Retry-After", 1))
+            except ValueError:
+                wait = 1.0
+            time.sleep(min(max(wait, 0.0), SLACK_MAX_RETRY_AFTER_SEC))
+            resp = _SLACK_SESSION.post(
+                webhook_url,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=10
+            )
         if resp.status_code == 200:
             logger.info(f"[Notifier] Slack sent: {text[:60]}...")
             return True
@@ -124,14 +245,12 @@ def _send_slack(webhook_url: str, text: str, blocks: Optional[list] = None) -> b
         return False
 
 
-def _notify(db, subject: str, body: str, slack_text: str = "", slack_blocks: list = None):
-    """Send to all configured channels (email + slack)."""
-    cfg = _get_config(db)
-    if not cfg.get("enabled"):
-        return
+# Deliveries run on one background thread: SMTP + Slack round-trips take
+# hundreds of ms, and notify_trade is called right after an order fills.
+_NOTIFY_Q: "queue.Queue" = queue.Queue(maxsize=1024)
 
-    slack_msg = slack_text or body
 
+def _deliver(cfg: dict, subject: str, body: str, slack_msg: str, slack_blocks: Optional[list]):
     if cfg.get("email_sender") and cfg.get("email_recipient") and cfg.get("email_password"):
         _send_email(cfg["email_sender"], cfg["email_password"], cfg["email_recipient"], subject, body)
 
@@ -139,6 +258,48 @@ def _notify(db, subject: str, body: str, slack_text: str = "", slack_blocks: lis
         _send_slack(cfg["slack_webhook"], slack_msg, slack_blocks)
 
 
+def _dispatch_loop():
+    while True:
+        job = _NOTIFY_Q.get()
+        try:
+            _deliver(*job)
+        except Exception as e:
+            logger.error(f"[Notifier] Dispatch failed: {e}")
+        finally:
+            _NOTIFY_Q.task_done()
+
+
+def _flush_notifications(timeout: float = 5.0):
+    """Wait up to `timeout` seconds for queued notifications to go out (at exit)."""
+    deadline = time.monotonic() + timeout
+    with _NOTIFY_Q.all_tasks_done:
+        while _NOTIFY_Q.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(f"[Notifier] Exiting with {_NOTIFY_Q.unfinished_tasks} notification(s) unsent")
+                return
+            _NOTIFY_Q.all_tasks_done.wait(remaining)
+
+
+threading.Thread(target=_dispatch_loop, name="notifier", daemon=True).start()
+# atexit runs in reverse order: flush the queue before the SMTP pool closes
+atexit.register(_flush_notifications)
+
+
+def _notify(db, subject: str, body: str, slack_text: str = "", slack_blocks: list = None):
+    """Queue a message for all configured channels (email + slack).
+    The config is read here, on the caller's DB session; sending happens on
+    the notifier thread."""
+    cfg = _get_config(db)
+    if not cfg.get("enabled"):
+        return
+
+    try:
+        _NOTIFY_Q.put_nowait((cfg, subject, body, slack_text or body, slack_blocks))
+    except queue.Full:
+        logger.warning(f"[Notifier] Queue full, dropping notification: {subject}")
+
+
 # ── Public notification functions ─────────────────────────────────────────────
 
 def notify_trade(db, symbol: str, side: str, quantity: float, price: float,
@@ -1,6 +1,8 @@
 import math
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 class QuantitativeModels:
@@ -61,29 +63,39 @@ class QuantitativeModels:
         """
         Analyze recent OHLCV history to detect institutional footprints.
         Returns crowding metric and accumulation/distribution signals.
+        Dict-list wrapper around analyze_volume_price_action_np.
         """
         if not hist_data or len(hist_data) < 5:
             return {"vpa_signal": "Neutral", "crowding": 0.0, "liquidity": "Unknown"}
-            
-        recent = hist_data[-5:]
-        avg_vol = sum(d["volume"] for d in hist_data[-20:]) / max(1, min(20, len(hist_data)))
-        
-        latest = recent[-1]
-        candle_size = latest["high"] - latest["low"]
-        body_size = abs(latest["close"] - latest["open"])
-        vol_ratio = latest["volume"] / avg_vol if avg_vol > 0 else 1.0
-        
+        cols = [np.array([d[k] for d in hist_data], dtype=np.float64)
+                for k in ("open", "high", "low", "close", "volume")]
+        return QuantitativeModels.analyze_volume_price_action_np(*cols)
+
+    @staticmethod
+    def analyze_volume_price_action_np(o, h, l, c, v) -> dict:
+        """
+        analyze_volume_price_action on parallel open/high/low/close/volume
+        arrays (oldest first), without building per-row dicts.
+        """
+        if len(c) < 5:
+            return {"vpa_signal": "Neutral", "crowding": 0.0, "liquidity": "Unknown"}
+
+        avg_vol = float(np.asarray(v[-20:], dtype=np.float64).mean())
+        open_, high, low, close, volume = float(o[-1]), float(h[-1]), float(l[-1]), float(c[-1]), float(v[-1])
+        body_size = abs(close - open_)
+        vol_ratio = volume / avg_vol if avg_vol > 0 else 1.0
+
         signal = "Neutral"
         # High volume, long upper wick -> Distribution
-        if vol_ratio > 1.5 and (latest["high"] - max(latest["open"], latest["close"])) > body_size * 2:
+        if vol_ratio > 1.5 and (high - max(open_, close)) > body_size * 2:
             signal = "Strong Distribution (Bearish)"
         # High volume, long lower wick -> Accumulation
-        elif vol_ratio > 1.5 and (min(latest["open"], latest["close"]) - latest["low"]) > body_size * 2:
+        elif vol_ratio > 1.5 and (min(open_, close) - low) > body_size * 2:
             signal = "Strong Accumulation (Bullish)"
-            
+
         crowding = min(1.0, vol_ratio / 3.0) # Simple proxy for crowding/retail FOMO
         liquidity = "High" if avg_vol > 1000000 else "Medium" if avg_vol > 100000 else "Low"
-        
+
         return {
             "vpa_signal": signal,
             "crowding": round(crowding, 2),
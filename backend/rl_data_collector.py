@@ -10,7 +10,8 @@ Data schema (per record):
   - context: event context that was available at signal time
 """
 import sys
-sys.path.append("/home/qbao775/.local/lib/python3.8/site-packages")
+if "/home/qbao775/.local/lib/python3.8/site-packages" not in sys.path:
+    sys.path.append("/home/qbao775/.local/lib/python3.8/site-packages")
 
 import fcntl
 import json
@@ -273,7 +273,7 @@ def run_shootout(
 
     # Auto-promote (decide first, then persist so report contains promotion field)
     if auto_promote and winner and db_session is not None:
-        from database import Settings
+        from database import Settings, invalidate_settings_cache
         cur = db_session.query(Settings).filter(Settings.key=="ollama_model").first()
         if cur and cur.value != winner["model"]:
             # Compute delta vs current
@@ -289,6 +289,7 @@ def run_shootout(
                 if host_row:
                     host_row.value = winner["host"]
                 db_session.commit()
+                invalidate_settings_cache()  # rows matched by key only, for any user
                 report["promoted"] = True
                 report["promoted_from"] = cur.value
                 report["promoted_to"] = winner["model"]
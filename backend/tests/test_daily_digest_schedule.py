@@ -0,0 +1,73 @@
+import ast
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+SOURCE = Path(__file__).resolve().parents[1] / "main.py"
+
+
+def load_scheduler():
+    # main.py starts the whole server stack on import, so compile just the
+    # schedule constant and function out of its source.
+    tree = ast.parse(SOURCE.read_text(encoding="utf-8"))
+    wanted = {"DIGEST_FIRE_TIMES", "_next_digest_fire"}
+    nodes = [
+        node for node in tree.body
+        if (isinstance(node, ast.FunctionDef) and node.name in wanted)
+        or (isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) in wanted)
+    ]
+    namespace = {"datetime": datetime, "timedelta": timedelta, "Optional": Optional}
+    exec(compile(ast.Module(body=nodes, type_ignores=[]), str(SOURCE), "exec"), namespace)
+    return namespace["_next_digest_fire"]
+
+
+_next_digest_fire = load_scheduler()
+
+
+class NextDigestFireTests(unittest.TestCase):
+    def test_same_day_windows(self):
+        self.assertEqual(_next_digest_fire(datetime(2026, 3, 10, 9, 0)),
+                         (datetime(2026, 3, 10, 14, 20), "pre_market"))
+        self.assertEqual(_next_digest_fire(datetime(2026, 3, 10, 15, 0)),
+                         (datetime(2026, 3, 10, 21, 5), "post_market"))
+
+    def test_rolls_over_to_next_day_month_and_year(self):
+        self.assertEqual(_next_digest_fire(datetime(2026, 3, 10, 22, 0)),
+                         (datetime(2026, 3, 11, 14, 20), "pre_market"))
+        self.assertEqual(_next_digest_fire(datetime(2026, 12, 31, 21, 5, 1)),
+                         (datetime(2027, 1, 1, 14, 20), "pre_market"))
+
+    def test_exact_window_time_schedules_the_following_window(self):
+        self.assertEqual(_next_digest_fire(datetime(2026, 3, 10, 14, 20)),
+                         (datetime(2026, 3, 10, 21, 5), "post_market"))
+        self.assertEqual(_next_digest_fire(datetime(2026, 3, 10, 21, 5)),
+                         (datetime(2026, 3, 11, 14, 20), "pre_market"))
+        self.assertEqual(_next_digest_fire(datetime(2026, 3, 10, 14, 19, 59, 999999)),
+                         (datetime(2026, 3, 10, 14, 20), "pre_market"))
+
+    def test_early_wake_does_not_refire_the_same_window(self):
+        fired = datetime(2026, 3, 10, 14, 20)
+        woke_early = fired - timedelta(milliseconds=300)
+        self.assertEqual(_next_digest_fire(woke_early, after=fired),
+                         (datetime(2026, 3, 10, 21, 5), "post_market"))
+        # A stale anchor (the loop overslept) does not hold the schedule back
+        self.assertEqual(_next_digest_fire(datetime(2026, 3, 10, 22, 0), after=fired),
+                         (datetime(2026, 3, 11, 14, 20), "pre_market"))
+
+    def test_loop_fires_each_window_once_despite_early_wakes(self):
+        now = target = datetime(2026, 3, 9, 12, 0)
+        fired = []
+        for _ in range(6):
+            target, fire_type = _next_digest_fire(now, after=target)
+            fired.append((target, fire_type))
+            now = target - timedelta(seconds=1)  # asyncio.sleep returned early
+        self.assertEqual(fired, [
+            (datetime(2026, 3, day, hour, minute), kind)
+            for day in (9, 10, 11)
+            for (hour, minute), kind in (((14, 20), "pre_market"), ((21, 5), "post_market"))
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import market_data as md
+
+
+def fake_download(tickers, start=None, end=None, actions=False, threads=True,
+                  ignore_tz=None, group_by="column", auto_adjust=False, back_adjust=False,
+                  repair=False, keepna=False, progress=True, period="max", show_errors=True,
+                  interval="1d", prepost=False, proxy=None, rounding=False, timeout=10):
+    """yf.download with the pinned yfinance 0.2.12 signature: an argument it
+    doesn't know raises TypeError, as the real one does."""
+    symbols = tickers.split()
+    index = pd.date_range("2026-03-02", periods=5, freq="B")
+    frames = {}
+    for i, symbol in enumerate(symbols):
+        close = 100.0 + i + np.arange(5)
+        frames[symbol] = pd.DataFrame({
+            "Open": close - 0.5, "High": close + 1, "Low": close - 1,
+            "Close": close, "Adj Close": close, "Volume": np.full(5, 1e6),
+        }, index=index)
+    if len(symbols) == 1:
+        return frames[symbols[0]]
+    return pd.concat(frames, axis=1)
+
+
+class BatchDownloadTests(unittest.TestCase):
+    def setUp(self):
+        md._cache._store.clear()
+
+    def test_quotes_batch_uses_the_batched_download(self):
+        fallback = Mock(return_value=None)
+        with patch.object(md.yf, "download", side_effect=fake_download) as download, \
+             patch.object(md, "_get_info", return_value={"longName": "Test Co"}), \
+             patch.object(md, "get_stock_quote", fallback):
+            quotes = md.get_stock_quotes_batch(["TSTA", "TSTB"])
+        download.assert_called_once()
+        fallback.assert_not_called()
+        self.assertEqual(sorted(quotes), ["TSTA", "TSTB"])
+        self.assertEqual(quotes["TSTB"]["current"], 105.0)
+
+    def test_indices_batch_uses_the_batched_download(self):
+        fallback = Mock(return_value=None)
+        with patch.object(md.yf, "download", side_effect=fake_download) as download, \
+             patch.object(md, "get_index_data", fallback):
+            indices = md.get_indices_batch(["^TSTA", "^TSTB"])
+        download.assert_called_once()
+        fallback.assert_not_called()
+        self.assertEqual(indices["^TSTA"]["current"], 104.0)
+        self.assertEqual(indices["^TSTA"]["change"], 1.0)
+
+
+class QuotePriceFieldTests(unittest.TestCase):
+    def test_price_derived_fields_follow_the_live_price(self):
+        # info was cached when the stock traded at 80; it now trades at 104
+        info = {"marketCap": 8_000_000_000, "trailingPE": 20.0, "regularMarketPrice": 80.0,
+                "fiftyTwoWeekHigh": 101.0, "fiftyTwoWeekLow": 60.0, "freeCashflow": 1}
+        hist = fake_download("TSTA")
+        quote = md._build_quote("TSTA", info, hist)
+        self.assertEqual(quote["current"], 104.0)
+        self.assertEqual(quote["market_cap"], 10_400_000_000)
+        self.assertEqual(quote["pe_ratio"], 26.0)
+        self.assertEqual(quote["fifty_two_week_high"], 105.0)  # today's high beats the cached one
+        self.assertEqual(quote["fifty_two_week_low"], 60.0)
+
+    def test_info_cache_keeps_only_quote_fields(self):
+        ticker = Mock(info={"longName": "Test Co", "marketCap": 1, "regularMarketPrice": 2.0,
+                            "companyOfficers": [{"name": "x"}], "trailingPE": None})
+        self.assertEqual(md._get_info("TSTINFO", ticker),
+                         {"longName": "Test Co", "marketCap": 1, "regularMarketPrice": 2.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import math
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import market_data as md
+
+try:
+    from indicators_numba import compute_indicator_scalars as numba_scalars
+except ImportError:  # numba not installed
+    numba_scalars = None
+
+FIELDS = ("atr14", "ma20", "ma50", "ma200", "rsi", "macd", "macd_signal", "bb_std", "avg_volume20")
+
+
+def pandas_reference(hist: pd.DataFrame) -> tuple:
+    """The rolling/ewm formulas get_technical_indicators used before the array rewrite."""
+    closes, highs, lows, volumes = hist["Close"], hist["High"], hist["Low"], hist["Volume"]
+
+    prev_close = closes.shift(1)
+    tr = (highs - lows).combine((highs - prev_close).abs(), max).combine((lows - prev_close).abs(), max)
+    atr14 = float(tr.rolling(14).mean().iloc[-1]) if len(tr) >= 14 else float(highs.iloc[-1] - lows.iloc[-1])
+
+    ma20 = float(closes.rolling(20).mean().iloc[-1])
+    ma50 = float(closes.rolling(50).mean().iloc[-1]) if len(closes) >= 50 else math.nan
+    ma200 = float(closes.rolling(200).mean().iloc[-1]) if len(closes) >= 200 else math.nan
+
+    delta = closes.diff()
+    gain = delta.clip(lower=0).rolling(14).mean()
+    loss = (-delta.clip(upper=0)).rolling(14).mean()
+    rsi = float(100 - (100 / (1 + gain / loss)).iloc[-1])
+
+    ema12 = closes.ewm(span=12).mean()
+    ema26 = closes.ewm(span=26).mean()
+    macd = float((ema12 - ema26).iloc[-1])
+    signal = float((ema12 - ema26).ewm(span=9).mean().iloc[-1])
+
+    bb_std = float(closes.rolling(20).std().iloc[-1])
+    avg_volume = float(volumes.rolling(20).mean().iloc[-1])
+    return atr14, ma20, ma50, ma200, rsi, macd, signal, bb_std, avg_volume
+
+
+def make_ohlcv(closes) -> pd.DataFrame:
+    closes = np.asarray(closes, dtype=np.float64)
+    n = len(closes)
+    # Deterministic gaps and wicks so the previous close often sets the true range
+    opens = closes * (1 + 0.01 * np.sin(np.arange(n) * 1.7))
+    highs = np.maximum(opens, closes) + 0.4 + 0.3 * np.cos(np.arange(n))
+    lows = np.minimum(opens, closes) - 0.4 - 0.2 * np.sin(np.arange(n) * 0.5)
+    volumes = 1e6 + 2.5e5 * np.sin(np.arange(n) * 0.3)
+    index = pd.date_range("2025-01-01", periods=n, freq="B")
+    return pd.DataFrame({"Open": opens, "High": highs, "Low": lows, "Close": closes, "Volume": volumes},
+                        index=index)
+
+
+CASES = {
+    "20 bars": make_ohlcv(100 + 5 * np.sin(np.arange(20) / 3)),
+    "60 bars": make_ohlcv(50 + np.arange(60) * 0.2 + 3 * np.sin(np.arange(60))),
+    "250 bars": make_ohlcv(200 + 20 * np.sin(np.arange(250) / 15) + np.cos(np.arange(250) * 2.3)),
+    "only gains": make_ohlcv(10 + np.arange(40) * 0.5),  # loss == 0 -> RSI 100
+    "flat": make_ohlcv(np.full(30, 42.0)),               # gain == loss == 0 -> RSI NaN
+}
+
+
+class IndicatorParityTests(unittest.TestCase):
+    def assert_matches_reference(self, impl):
+        for name, hist in CASES.items():
+            expected = pandas_reference(hist)
+            actual = impl(*(hist[c].to_numpy(np.float64) for c in ("High", "Low", "Close", "Volume")))
+            for field, want, got in zip(FIELDS, expected, actual):
+                with self.subTest(case=name, field=field):
+                    if math.isnan(want):
+                        self.assertTrue(math.isnan(got))
+                    else:
+                        self.assertAlmostEqual(float(got), want, delta=1e-9 * max(1.0, abs(want)))
+
+    def test_numpy_scalars_match_pandas_reference(self):
+        self.assert_matches_reference(md._indicator_scalars_np)
+
+    @unittest.skipIf(numba_scalars is None, "numba not installed")
+    def test_numba_scalars_match_pandas_reference(self):
+        self.assert_matches_reference(numba_scalars)
+
+    def test_atr_first_bar_true_range_is_high_minus_low(self):
+        # With exactly 14 bars the first bar (no previous close) is in the ATR
+        # window; the other fields need 20 bars and are not compared here.
+        hist = make_ohlcv(30 + np.arange(14) * 0.7)
+        arrays = [hist[c].to_numpy(np.float64) for c in ("High", "Low", "Close", "Volume")]
+        expected = pandas_reference(hist)[0]
+        impls = [md._indicator_scalars_np] + ([numba_scalars] if numba_scalars is not None else [])
+        for impl in impls:
+            self.assertAlmostEqual(float(impl(*arrays)[0]), expected, delta=1e-9)
+
+    def test_rsi_is_100_when_there_are_no_losses(self):
+        result = md._compute_indicators(CASES["only gains"])
+        self.assertEqual(result["rsi"], 100.0)
+        self.assertEqual(result["rsi_state"], "OVERBOUGHT")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import ast
+import unittest
+from collections import Counter
+from pathlib import Path
+
+SOURCE = Path(__file__).resolve().parents[1] / "news_intelligence.py"
+
+
+class NewsIntelligenceMapTests(unittest.TestCase):
+    def test_keyword_maps_have_no_duplicate_symbols(self):
+        # A repeated key in a dict literal silently replaces the earlier entry,
+        # so check the source literals rather than the built dicts.
+        tree = ast.parse(SOURCE.read_text(encoding="utf-8"))
+        maps = {"COMPETITIVE_THREAT_MAP", "CATALYST_MAP", "MACRO_SCENARIOS", "NEXT_DAY_BUY_RULES"}
+        seen = set()
+        for node in tree.body:
+            if not isinstance(node, ast.Assign) or not isinstance(node.value, ast.Dict):
+                continue
+            name = getattr(node.targets[0], "id", None)
+            if name not in maps:
+                continue
+            seen.add(name)
+            keys = Counter(k.value for k in node.value.keys if isinstance(k, ast.Constant))
+            duplicates = sorted(k for k, n in keys.items() if n > 1)
+            self.assertEqual(duplicates, [], f"{name} defines {duplicates} more than once")
+        self.assertEqual(seen, maps)
+
+    def test_keyword_lists_have_no_repeats(self):
+        # A keyword listed twice in one entry is matched twice and inflates the
+        # match count that threat level / catalyst strength are derived from.
+        tree = ast.parse(SOURCE.read_text(encoding="utf-8"))
+        fields = {"threat_keywords", "trigger_keywords", "catalyst_keywords"}
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Dict):
+                continue
+            for key, value in zip(node.keys, node.values):
+                if not (isinstance(key, ast.Constant) and key.value in fields
+                        and isinstance(value, ast.List)):
+                    continue
+                words = Counter(e.value.lower() for e in value.elts if isinstance(e, ast.Constant))
+                repeats = sorted(w for w, n in words.items() if n > 1)
+                self.assertEqual(repeats, [], f"{key.value} at line {value.lineno} repeats {repeats}")
+
+
+if __name__ == "__main__":
+    unittest.main()
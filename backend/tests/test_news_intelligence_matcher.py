@@ -0,0 +1,67 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import news_intelligence as ni
+
+KEYWORDS = ["chip", "AI chip", "ban", "chip", "xi summit", "trump xi summit", "ai"]
+
+TITLES = [
+    "chip ban",                          # keywords at both ends of the first title
+    "",
+    "new ai chip export ban on chips",   # overlapping and repeated occurrences
+    "trump xi summit ends",              # one keyword nested inside another
+    "nothing to see",
+    "bans",
+    "ch",                                # these two would spell "chip" if the
+    "ip rally",                          # join separator were ignored
+    "ai",
+    "summit without a leader",
+    "the last title mentions a chip",    # keyword at the very end of the batch
+]
+
+
+def reference(keywords, title):
+    return [kw for kw in (k.lower() for k in keywords) if kw in title]
+
+
+class KeywordMatcherTests(unittest.TestCase):
+    def setUp(self):
+        self.matcher = ni._KeywordMatcher(KEYWORDS)
+
+    def test_match_keeps_list_order_and_duplicates(self):
+        for title in TITLES:
+            self.assertEqual(self.matcher.match(title), reference(KEYWORDS, title), title)
+        self.assertEqual(self.matcher.match("ai chip"), ["chip", "ai chip", "chip", "ai"])
+
+    def test_found_is_the_set_of_matches(self):
+        for title in TITLES:
+            self.assertEqual(self.matcher.found(title), set(reference(KEYWORDS, title)), title)
+
+    def test_found_many_matches_per_title_lookup(self):
+        expected = [set(reference(KEYWORDS, t)) for t in TITLES]
+        self.assertEqual(self.matcher.found_many(TITLES), expected)
+        # The batch str.find path, whichever automaton is installed here
+        with patch.object(self.matcher, "_automaton", None):
+            self.assertEqual(self.matcher.found_many(TITLES), expected)
+            self.assertEqual(self.matcher.found_many(TITLES[:3]), expected[:3])
+
+    @unittest.skipIf(ni._scan_titles is None, "numba not installed")
+    def test_found_many_numba_kernel_matches_per_title_lookup(self):
+        titles = TITLES + ["中国 chip 禁令", "禁令"]
+        matcher = ni._KeywordMatcher(KEYWORDS + ["禁令"])
+        with patch.object(ni, "_NUMBA_MIN_TITLES", 1), patch.object(matcher, "_automaton", None):
+            self.assertEqual(matcher.found_many(titles),
+                             [set(reference(KEYWORDS + ["禁令"], t)) for t in titles])
+
+    def test_empty_keyword_list_matches_nothing(self):
+        matcher = ni._KeywordMatcher([])
+        self.assertEqual(matcher.match("chip ban"), [])
+        self.assertEqual(matcher.found_many(TITLES), [set() for _ in TITLES])
+
+
+if __name__ == "__main__":
+    unittest.main()
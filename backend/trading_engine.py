@@ -209,6 +209,7 @@ class TradingEngine:
         if user:
             user.balance = amount
             self.db.commit()
+            self._invalidate_portfolio_summary()
 
     def get_position(self, symbol: str) -> Optional[Position]:
         return self.db.query(Position).filter(
@@ -258,6 +259,7 @@ class TradingEngine:
                     pos.last_updated = datetime.utcnow()
 
             self.db.commit()
+            self._invalidate_portfolio_summary()
             return len(alpaca_by_symbol)
         except Exception as e:
             logger.error(f"[SyncPositions] Error: {e}")
@@ -295,6 +297,7 @@ class TradingEngine:
                 count += 1
 
             self.db.commit()
+            self._invalidate_portfolio_summary()
         except Exception as e:
             logger.error(f"[SyncFutu] Error: {e}")
         return count
@@ -426,6 +429,7 @@ class TradingEngine:
         )
         self.db.add(trade)
         self.db.commit()
+        self._invalidate_portfolio_summary()
 
         logger.info(f"BUY executed: {quantity} {symbol} @ {currency}{price:.4f}, total {currency}{total_cost:.2f} via {broker_name}")
         return {
@@ -551,6 +555,7 @@ class TradingEngine:
         )
         self.db.add(trade)
         self.db.commit()
+        self._invalidate_portfolio_summary()
 
         logger.info(f"SELL executed: {quantity} {symbol} @ {currency}{price:.4f}, P&L {currency}{realized_pnl:.2f} via {broker_name}")
         return {
@@ -1121,8 +1126,28 @@ class TradingEngine:
                     pos.unrealized_pnl = (pos.current_price - pos.avg_cost) * pos.quantity
                 pos.last_updated = datetime.utcnow()
         self.db.commit()
+        self._invalidate_portfolio_summary()
+
+    # Back-to-back callers (dashboard refresh, /api/analyze + /api/chat, the
+    # digest loop) hit Alpaca / the positions table for identical numbers.
+    _portfolio_summary_cache: Dict[int, tuple] = {}  # user_id -> (summary, fetched_at_ts)
+    _PORTFOLIO_SUMMARY_TTL_SECONDS = 2
+
+    def _invalidate_portfolio_summary(self):
+        TradingEngine._portfolio_summary_cache.pop(self.user_id, None)
 
     def get_portfolio_summary(self) -> dict:
+        """Portfolio metrics aggregated across all brokers (memoized for 2s)."""
+        cached = TradingEngine._portfolio_summary_cache.get(self.user_id)
+        if cached:
+            summary, fetched_at = cached
+            if (datetime.utcnow() - fetched_at).total_seconds() < self._PORTFOLIO_SUMMARY_TTL_SECONDS:
+                return summary
+        summary = self._compute_portfolio_summary()
+        TradingEngine._portfolio_summary_cache[self.user_id] = (summary, datetime.utcnow())
+        return summary
+
+    def _compute_portfolio_summary(self) -> dict:
         """Calculate portfolio metrics aggregated across all brokers."""
 
         # ── Alpaca (US) ──────────────────────────────────────────────────────
@@ -470,6 +470,17 @@ function loadChartFor(symbol) {
     }
 }
 
+// API sends OHLCV history as columns {time: [...], open: [...], ...};
+// lightweight-charts wants one object per bar.
+function historyRows(cols) {
+    if (!cols?.time?.length) return [];
+    return cols.time.map((time, i) => ({
+        time,
+        open: cols.open[i], high: cols.high[i], low: cols.low[i],
+        close: cols.close[i], volume: cols.volume[i],
+    }));
+}
+
 async function loadChart() {
     const symbol = document.getElementById('chartSymbolInput').value.trim().toUpperCase();
     const period = document.getElementById('chartPeriod').value;
@@ -514,16 +525,17 @@ async function loadChart() {
             wickUpColor: '#3fb950', wickDownColor: '#f85149',
         });
 
-        if (data.history?.length) {
-            candleSeries.setData(data.history);
+        const history = historyRows(data.history);
+        if (history.length) {
+            candleSeries.setData(history);
             chart.timeScale().fitContent();
         }
 
         // Indicators overlay
         const inds = data.indicators;
-        if (inds?.ma20 && data.history?.length) {
+        if (inds?.ma20 && history.length) {
             const ma20Series = chart.addLineSeries({ color: 'rgba(56,139,253,0.7)', lineWidth: 1, title: 'MA20' });
-            const maData = data.history.slice(-data.history.length).map(d => ({ time: d.time, value: inds.ma20 }));
+            const maData = history.slice(-history.length).map(d => ({ time: d.time, value: inds.ma20 }));
             // Use rolling MA data if we have more -- simplified approach
         }
 